@@ -1,489 +1,452 @@
-import streamlit as st
-import math
-import pandas as pd
-
-# ==========================================
-# 0. FUNCIÓN DE LOCALIZACIÓN Y EXPORTACIÓN
-# ==========================================
-def formato_latam(valor, decimales=2):
-    if isinstance(valor, (int, float)):
-        if decimales == 0:
-            estandar = f"{int(valor):,}"
-            return estandar.replace(',', '.')
-        estandar = f"{valor:,.{decimales}f}"
-        return estandar.replace(',', 'X').replace('.', ',').replace('X', '.')
-    return valor
-
-def generar_texto_reporte(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares):
-    texto = "=" * 70 + "\n"
-    texto += "          REPORTE DE INGENIERIA - SISTEMA LEDSCREENCALC\n"
-    texto += "=" * 70 + "\n\n"
-    texto += f"[A] DISENO DE HARDWARE (MEDIDA SOLICITADA: {formato_latam(req_w/1000, 2)}m x {formato_latam(req_h/1000, 2)}m)\n\n"
-    texto += "  --- OPCION 1: AJUSTE IDEAL ---\n"
-    for k, v in res_hw["Opcion 1 (Ideal)"]["formatted"].items(): texto += f"    > {k}: {v}\n"
-    texto += "\n  --- OPCION 2: AJUSTE INFERIOR ---\n"
-    for k, v in res_hw["Opcion 2 (Inferior)"]["formatted"].items(): texto += f"    > {k}: {v}\n"
-    texto += "\n  --- OPCION 3: AJUSTE SUPERIOR ---\n"
-    for k, v in res_hw["Opcion 3 (Superior)"]["formatted"].items(): texto += f"    > {k}: {v}\n"
-    texto += "\n" + "-" * 50 + "\n[B] CRITERIOS DE VISUALIZACION\n"
-    for k, v in res_hw["Visualizacion"].items(): texto += f"  > {k}: {v}\n"
-    texto += "\n" + "-" * 50 + "\n[C] INGENIERIA DE PROCESAMIENTO Y DATA\n"
-    for k, v in calc_proc.calcular_procesamiento().items(): texto += f"  > {k}: {v}\n"
-    texto += "\n" + "-" * 50 + "\n[D] HARDWARE DEL PROCESADOR (TOPOLOGIA)\n"
-    for k, v in calc_proc.calcular_hardware_procesador().items(): texto += f"  > {k}: {v}\n"
-    texto += "\n" + "-" * 50 + "\n[E] INGENIERIA ELECTRICA Y CLIMATIZACION (Opcion 1)\n"
-    for k, v in calc_pwr.calcular_energia_y_clima().items(): texto += f"  > {k}: {v}\n"
-    texto += "\n" + "-" * 50 + "\n[F] INGENIERIA ESTRUCTURAL E IZAJE (Opcion 1)\n"
-    for k, v in calc_rig.calcular_izaje().items(): texto += f"  > {k}: {v}\n"
-    texto += "\n" + "-" * 50 + "\n[G] REPUESTOS SUGERIDOS (SPARE PARTS)\n"
-    for k, v in calc_spares.calcular_repuestos().items(): texto += f"  > {k}: {v}\n"
-    texto += "\n" + "=" * 70 + "\nFIN DEL REPORTE TECNICO.\n" + "=" * 70 + "\n"
-    return texto
-
-def recopilar_datos_tabulares(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares):
-    data = []
-    data.append(["MEDIDA SOLICITADA", f"{formato_latam(req_w/1000, 2)}m (Ancho) x {formato_latam(req_h/1000, 2)}m (Alto)"])
-    data.append(["", ""])
-    
-    opciones = [("OPCIÓN 1: AJUSTE IDEAL", "Opcion 1 (Ideal)"), 
-                ("OPCIÓN 2: AJUSTE INFERIOR", "Opcion 2 (Inferior)"), 
-                ("OPCIÓN 3: AJUSTE SUPERIOR", "Opcion 3 (Superior)")]
-                
-    for titulo, clave in opciones:
-        data.append([f"--- {titulo} ---", ""])
-        for k, v in res_hw[clave]["formatted"].items(): 
-            data.append([k, v])
-        data.append(["", ""])
-
-    data.append(["--- CRITERIOS DE VISUALIZACIÓN ---", ""])
-    for k, v in res_hw["Visualizacion"].items(): data.append([k, v])
-    data.append(["", ""])
-
-    data.append(["--- INGENIERÍA DE PROCESAMIENTO Y DATA ---", ""])
-    for k, v in calc_proc.calcular_procesamiento().items(): data.append([k, v])
-    data.append(["", ""])
-
-    data.append(["--- HARDWARE DEL PROCESADOR ---", ""])
-    for k, v in calc_proc.calcular_hardware_procesador().items(): data.append([k, v])
-    data.append(["", ""])
-
-    data.append(["--- INGENIERÍA ELÉCTRICA Y CLIMATIZACIÓN ---", ""])
-    for k, v in calc_pwr.calcular_energia_y_clima().items(): data.append([k, v])
-    data.append(["", ""])
-
-    data.append(["--- INGENIERÍA ESTRUCTURAL E IZAJE ---", ""])
-    for k, v in calc_rig.calcular_izaje().items(): data.append([k, v])
-    data.append(["", ""])
-
-    data.append(["--- REPUESTOS SUGERIDOS ---", ""])
-    for k, v in calc_spares.calcular_repuestos().items(): data.append([k, v])
-    
-    return data
-
-def generar_csv_reporte(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares):
-    data = recopilar_datos_tabulares(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares)
-    df = pd.DataFrame(data, columns=["Parámetro", "Especificación Técnica"])
-    return df.to_csv(index=False, sep=';', encoding='utf-8-sig')
-
-
-# ==========================================
-# 1. MÓDULOS DE CLASES (Core Lógico)
-# ==========================================
-class LedScreenProc:
-    def __init__(self, uso, total_px, total_gabinetes, input_res, puerto, calidad, fps_video=60, 
-                 distancia_cable_m=50, refresh_rate_hz=3840, shutter_speed_str="1/60",
-                 res_w=0, res_h=0, fis_w_mm=0, fis_h_mm=0, num_entradas=1):
-        self.uso = uso
-        self.total_px = total_px
-        self.total_gabinetes = total_gabinetes
-        self.input_res = input_res
-        self.puerto = puerto
-        self.calidad = calidad
-        self.fps = fps_video
-        self.distancia_cable_m = distancia_cable_m
-        self.refresh_rate_hz = refresh_rate_hz
-        self.shutter_speed_str = shutter_speed_str
-        self.res_w = res_w
-        self.res_h = res_h
-        self.fis_w_mm = int(fis_w_mm)
-        self.fis_h_mm = int(fis_h_mm)
-        self.num_entradas = num_entradas
-
-    def _parsear_shutter(self):
-        try:
-            if "/" in self.shutter_speed_str:
-                num, den = self.shutter_speed_str.split("/")
-                return float(num) / float(den)
-            else:
-                return 1.0 / float(self.shutter_speed_str)
-        except:
-            return 1.0 / 60.0 
-
-    def _calcular_ratio(self, w, h):
-        if w == 0 or h == 0: return "N/A"
-        divisor = math.gcd(int(w), int(h))
-        relacion = f"{int(w)//divisor}:{int(h)//divisor}"
-        decimal = w / h
-        return f"{relacion} ({formato_latam(decimal, 2)})"
-
-    def calcular_procesamiento(self):
-        capacidad_base_px = 650000 
-        if "10-bit" in self.calidad or "12-bit" in self.calidad or "HDR" in self.calidad:
-            capacidad_base_px = capacidad_base_px // 2 
-        if self.fps > 60:
-            capacidad_base_px = int(capacidad_base_px * (60.0 / self.fps))
-
-        self.puertos_rj45 = max(1, math.ceil(self.total_px / capacidad_base_px))
-        
-        infraestructura = f"{self.puertos_rj45} puertos RJ45 (Cat6)."
-        if self.distancia_cable_m > 100:
-            infraestructura += " [!] Distancia crítica: requiere salto a fibra óptica."
-
-        ratio_fisico = self._calcular_ratio(self.fis_w_mm, self.fis_h_mm)
-        ratio_logico = self._calcular_ratio(self.res_w, self.res_h)
-
-        shutter_segundos = self._parsear_shutter()
-        ciclos_por_exposicion = self.refresh_rate_hz * shutter_segundos
-        res_sync = f"Ciclos: {formato_latam(ciclos_por_exposicion, 1)} -> "
-        res_sync += "🟢 ÓPTIMO" if ciclos_por_exposicion >= 50 else ("🟠 ADVERTENCIA" if ciclos_por_exposicion >= 25 else "🔴 CRÍTICO")
-
-        return {
-            "Total Px Calculados": f"{formato_latam(self.total_px, 0)} px",
-            "Relación de Aspecto Física": ratio_fisico,
-            "Relación de Aspecto Lógica (Mapeo)": ratio_logico,
-            "Tasa de Refrescamiento": f"{formato_latam(self.refresh_rate_hz, 0)} Hz",
-            "Sincronización de Cámara": res_sync,
-            "Puertos RJ45 de Salida Req.": self.puertos_rj45,
-            "Tarjetas Receptoras (R-Cards)": f"{self.total_gabinetes} tarjetas (1 por gabinete)",
-            "Topología de Red": infraestructura
-        }
-
-    def calcular_hardware_procesador(self):
-        capacidad_max_4k = 8800000
-        equipos_4k_necesarios = max(1, math.ceil(self.total_px / capacidad_max_4k))
-        capacidad_total_instalada = equipos_4k_necesarios * capacidad_max_4k
-        
-        if "8K" in self.input_res:
-            base_cards = self.num_entradas * 4
-            tarjetas_entrada = f"{self.num_entradas}x señal(es) 8K -> Req. {base_cards}x Entradas 4K (Quad-Link) o {self.num_entradas}x Tarjetas HDMI 2.1"
-        elif "16K" in self.input_res:
-            base_cards = self.num_entradas * 16
-            tarjetas_entrada = f"{self.num_entradas}x señal(es) 16K -> Req. {base_cards}x Entradas 4K o {self.num_entradas * 4}x Tarjetas HDMI 2.1"
-        elif "4K" in self.input_res:
-            tarjetas_entrada = f"{self.num_entradas}x señal(es) 4K -> Req. {math.ceil(self.num_entradas/2)}x Tarjetas Dual-4K (o similar)"
-        else:
-            tarjetas_entrada = f"{self.num_entradas}x señal(es) HD -> Req. {math.ceil(self.num_entradas/4)}x Tarjetas Quad-HD"
-            
-        if not hasattr(self, 'puertos_rj45'):
-            self.calcular_procesamiento()
-            
-        tarjetas_salida = max(1, math.ceil(self.puertos_rj45 / 16))
-        opt_ports = math.ceil(self.puertos_rj45 / 10) 
-        if self.distancia_cable_m > 100:
-            interfaces_opt = f"SÍ: {opt_ports} puertos OPT 10G (Requiere {opt_ports} conversores CVT10 en pantalla)"
-        else:
-            interfaces_opt = "NO (Distancia segura < 100m)"
-
-        return {
-            "Formato y Calidad Base": f"{self.input_res} {self.calidad} @ {self.fps}fps",
-            "Capacidad Máx. de Carga (Salida)": f"{formato_latam(capacidad_total_instalada, 0)} px ({equipos_4k_necesarios} núcleo(s) de procesamiento)",
-            "Módulos de Entrada Req.": tarjetas_entrada,
-            "Módulos de Salida Req.": f"{tarjetas_salida} tarjeta(s) de salida (Modular 16-port)",
-            "Interfaces Ópticas (OPT)": interfaces_opt
-        }
-
-class LEDSCREENCALC:
-    def __init__(self, uso, entorno, contenido, dim_req_w, dim_req_h, dist_vis_m, pitch, 
-                 mod_res_w=None, mod_res_h=None, mod_w=None, mod_h=None, cab_w=None, cab_h=None, brillo=1000):
-        self.uso = uso
-        self.entorno = entorno
-        self.contenido = contenido
-        self.req_w = dim_req_w
-        self.req_h = dim_req_h
-        self.dist_vis_m = dist_vis_m
-        self.pitch = pitch
-        self.brillo = brillo
-        
-        self.datos_marca_suministrados = all(v is not None for v in [mod_res_w, mod_res_h, mod_w, mod_h, cab_w, cab_h])
-        
-        if self.datos_marca_suministrados:
-            self.cab_w = cab_w
-            self.cab_h = cab_h
-            self.mod_w = mod_w
-            self.mod_h = mod_h
-            self.mod_res_w = mod_res_w
-            self.mod_res_h = mod_res_h
-            self.modulos_por_cab_w = int(self.cab_w // mod_w)
-            self.modulos_por_cab_h = int(self.cab_h // mod_h)
-            self.total_modulos_por_cab = self.modulos_por_cab_w * self.modulos_por_cab_h
-            self.cab_res_w = int(mod_res_w * self.modulos_por_cab_w)
-            self.cab_res_h = int(mod_res_h * self.modulos_por_cab_h)
-        else:
-            if self.entorno == "Indoor":
-                self.cab_w, self.cab_h = 500.0, 500.0
-                self.modulos_por_cab_w = 2
-                self.modulos_por_cab_h = 2
-            else:
-                self.cab_w, self.cab_h = 960.0, 960.0
-                self.modulos_por_cab_w = 3
-                self.modulos_por_cab_h = 3
-                
-            self.mod_w = self.cab_w / self.modulos_por_cab_w
-            self.mod_h = self.cab_h / self.modulos_por_cab_h
-            self.cab_res_w = int(self.cab_w / self.pitch)
-            self.cab_res_h = int(self.cab_h / self.pitch)
-            self.mod_res_w = int(self.mod_w / self.pitch)
-            self.mod_res_h = int(self.mod_h / self.pitch)
-            self.total_modulos_por_cab = self.modulos_por_cab_w * self.modulos_por_cab_h
-
-    def _calcular_configuracion(self, columnas, filas):
-        total_gabinetes = int(columnas * filas)
-        total_modulos = int(total_gabinetes * self.total_modulos_por_cab)
-        ancho_fisico = columnas * self.cab_w
-        alto_fisico = filas * self.cab_h
-        res_total_w = int(columnas * self.cab_res_w)
-        res_total_h = int(filas * self.cab_res_h)
-        total_px = res_total_w * res_total_h
-        area_m2 = (ancho_fisico / 1000) * (alto_fisico / 1000)
-        
-        diag_mm = math.sqrt(ancho_fisico**2 + alto_fisico**2)
-        diag_in = diag_mm / 25.4
-        
-        formatted = {}
-        etiqueta_auto = "" if self.datos_marca_suministrados else " (Auto-Estándar)"
-
-        formatted["Resolución de módulos (px)"] = f"{formato_latam(self.mod_res_w, 0)} (W) x {formato_latam(self.mod_res_h, 0)} (H){etiqueta_auto}"
-        formatted["Tamaño de módulo (mm)"] = f"{formato_latam(self.mod_w, 2)} (W) x {formato_latam(self.mod_h, 2)} (H){etiqueta_auto}"
-        formatted["Tamaño del Gabinete (mm)"] = f"{formato_latam(self.cab_w, 2)} (W) x {formato_latam(self.cab_h, 2)} (H){etiqueta_auto}"
-        formatted["Módulos x Gabinete"] = f"{self.modulos_por_cab_w} (W) x {self.modulos_por_cab_h} (H) = {self.total_modulos_por_cab} mód.{etiqueta_auto}"
-
-        formatted["Gabinetes (Column x Filas)"] = f"{columnas} x {filas}"
-        formatted["Piezas"] = f"{total_gabinetes} gabinetes ({total_modulos} módulos)"
-        formatted["Resolución Total"] = f"{formato_latam(res_total_w, 0)} x {formato_latam(res_total_h, 0)} ({formato_latam(total_px, 0)} px)"
-        formatted["Dimensiones Finales"] = f"{formato_latam(ancho_fisico, 1)} x {formato_latam(alto_fisico, 1)} mm"
-        formatted["Diagonal de Pantalla"] = f"{formato_latam(diag_in, 2)}\" Pulgadas ({formato_latam(diag_mm, 2)} mm)"
-        formatted["Tamaño en m²"] = f"{formato_latam(area_m2, 2)} m²"
-        formatted["Brillo Objetivo"] = f"{formato_latam(self.brillo, 0)} Nits (cd/m²)"
-
-        return {
-            "raw": {"columnas": columnas, "filas": filas, "area_m2": area_m2, "total_px": total_px, 
-                    "cab_w": self.cab_w, "total_gabinetes": total_gabinetes, "total_modulos": total_modulos,
-                    "res_total_w": res_total_w, "res_total_h": res_total_h, 
-                    "ancho_fisico": ancho_fisico, "alto_fisico": alto_fisico},
-            "formatted": formatted
-        }
-
-    def generar_opciones(self):
-        col_exact = self.req_w / self.cab_w
-        fil_exact = self.req_h / self.cab_h
-        
-        opt_a = self._calcular_configuracion(max(1, round(col_exact)), max(1, round(fil_exact)))
-        opt_b = self._calcular_configuracion(max(1, math.floor(col_exact)), max(1, math.floor(fil_exact)))
-        opt_c = self._calcular_configuracion(max(1, math.ceil(col_exact)), max(1, math.ceil(fil_exact)))
-        
-        vis_min_m = self.pitch * 1
-        vis_opt_m = self.pitch * 3
-        agudeza_pies = self.pitch * 10
-        
-        return {"Opcion 1 (Ideal)": opt_a, "Opcion 2 (Inferior)": opt_b, "Opcion 3 (Superior)": opt_c, 
-                "Visualizacion": {"Mínima": f"{formato_latam(vis_min_m, 2)} m", "Óptima": f"{formato_latam(vis_opt_m, 2)} m", "Retina (Agudeza)": f"{formato_latam(agudeza_pies, 2)} ft"}}
-
-class LedPowerCalc:
-    def __init__(self, area_m2, voltaje=220, entorno="Indoor"):
-        self.area = area_m2
-        self.voltaje = voltaje
-        self.watts_max_m2 = 800 if entorno == "Outdoor" else 500
-
-    def calcular_energia_y_clima(self):
-        pot_max_w = self.area * self.watts_max_m2
-        pot_prom_w = pot_max_w * 0.34 
-        amp_total = pot_max_w / self.voltaje
-        amp_fase = amp_total / 3
-        btu_max_hr = pot_max_w * 3.412
-        return {
-            "Potencia Máxima": f"{formato_latam(pot_max_w / 1000, 2)} kW",
-            "Potencia Promedio": f"{formato_latam(pot_prom_w / 1000, 2)} kW",
-            f"Amperaje Total ({self.voltaje}V)": f"{formato_latam(amp_total, 2)} A",
-            "Amperaje por Fase (3F)": f"{formato_latam(amp_fase, 2)} A / fase",
-            "Carga Térmica (Max)": f"{formato_latam(btu_max_hr, 2)} BTU/hr",
-            "HVAC Requerido": f"{formato_latam(btu_max_hr / 12000, 2)} Toneladas AC"
-        }
-
-class LedRiggingCalc:
-    def __init__(self, columnas, filas, cab_w_mm, cab_peso_kg=11.0, factor_seguridad=8):
-        self.columnas = columnas
-        self.filas = filas
-        self.cab_peso_kg = cab_peso_kg
-        self.cab_w_m = cab_w_mm / 1000.0
-        self.factor_seguridad = factor_seguridad
-
-    def calcular_izaje(self):
-        peso_pura = self.columnas * self.filas * self.cab_peso_kg
-        peso_bumpers = self.columnas * 3.5 
-        peso_cableado = peso_pura * 0.10
-        carga_estatica = peso_pura + peso_bumpers + peso_cableado
-        truss_m = math.ceil((self.columnas * self.cab_w_m) + 1.0)
-        puntos_colgado = max(2, math.ceil(truss_m / 3.0) + 1)
-        carga_por_punto = carga_estatica / puntos_colgado
-        motor_sel = next((m for m in [250, 500, 1000, 2000] if m >= (carga_por_punto * self.factor_seguridad)), "Ing. Estructural Req.")
-
-        return {
-            "Carga Estática TOTAL (Dead Load)": f"{formato_latam(carga_estatica, 2)} kg",
-            "Truss Sugerido (Min)": f"{formato_latam(truss_m, 2)} m",
-            "Puntos de Motor": f"{puntos_colgado} puntos (Max 3m)",
-            f"Capacidad Motor Req. (SF {self.factor_seguridad}:1)": f"{formato_latam(motor_sel, 0)} kg (WLL) / motor"
-        }
-
-class LedSparesCalc:
-    def __init__(self, total_modulos, total_gabinetes, porcentaje):
-        self.total_modulos = total_modulos
-        self.total_gabinetes = total_gabinetes
-        self.porcentaje = porcentaje / 100.0
-
-    def calcular_repuestos(self):
-        rep_modulos = math.ceil(self.total_modulos * self.porcentaje)
-        rep_rcards = math.ceil(self.total_gabinetes * self.porcentaje)
-        rep_psu = math.ceil(self.total_gabinetes * self.porcentaje)
-        
-        pct_display = int(self.porcentaje * 100) if (self.porcentaje * 100).is_integer() else self.porcentaje * 100
-
-        return {
-            "Porcentaje Seleccionado": f"{pct_display}% de las piezas",
-            "Módulos LED": f"{rep_modulos} und.",
-            "Tarjetas Receptoras (R-Cards)": f"{rep_rcards} und.",
-            "Fuentes de Poder (PSU)": f"{rep_psu} und."
-        }
-
-# ==========================================
-# 2. INTERFAZ GRÁFICA (Streamlit UI)
-# ==========================================
-st.set_page_config(page_title="LEDSCREENCALC | Broadcast Edition", layout="wide", page_icon="🖥️")
-
-col_title, col_btn_txt, col_btn_csv = st.columns([2.5, 1, 1])
-with col_title:
-    st.title("🖥️ LEDSCREENCALC")
-    st.markdown("### Simulador de Ingeniería para Pantallas LED (Broadcast & Live Events)")
-
-st.divider()
-
-# --- BARRA LATERAL (INPUTS) ---
-with st.sidebar:
-    st.header("⚙️ Parámetros del Proyecto")
-    uso = st.selectbox("Uso", ["Cine", "TV", "Publicidad"])
-    entorno = st.radio("Entorno", ["Indoor", "Outdoor"], horizontal=True)
-    
-    st.subheader("Medida Solicitada")
-    col1, col2 = st.columns(2)
-    with col1:
-        req_w = st.number_input("Ancho (mm)", min_value=100.0, value=10000.0, step=100.0, format="%.1f")
-    with col2:
-        req_h = st.number_input("Alto (mm)", min_value=100.0, value=5000.0, step=100.0, format="%.1f")
-    
-    st.divider()
-    st.header("🛠️ Configuración de Hardware")
-    
-    valor_brillo_defecto = 1000 if entorno == "Indoor" else 5000
-    brillo_nits = st.number_input("Brillo Objetivo (Nits)", min_value=100, value=valor_brillo_defecto, step=100)
-
-    ingreso_manual = st.toggle("Ingresar Marca/Modelo Manual")
-    
-    mod_res_w = mod_res_h = mod_w = mod_h = cab_w = cab_h = None
-    if ingreso_manual:
-        pitch = st.number_input("Pixel Pitch (mm)", value=2.6, step=0.1, format="%.2f")
-        st.markdown("**Tamaño Físico (mm)**")
-        c_mw, c_mh = st.columns(2)
-        with c_mw:
-            mod_w = st.number_input("Módulo Ancho", value=250.0, step=10.0, format="%.1f")
-            cab_w = st.number_input("Gab. Ancho", value=500.0, step=10.0, format="%.1f")
-        with c_mh:
-            mod_h = st.number_input("Módulo Alto", value=250.0, step=10.0, format="%.1f")
-            cab_h = st.number_input("Gab. Alto", value=500.0, step=10.0, format="%.1f")
-            
-        st.markdown("**Resolución Módulo (px)**")
-        c_rw, c_rh = st.columns(2)
-        with c_rw:
-            mod_res_w = st.number_input("Res. Ancho", value=104, step=1)
-        with c_rh:
-            mod_res_h = st.number_input("Res. Alto", value=104, step=1)
-    else:
-        pitch = st.number_input("Pixel Pitch estimado (mm)", value=2.6, step=0.1, format="%.2f")
-
-    st.divider()
-    st.header("🎛️ Procesamiento de Video")
-    num_entradas = st.number_input("Cantidad de Entradas (Fuentes)", min_value=1, value=1, step=1)
-    input_video = st.selectbox("Resolución de Entrada", ["HD (1080p)", "4K", "8K", "16K"], index=1)
-    puerto_video = st.selectbox("Puerto de Conexión", ["HDMI 1.4", "HDMI 2.0", "HDMI 2.1", "DP 1.2", "DP 1.4", "12G-SDI"], index=1)
-    calidad_video = st.selectbox("Profundidad de Color", ["SDR 8-bit", "HDR 10-bit", "HDR 12-bit"], index=1)
-    dist_cable = st.number_input("Distancia a Control (m)", min_value=1.0, value=50.0, step=10.0, format="%.1f")
-
-    hz_led = 3840.0
-    shutter_cam = "1/60"
-    if uso in ["Cine", "TV"]:
-        st.divider()
-        st.header("🎥 Setup de Cámara (Broadcast)")
-        hz_led = st.selectbox("Refresco Pantalla (Hz)", [1920.0, 3840.0, 7680.0], index=1)
-        shutter_cam = st.text_input("Shutter de Cámara", value="1/60")
-
-    st.divider()
-    st.header("🧰 Repuestos (Spare Parts)")
-    # El índice 2 corresponde a 10.0%
-    porcentaje_rep = st.selectbox("Porcentaje Sugerido", [2.5, 5.0, 10.0], index=2, format_func=lambda x: f"{x}%")
-
-# --- PROCESAMIENTO (LLAMADA A CLASES) ---
-calc_hw = LEDSCREENCALC(uso, entorno, "Video", req_w, req_h, 10, pitch, mod_res_w, mod_res_h, mod_w, mod_h, cab_w, cab_h, brillo=brillo_nits)
-res_hw = calc_hw.generar_opciones()
-base_raw = res_hw["Opcion 1 (Ideal)"]["raw"]
-
-calc_proc = LedScreenProc(uso, base_raw["total_px"], base_raw["total_gabinetes"], input_video, puerto_video, calidad_video, 
-                          distancia_cable_m=dist_cable, refresh_rate_hz=hz_led, shutter_speed_str=shutter_cam,
-                          res_w=base_raw["res_total_w"], res_h=base_raw["res_total_h"],
-                          fis_w_mm=base_raw["ancho_fisico"], fis_h_mm=base_raw["alto_fisico"], num_entradas=num_entradas)
-                          
-calc_pwr = LedPowerCalc(base_raw["area_m2"], voltaje=220, entorno=entorno)
-calc_rig = LedRiggingCalc(base_raw["columnas"], base_raw["filas"], base_raw["cab_w"])
-calc_spares = LedSparesCalc(base_raw["total_modulos"], base_raw["total_gabinetes"], porcentaje_rep)
-
-# --- BOTONES DE DESCARGA ---
-with col_btn_txt:
-    reporte_txt = generar_texto_reporte(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares)
-    st.download_button(label="📄 TXT Plano", data=reporte_txt, file_name="Reporte_LED.txt", mime="text/plain", use_container_width=True)
-
-with col_btn_csv:
-    reporte_csv = generar_csv_reporte(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares)
-    st.download_button(label="📝 CSV (LatAm Excel)", data=reporte_csv, file_name="Reporte_Ingenieria_LED.csv", mime="text/csv", use_container_width=True)
-
-# --- VISTA PRINCIPAL (RESULTADOS) ---
-st.markdown(f"#### Medida Solicitada: **{formato_latam(req_w/1000, 2)} m (Ancho) x {formato_latam(req_h/1000, 2)} m (Alto)**")
-
-tab1, tab2, tab3 = st.tabs(["⭐ Opción 1 (Ajuste Ideal)", "⬇️ Opción 2 (Ajuste Inferior)", "⬆️ Opción 3 (Ajuste Superior)"])
-
-def render_dict(d):
-    for k, v in d.items(): 
-        st.markdown(f"**{k}:** {v}")
-
-with tab1: 
-    render_dict(res_hw["Opcion 1 (Ideal)"]["formatted"])
-with tab2: 
-    render_dict(res_hw["Opcion 2 (Inferior)"]["formatted"])
-with tab3: 
-    render_dict(res_hw["Opcion 3 (Superior)"]["formatted"])
-
-st.divider()
-
-colA, colB = st.columns(2)
-
-with colA:
-    with st.expander("👁️ CRITERIOS DE VISUALIZACIÓN", expanded=True): 
-        render_dict(res_hw["Visualizacion"])
-    with st.expander("🔌 INGENIERÍA ELÉCTRICA Y CLIMA (220V)", expanded=True): 
-        render_dict(calc_pwr.calcular_energia_y_clima())
-    with st.expander("🧰 REPUESTOS SUGERIDOS (SPARE PARTS)", expanded=True): 
-        render_dict(calc_spares.calcular_repuestos())
-
-with colB:
-    with st.expander("📡 DATA Y SEÑAL", expanded=True): 
-        render_dict(calc_proc.calcular_procesamiento())
-    with st.expander("🎛️ HARDWARE DEL PROCESADOR", expanded=True): 
-        render_dict(calc_proc.calcular_hardware_procesador())
-    with st.expander("🏗️ INGENIERÍA ESTRUCTURAL E IZAJE (DGUV-17)", expanded=True): 
-        render_dict(calc_rig.calcular_izaje())
+import streamlit as st
+
+from ledscreencalc.formato import formato_latam
+from ledscreencalc.grafo import GrafoCalculo
+from ledscreencalc.perfil import Perfilador
+from ledscreencalc.proyecto import calculadora_hardware, clave_spec
+
+# Perfilado por etapas (panel DEPURACIÓN al final de la barra lateral): se
+# activa antes de calcular para medir esta corrida completa. Un Perfilador por
+# sesión, así apagarlo o reiniciarlo acá no toca el perfil de otra sesión.
+if "perfil" not in st.session_state:
+    st.session_state.perfil = Perfilador()
+perfil = st.session_state.perfil
+if st.session_state.get("perfil_etapas"):
+    perfil.activar(asignaciones=st.session_state.get("perfil_asignaciones", False))
+    perfil.reiniciar()
+else:
+    perfil.desactivar()
+
+# ==========================================
+# INTERFAZ GRÁFICA (Streamlit UI)
+# ==========================================
+st.set_page_config(page_title="LEDSCREENCALC | Broadcast Edition", layout="wide", page_icon="🖥️")
+
+col_title, col_btn_txt, col_btn_csv, col_btn_xlsx, col_btn_json = st.columns([2.5, 1, 1, 1, 1])
+with col_title:
+    st.title("🖥️ LEDSCREENCALC")
+    st.markdown("### Simulador de Ingeniería para Pantallas LED (Broadcast & Live Events)")
+
+st.divider()
+
+# --- BARRA LATERAL (INPUTS) ---
+with st.sidebar:
+    st.header("⚙️ Parámetros del Proyecto")
+    uso = st.selectbox("Uso", ["Cine", "TV", "Publicidad"])
+    entorno = st.radio("Entorno", ["Indoor", "Outdoor"], horizontal=True)
+    
+    st.subheader("Medida Solicitada")
+    col1, col2 = st.columns(2)
+    with col1:
+        req_w = st.number_input("Ancho (mm)", min_value=100.0, value=10000.0, step=100.0, format="%.1f")
+    with col2:
+        req_h = st.number_input("Alto (mm)", min_value=100.0, value=5000.0, step=100.0, format="%.1f")
+    
+    st.divider()
+    st.header("🛠️ Configuración de Hardware")
+    
+    valor_brillo_defecto = 1000 if entorno == "Indoor" else 5000
+    brillo_nits = st.number_input("Brillo Objetivo (Nits)", min_value=100, value=valor_brillo_defecto, step=100)
+
+    ingreso_manual = st.toggle("Ingresar Marca/Modelo Manual")
+    
+    mod_res_w = mod_res_h = mod_w = mod_h = cab_w = cab_h = None
+    if ingreso_manual:
+        pitch = st.number_input("Pixel Pitch (mm)", value=2.6, step=0.1, format="%.2f")
+        st.markdown("**Tamaño Físico (mm)**")
+        c_mw, c_mh = st.columns(2)
+        with c_mw:
+            mod_w = st.number_input("Módulo Ancho", value=250.0, step=10.0, format="%.1f")
+            cab_w = st.number_input("Gab. Ancho", value=500.0, step=10.0, format="%.1f")
+        with c_mh:
+            mod_h = st.number_input("Módulo Alto", value=250.0, step=10.0, format="%.1f")
+            cab_h = st.number_input("Gab. Alto", value=500.0, step=10.0, format="%.1f")
+            
+        st.markdown("**Resolución Módulo (px)**")
+        c_rw, c_rh = st.columns(2)
+        with c_rw:
+            mod_res_w = st.number_input("Res. Ancho", value=104, step=1)
+        with c_rh:
+            mod_res_h = st.number_input("Res. Alto", value=104, step=1)
+    else:
+        pitch = st.number_input("Pixel Pitch estimado (mm)", value=2.6, step=0.1, format="%.2f")
+
+    st.divider()
+    st.header("🎛️ Procesamiento de Video")
+    num_entradas = st.number_input("Cantidad de Entradas (Fuentes)", min_value=1, value=1, step=1)
+    input_video = st.selectbox("Resolución de Entrada", ["HD (1080p)", "4K", "8K", "16K"], index=1)
+    puerto_video = st.selectbox("Puerto de Conexión", ["HDMI 1.4", "HDMI 2.0", "HDMI 2.1", "DP 1.2", "DP 1.4", "12G-SDI"], index=1)
+    calidad_video = st.selectbox("Profundidad de Color", ["SDR 8-bit", "HDR 10-bit", "HDR 12-bit"], index=1)
+    dist_cable = st.number_input("Distancia a Control (m)", min_value=1.0, value=50.0, step=10.0, format="%.1f")
+
+    # El setup de cámara vive en el panel DATA Y SEÑAL (fragmento): cambiarlo sólo
+    # recalcula la sincronización, no toda la página.
+    hz_led = 3840.0
+    shutter_cam = "1/60"
+    if uso in ["Cine", "TV"]:
+        hz_led = st.session_state.get("hz_led", hz_led)
+        shutter_cam = st.session_state.get("shutter_cam", shutter_cam)
+
+    st.divider()
+    st.header("🧰 Repuestos (Spare Parts)")
+    modo_rep = st.radio("Criterio", ["porcentaje", "confiabilidad"], horizontal=True,
+                        format_func=lambda m: "Porcentaje Fijo" if m == "porcentaje" else "Confiabilidad (MTBF)")
+    # El índice 2 corresponde a 10.0%
+    porcentaje_rep = st.selectbox("Porcentaje Sugerido", [2.5, 5.0, 10.0], index=2, format_func=lambda x: f"{x}%",
+                                  disabled=modo_rep != "porcentaje")
+    dias_show, disponibilidad_rep = 3, 0.95
+    if modo_rep == "confiabilidad":
+        dias_show = st.number_input("Días de Show", min_value=1, value=3, step=1)
+        disponibilidad_rep = st.selectbox("Disponibilidad Objetivo", [0.90, 0.95, 0.99, 0.999], index=1,
+                                          format_func=lambda d: f"{d * 100:g}%")
+
+# --- PROCESAMIENTO (LLAMADA A CLASES) ---
+spec = {
+    "uso": uso, "entorno": entorno, "req_w": req_w, "req_h": req_h, "pitch": pitch, "brillo": brillo_nits,
+    "mod_res_w": mod_res_w, "mod_res_h": mod_res_h, "mod_w": mod_w, "mod_h": mod_h, "cab_w": cab_w, "cab_h": cab_h,
+    "num_entradas": num_entradas, "input_res": input_video, "puerto": puerto_video, "calidad": calidad_video,
+    "distancia_cable_m": dist_cable, "refresh_rate_hz": hz_led, "shutter_speed_str": shutter_cam,
+    "porcentaje_repuestos": porcentaje_rep,
+    "modo_repuestos": modo_rep, "disponibilidad_repuestos": disponibilidad_rep, "dias_show": dias_show,
+    # Factor promedio medido sobre el contenido (panel POTENCIA SEGÚN CONTENIDO)
+    "factor_promedio": st.session_state.get("factor_contenido") if st.session_state.get("aplicar_factor_contenido") else None,
+}
+# Grafo por sesión: sólo se recalculan los nodos cuyas entradas cambiaron.
+# Los reportes se generan al descargar, a partir del último resultado.
+if "grafo" not in st.session_state:
+    st.session_state.grafo = GrafoCalculo()
+grafo = st.session_state.grafo
+resultado = grafo.actualizar(spec)
+secciones = resultado.formatted
+
+# --- BOTONES DE DESCARGA ---
+with col_btn_txt:
+    st.download_button(label="📄 TXT Plano", data=lambda: grafo.resultado.reporte_txt(), file_name="Reporte_LED.txt", mime="text/plain", use_container_width=True)
+
+with col_btn_csv:
+    st.download_button(label="📝 CSV (LatAm Excel)", data=lambda: grafo.resultado.reporte_csv(), file_name="Reporte_Ingenieria_LED.csv", mime="text/csv", use_container_width=True)
+
+with col_btn_xlsx:
+    st.download_button(label="📗 XLSX", data=lambda: grafo.resultado.reporte_xlsx(), file_name="Reporte_Ingenieria_LED.xlsx",
+                       mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+
+with col_btn_json:
+    st.download_button(label="🧾 JSON (Crudo)", data=lambda: grafo.resultado.reporte_json(), file_name="Resultado_LED.json", mime="application/json", use_container_width=True)
+
+# --- VISTA PRINCIPAL (RESULTADOS) ---
+st.markdown(f"#### Medida Solicitada: **{formato_latam(req_w/1000, 2)} m (Ancho) x {formato_latam(req_h/1000, 2)} m (Alto)**")
+
+tab1, tab2, tab3 = st.tabs(["⭐ Opción 1 (Ajuste Ideal)", "⬇️ Opción 2 (Ajuste Inferior)", "⬆️ Opción 3 (Ajuste Superior)"])
+
+def render_dict(d):
+    for k, v in d.items(): 
+        st.markdown(f"**{k}:** {v}")
+render_dict = perfil.envolver("app.render_dict", render_dict)
+
+@st.fragment
+def panel_data_y_senal(spec_base):
+    # Un rerun del fragmento no pasa por el comienzo del script: se vuelve a
+    # asociar el perfil de la sesión a esta corrida
+    if perfil.activo:
+        perfil.activar(perfil.asignaciones)
+    spec_panel = spec_base
+    if spec_base["uso"] in ["Cine", "TV"]:
+        st.markdown("##### 🎥 Setup de Cámara (Broadcast)")
+        c_hz, c_sh = st.columns(2)
+        with c_hz:
+            hz = st.selectbox("Refresco Pantalla (Hz)", [1920.0, 3840.0, 7680.0], index=1, key="hz_led")
+        with c_sh:
+            shutter = st.text_input("Shutter de Cámara", value="1/60", key="shutter_cam")
+        spec_panel = dict(spec_base, refresh_rate_hz=hz, shutter_speed_str=shutter)
+    render_dict(grafo.actualizar(spec_panel).formatted["procesamiento"])
+    if spec_base["uso"] in ["Cine", "TV"] and st.toggle("Mapa de Sincronización (Refresco x Shutter)", key="mapa_sync"):
+        from ledscreencalc.camara import ESCANEOS, FPS_CAMARA, REFRESCOS_HZ, SHUTTERS, celdas_mapa, mapa_sincronizacion
+
+        c_fps, c_scan = st.columns(2)
+        with c_fps:
+            fps_cam = st.selectbox("FPS de Cámara", FPS_CAMARA, index=FPS_CAMARA.index(60.0), key="fps_camara")
+        with c_scan:
+            escaneo = st.selectbox("Escaneo del LED", ESCANEOS, index=ESCANEOS.index(8), format_func=lambda n: f"1/{n}", key="escaneo_led")
+        refrescos = sorted(set(REFRESCOS_HZ) | {hz})
+        shutters = list(SHUTTERS) + ([shutter] if shutter not in SHUTTERS else [])
+        try:
+            celdas = celdas_mapa(mapa_sincronizacion(refrescos, shutters, fps_cam, escaneo))
+        except ValueError as e:
+            st.warning(str(e))
+        else:
+            st.vega_lite_chart({
+                "data": {"values": celdas},
+                "mark": "rect",
+                "encoding": {
+                    "x": {"field": "shutter", "type": "ordinal", "sort": shutters, "title": "Shutter"},
+                    "y": {"field": "refresco_hz", "type": "ordinal", "sort": "descending", "title": "Refresco (Hz)"},
+                    "color": {"field": "riesgo", "type": "nominal", "title": "Riesgo",
+                              "scale": {"domain": ["🟢 SEGURO", "🟠 ADVERTENCIA", "🔴 CRÍTICO"], "range": ["#2e7d32", "#f9a825", "#c62828"]}},
+                    "tooltip": [{"field": "refresco_hz", "title": "Refresco (Hz)"}, {"field": "shutter", "title": "Shutter"},
+                                {"field": "ciclos", "title": "Ciclos", "format": ".1f"},
+                                {"field": "modulacion_pct", "title": "Modulación (%)", "format": ".2f"},
+                                {"field": "batido_hz", "title": "Batido (Hz)", "format": ".2f"}],
+                },
+            }, use_container_width=True)
+            st.caption("Modulación: pérdida de brillo entre la fila mejor y peor expuesta. "
+                       "Batido: velocidad a la que ruedan las bandas (0 = quietas).")
+
+with tab1: 
+    render_dict(secciones["opciones"]["Opcion 1 (Ideal)"])
+with tab2: 
+    render_dict(secciones["opciones"]["Opcion 2 (Inferior)"])
+with tab3: 
+    render_dict(secciones["opciones"]["Opcion 3 (Superior)"])
+
+with st.expander("🧩 MOSAICO MIXTO DE GABINETES (Frente de Pareto)"):
+    from ledscreencalc.mosaico import familia_estandar, resolver_mosaico
+
+    tipos_mosaico = familia_estandar(calculadora_hardware(spec))
+    st.caption("Combina " + ", ".join(t["nombre"] for t in tipos_mosaico) + " mm para acercarse a la medida solicitada.")
+    st.table([{
+        "Columnas": " + ".join(f"{n}x{formato_latam(w, 0)}" for w, n in sol["columnas"].items()),
+        "Filas": " + ".join(f"{n}x{formato_latam(h, 0)}" for h, n in sol["filas"].items()),
+        "Dimensiones (mm)": f"{formato_latam(sol['ancho_fisico'], 1)} x {formato_latam(sol['alto_fisico'], 1)}",
+        "Error": f"{formato_latam(sol['error_rel'] * 100, 2)} %",
+        "Gabinetes": formato_latam(sol["total_gabinetes"], 0),
+        "Resolución": f"{formato_latam(sol['res_total_w'], 0)} x {formato_latam(sol['res_total_h'], 0)}",
+    } for sol in resolver_mosaico(req_w, req_h, tipos_mosaico, max_soluciones=10)])
+
+with st.expander("🔀 MAPEO DE PUERTOS Y CABLEADO (Serpentina)"):
+    from ledscreencalc.mapeo import mapa_desde_resultado
+
+    try:
+        mapa = mapa_desde_resultado(resultado)
+    except ValueError as e:
+        st.warning(str(e))
+    else:
+        v_mapa = mapa.valores()
+        render_dict({
+            "Recorrido": f"{v_mapa['recorrido'].capitalize()} desde esquina {v_mapa['esquina']}",
+            "Puertos Mapeados": f"{v_mapa['puertos']} puertos x hasta {v_mapa['gabinetes_por_puerto']} gabinetes",
+            "Carga Máx. por Puerto": f"{formato_latam(v_mapa['carga_max_puerto_px'], 0)} / {formato_latam(v_mapa['capacidad_puerto_px'], 0)} px",
+            "Cable de Datos en Pantalla": f"{formato_latam(v_mapa['cable_total_m'], 1)} m ({formato_latam(v_mapa['cable_saltos_m'], 1)} m saltos + {formato_latam(v_mapa['cable_tendidos_m'], 1)} m tendidos)",
+        })
+        if mapa.puerto.size <= 2500:
+            st.dataframe(mapa.puerto, use_container_width=True)
+        st.download_button(label="🗺️ Mapa de Puertos (CSV)", data=mapa.reporte_csv, file_name="Mapa_Puertos_LED.csv", mime="text/csv")
+
+with st.expander("🏟️ PLANIFICADOR DE RECINTO (Procesadores Compartidos)"):
+    from ledscreencalc.recinto import planificar_recinto
+
+    st.caption("Agregue las superficies del recinto; los campos no listados se toman del proyecto actual.")
+    pantallas = st.data_editor([
+        {"nombre": "Pantalla Principal", "req_w": req_w, "req_h": req_h, "pitch": pitch, "input_res": input_video,
+         "num_entradas": num_entradas, "distancia_cable_m": dist_cable},
+    ], num_rows="dynamic", use_container_width=True, key="pantallas_recinto")
+    try:
+        plan = planificar_recinto([dict(spec, **{k: v for k, v in p.items() if v is not None}) for p in pantallas])
+    except (ValueError, TypeError) as e:
+        st.warning(str(e))
+    else:
+        f = plan["factura"]
+        render_dict({
+            "Núcleos de Procesamiento": f"{f['nucleos']} (por separado: {plan['sin_compartir']['nucleos']})",
+            "Tarjetas de Salida (16-port)": f"{f['tarjetas_salida']} (por separado: {plan['sin_compartir']['tarjetas_salida']})",
+            "Tarjetas de Entrada": ", ".join(f"{n}x {t}" for t, n in f["tarjetas_entrada"].items()),
+            "Puertos OPT 10G": f["puertos_opt"],
+        })
+        st.table([{
+            "Núcleo": a["nucleo"],
+            "Pantallas": ", ".join(p["nombre"] for p in a["pantallas"]),
+            "Carga (px)": formato_latam(a["px"], 0),
+            "Puertos RJ45": a["puertos_rj45"],
+            "Puertos OPT": a["puertos_opt"],
+        } for a in plan["asignacion"]])
+
+st.divider()
+
+colA, colB = st.columns(2)
+
+with colA:
+    with st.expander("👁️ CRITERIOS DE VISUALIZACIÓN", expanded=True): 
+        render_dict(secciones["opciones"]["Visualizacion"])
+    with st.expander("🔌 INGENIERÍA ELÉCTRICA Y CLIMA (220V)", expanded=True): 
+        render_dict(secciones["energia"])
+    with st.expander("⚡ DISTRIBUCIÓN DE CIRCUITOS Y FASES"):
+        from ledscreencalc.distribucion import distribucion_desde_resultado
+
+        breaker = st.radio("Breaker por Circuito", [16, 32], horizontal=True, format_func=lambda a: f"{a} A")
+        try:
+            plan_distro = distribucion_desde_resultado(resultado, breaker_a=breaker)
+        except ValueError as e:
+            st.warning(str(e))
+        else:
+            v_distro = plan_distro.valores()
+            render_dict({
+                "Circuitos": f"{v_distro['circuitos']} x {v_distro['breaker_a']} A ({v_distro['distros']} distro(s) de 6 circuitos)",
+                "Circuitos por Fase (L1/L2/L3)": " / ".join(str(n) for n in v_distro["circuitos_por_fase"]),
+                "Corriente por Fase (L1/L2/L3)": " / ".join(f"{formato_latam(a, 2)} A" for a in v_distro["corriente_fase_a"]),
+                "Desbalance de Fases": f"{formato_latam(v_distro['desbalance_pct'], 2)} % (neutro: {formato_latam(v_distro['corriente_neutro_a'], 2)} A)",
+                "Carga Máx. por Circuito": f"{formato_latam(v_distro['carga_max_circuito_w'], 0)} W ({formato_latam(v_distro['uso_max_circuito'] * 100, 1)} % del breaker)",
+            })
+            st.download_button(label="⚡ Plan de Circuitos (CSV)", data=plan_distro.reporte_csv, file_name="Plan_Circuitos_LED.csv", mime="text/csv")
+    with st.expander("🎞️ POTENCIA SEGÚN CONTENIDO (Análisis de Video)"):
+        from ledscreencalc.contenido import analizar_para_resultado
+
+        archivo_video = st.file_uploader("Contenido (Y4M o RGB24 crudo)", type=["y4m", "rgb", "raw"])
+        c_aw, c_ah = st.columns(2)
+        with c_aw:
+            ancho_rgb = st.number_input("Ancho RGB crudo (px)", min_value=1, value=1920, step=1)
+        with c_ah:
+            alto_rgb = st.number_input("Alto RGB crudo (px)", min_value=1, value=1080, step=1)
+        if archivo_video is not None:
+            clave_analisis = (archivo_video.file_id, ancho_rgb, alto_rgb, resultado.raw["energia"]["pot_max_w"])
+            if st.session_state.get("analisis_contenido", (None,))[0] != clave_analisis:
+                try:
+                    st.session_state.analisis_contenido = (clave_analisis, analizar_para_resultado(archivo_video, resultado, ancho=ancho_rgb, alto=alto_rgb))
+                except ValueError as e:
+                    st.session_state.analisis_contenido = (clave_analisis, None)
+                    st.warning(str(e))
+            analisis = st.session_state.analisis_contenido[1]
+            if analisis is not None:
+                st.session_state.factor_contenido = round(analisis["factor_promedio"], 4)
+                render_dict({
+                    "Cuadros Analizados": f"{formato_latam(analisis['cuadros'], 0)} ({formato_latam(analisis['duracion_s'], 1)} s)",
+                    "Potencia Pico (Contenido)": f"{formato_latam(analisis['pot_pico_w'] / 1000, 2)} kW",
+                    "Potencia P95": f"{formato_latam(analisis['pot_p95_w'] / 1000, 2)} kW",
+                    "Potencia Promedio (Contenido)": f"{formato_latam(analisis['pot_prom_w'] / 1000, 2)} kW",
+                    "Carga Térmica Promedio": f"{formato_latam(analisis['btu_prom_hr'], 2)} BTU/hr",
+                    "Factor Promedio Medido": f"{formato_latam(analisis['factor_promedio'] * 100, 1)} % (supuesto genérico: 34 %)",
+                })
+                paso = max(1, analisis["cuadros"] // 2000)
+                st.line_chart({"Potencia (kW)": (analisis["pot_w"][::paso] / 1000).tolist()})
+                st.checkbox("Aplicar factor medido al cálculo de energía", key="aplicar_factor_contenido")
+    with st.expander("🧰 REPUESTOS SUGERIDOS (SPARE PARTS)", expanded=True): 
+        render_dict(secciones["repuestos"])
+    with st.expander("📅 REPUESTOS DE FLOTA (Temporada de Alquiler)"):
+        from ledscreencalc.repuestos import temporada_repuestos
+
+        st.caption("Shows de la temporada: los que se superponen comparten un pool de repuestos; "
+                   "lo que falla vuelve al pool tras la reparación.")
+        shows_flota = st.data_editor([
+            {"nombre": "Show Actual", "inicio": 0, "dias": dias_show, "modulos": resultado.raw["opciones"]["Opcion 1 (Ideal)"]["total_modulos"],
+             "rcards": resultado.raw["opciones"]["Opcion 1 (Ideal)"]["total_gabinetes"], "psu": resultado.raw["opciones"]["Opcion 1 (Ideal)"]["total_gabinetes"]},
+        ], num_rows="dynamic", use_container_width=True, key="shows_flota")
+        reparacion = st.number_input("Días de Reparación (vuelta al pool)", min_value=1, value=14, step=1)
+        # La simulación (Monte Carlo) sólo corre con el interruptor encendido y se
+        # guarda por tabla de shows + disponibilidad + reparación: un rerun por
+        # otro widget no la repite (el expander cerrado no evita que se ejecute)
+        flota = None
+        if st.toggle("Simular temporada", key="simular_flota"):
+            shows_validos = [s for s in shows_flota if s.get("inicio") is not None and s.get("dias")]
+            clave_flota = (tuple(tuple(sorted(s.items())) for s in shows_validos), disponibilidad_rep, int(reparacion))
+            if st.session_state.get("temporada_flota", (None,))[0] != clave_flota:
+                try:
+                    st.session_state.temporada_flota = (clave_flota, temporada_repuestos(
+                        shows_validos, disponibilidad=disponibilidad_rep, simulaciones=5000, reparacion_dias=int(reparacion)), None)
+                except (ValueError, TypeError) as e:
+                    st.session_state.temporada_flota = (clave_flota, None, str(e))
+            _, flota, error_flota = st.session_state.temporada_flota
+            if error_flota:
+                st.warning(error_flota)
+        if flota is not None:
+            render_dict({
+                "Pool Compartido (Mód. / R-Cards / PSU)": " / ".join(str(flota["repuestos"][c]) for c in ("modulos", "rcards", "psu")),
+                "Con Kit por Show (Mód. / R-Cards / PSU)": " / ".join(str(flota["sin_compartir"][c]) for c in ("modulos", "rcards", "psu")),
+                "Capital en Repuestos": f"USD {formato_latam(flota['capital_usd'], 0)} (kit por show: USD {formato_latam(flota['capital_sin_compartir_usd'], 0)})",
+                "Shows sin Faltantes": f"{formato_latam(flota['disponibilidad'] * 100, 2)} % ({formato_latam(flota['show_dias_simulados'], 0)} show-días simulados)",
+            })
+
+with colB:
+    with st.expander("📡 DATA Y SEÑAL", expanded=True): 
+        panel_data_y_senal(spec)
+    with st.expander("🎛️ HARDWARE DEL PROCESADOR", expanded=True): 
+        render_dict(secciones["procesador"])
+    with st.expander("🏗️ INGENIERÍA ESTRUCTURAL E IZAJE (DGUV-17)", expanded=True): 
+        render_dict(secciones["izaje"])
+    with st.expander("🪝 CARGA POR PUNTO DE COLGADO (Truss como Viga Continua)"):
+        from ledscreencalc.estructura import rig_desde_resultado
+
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            motores_rig = st.number_input("Motores por Truss", min_value=2, value=resultado.raw["izaje"]["puntos_colgado"], step=1)
+        with c2:
+            voladizo_rig = st.number_input("Voladizo en Puntas (m)", min_value=0.0, value=0.5, step=0.25, format="%.2f")
+        with c3:
+            trusses_rig = st.radio("Trusses Paralelos", [1, 2], horizontal=True)
+        try:
+            rig = rig_desde_resultado(resultado, motores=int(motores_rig), voladizo_m=voladizo_rig, trusses=trusses_rig)
+        except (ValueError, ImportError) as e:
+            st.warning(str(e))
+        else:
+            v_rig = rig.valores()
+            render_dict({
+                "Reacción Máx. / Mín. por Punto": f"{formato_latam(v_rig['reaccion_max_kg'], 1)} kg / {formato_latam(v_rig['reaccion_min_kg'], 1)} kg",
+                "Sobrecarga vs. Reparto Parejo": f"{formato_latam(v_rig['sobrecarga_vs_parejo'] * 100, 1)} %",
+                "Momento Flector Máx. en Truss": f"{formato_latam(v_rig['momento_max_knm'], 2)} kN·m ({formato_latam(v_rig['uso_flexion_max'] * 100, 1)} % del admisible)",
+                "Flecha Máx. entre Motores": f"{formato_latam(v_rig['flecha_max_mm'], 1)} mm",
+            })
+            if v_rig["levantamiento"]:
+                st.warning("Hay motores con reacción negativa (levantamiento): reubicar los puntos de colgado.")
+            st.table([{
+                "Punto": p["punto"],
+                "Truss": p["truss"],
+                "Posición": f"{formato_latam(p['x_m'], 2)} m",
+                "Reacción": f"{formato_latam(p['reaccion_kg'], 1)} kg",
+                "Motor (WLL)": f"{formato_latam(p['motor_kg'], 0)} kg" if p["motor_kg"] is not None else "Ing. Estructural Req.",
+            } for p in rig.plan()])
+            st.download_button(label="🪝 Cargas por Punto (CSV)", data=rig.reporte_csv, file_name="Cargas_Puntos_LED.csv", mime="text/csv")
+
+with st.expander("🎲 ANÁLISIS DE INCERTIDUMBRE (Monte Carlo)"):
+    from ledscreencalc.incertidumbre import analizar_incertidumbre
+
+    st.caption("Las entradas toman distribuciones (tolerancias a 3σ) y se propagan por layout, energía, izaje y repuestos.")
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        muestras_mc = st.selectbox("Muestras", [10000, 100000], index=0, format_func=lambda n: formato_latam(n, 0))
+    with c2:
+        tol_peso = st.number_input("Tolerancia Peso Gab. (%)", min_value=0.0, value=8.0, step=1.0)
+    with c3:
+        tol_watts = st.number_input("Tolerancia W/m² (%)", min_value=0.0, value=15.0, step=1.0)
+    with c4:
+        rango_factor = st.slider("Factor Promedio (mín-máx)", 0.0, 1.0, (0.15, 0.55), step=0.01)
+    # Como en REPUESTOS DE FLOTA: corre a pedido y queda guardado por proyecto
+    # + tolerancias, así los reruns por otros widgets no repiten el muestreo
+    mc = None
+    if st.toggle("Calcular incertidumbre", key="analisis_mc"):
+        clave_mc = (clave_spec(resultado.spec), muestras_mc, tol_peso, tol_watts, tuple(rango_factor))
+        if st.session_state.get("incertidumbre", (None,))[0] != clave_mc:
+            try:
+                st.session_state.incertidumbre = (clave_mc, analizar_incertidumbre(spec, muestras=muestras_mc, distribuciones={
+                    "cab_peso_kg": ("tolerancia", tol_peso / 100), "watts_max_m2": ("tolerancia", tol_watts / 100),
+                    "factor_promedio": ("triangular", rango_factor[0], None, rango_factor[1]),
+                }), None)
+            except (ValueError, ImportError) as e:
+                st.session_state.incertidumbre = (clave_mc, None, str(e))
+        _, mc, error_mc = st.session_state.incertidumbre
+        if error_mc:
+            st.warning(error_mc)
+    if mc is not None:
+        filas_mc = [("Potencia Máxima", "pot_max_kw", "kW", 2), ("Potencia Promedio", "pot_prom_kw", "kW", 2),
+                    ("Amperaje por Fase", "amp_fase", "A", 1), ("Carga Estática Total", "carga_estatica_kg", "kg", 0),
+                    ("Carga por Motor (reparto parejo)", "carga_por_punto_kg", "kg", 0),
+                    ("Carga Máx. por Motor (viga)", "reaccion_max_kg", "kg", 0), ("Fallas de Módulos en el Show", "fallas_modulos", "und.", 0)]
+        st.table([{
+            "Variable": nombre,
+            **{p.upper(): f"{formato_latam(mc['resumen'][clave][p], dec)} {unidad}" for p in ("p50", "p95", "p99")},
+        } for nombre, clave, unidad, dec in filas_mc if clave in mc["resumen"]])
+        st.caption(f"Probabilidad de que el kit de repuestos alcance para el show: {formato_latam(mc['kit_cubre_show'] * 100, 2)} %")
+
+with st.sidebar:
+    with st.expander("🛠️ DEPURACIÓN (Perfil por Etapas)"):
+        st.toggle("Perfilar esta corrida", key="perfil_etapas")
+        st.toggle("Registrar asignaciones (tracemalloc)", key="perfil_asignaciones",
+                  disabled=not st.session_state.get("perfil_etapas"))
+        if perfil.activo:
+            etapas = perfil.tabla()
+            st.table([{
+                "Etapa": f["etapa"],
+                "Llamadas": f["llamadas"],
+                "Total (ms)": formato_latam(f["total_ms"], 2),
+                "Máx. (ms)": formato_latam(f["max_ms"], 2),
+                **({"Neto (KB)": formato_latam(f["neto_kb"], 1), "Pico Máx. (KB)": formato_latam(f["pico_max_kb"], 1)} if perfil.asignaciones else {}),
+            } for f in etapas])
+            perfil_json, traza = perfil.exportar_json(), perfil.traza_chrome()
+            st.download_button(label="📊 Perfil (JSON)", data=perfil_json, file_name="Perfil_LED.json", mime="application/json")
+            st.download_button(label="🧵 Traza (Chrome/Perfetto)", data=traza, file_name="Traza_LED.json", mime="application/json")
@@ -0,0 +1,95 @@
+# ==========================================
+# BENCHMARK: BARRIDO VECTORIZADO vs. RUTA ESCALAR
+# ==========================================
+# Genera N candidatos aleatorios (ancho, alto, pitch, modelo), los evalúa con
+# LEDSCREENCALC._calcular_configuracion y con barrer_candidatos, comprueba que
+# los resultados coinciden exactamente y reporta la aceleración.
+#
+#   python benchmarks/bench_barrido.py [--candidatos 100000] [--muestra-escalar 20000]
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from ledscreencalc.barrido import MODOS, barrer_candidatos, tabla_modelos
+from ledscreencalc.calculos import LEDSCREENCALC
+
+MODELOS = [
+    {"entorno": "Indoor"},
+    {"entorno": "Outdoor"},
+    {"mod_res_w": 104, "mod_res_h": 104, "mod_w": 250.0, "mod_h": 250.0, "cab_w": 500.0, "cab_h": 500.0},
+    {"mod_res_w": 128, "mod_res_h": 64, "mod_w": 320.0, "mod_h": 160.0, "cab_w": 960.0, "cab_h": 960.0},
+    {"mod_res_w": 192, "mod_res_h": 192, "mod_w": 500.0, "mod_h": 500.0, "cab_w": 500.0, "cab_h": 1000.0},
+]
+COLUMNAS = ("columnas", "filas", "res_total_w", "res_total_h", "total_px", "area_m2",
+            "total_gabinetes", "total_modulos", "ancho_fisico", "alto_fisico")
+_FUNC_MODO = {"round": round, "floor": math.floor, "ceil": math.ceil}
+
+
+def candidatos(n, semilla=7):
+    rng = np.random.default_rng(semilla)
+    req_w = np.round(rng.uniform(500, 120000, n), 1)
+    req_h = np.round(rng.uniform(500, 30000, n), 1)
+    pitch = rng.choice([1.2, 1.5, 1.9, 2.6, 2.9, 3.9, 4.8, 6.0, 10.0], n)
+    modelo = rng.integers(0, len(MODELOS), n)
+    return req_w, req_h, pitch, modelo
+
+
+def escalar(req_w, req_h, pitch, modelo, modo):
+    f = _FUNC_MODO[modo]
+    filas = []
+    for w, h, p, m in zip(req_w.tolist(), req_h.tolist(), pitch.tolist(), modelo.tolist()):
+        datos = MODELOS[m]
+        calc = LEDSCREENCALC("TV", datos.get("entorno", "Indoor"), "Video", w, h, 10, p,
+                             datos.get("mod_res_w"), datos.get("mod_res_h"), datos.get("mod_w"),
+                             datos.get("mod_h"), datos.get("cab_w"), datos.get("cab_h"))
+        raw = calc._calcular_configuracion(max(1, f(w / calc.cab_w)), max(1, f(h / calc.cab_h)))["raw"]
+        filas.append(raw)
+    return filas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido vectorizado vs. escalar")
+    parser.add_argument("--candidatos", type=int, default=100000)
+    parser.add_argument("--muestra-escalar", type=int, default=20000,
+                        help="candidatos evaluados por la ruta escalar (se extrapola al total)")
+    args = parser.parse_args(argv)
+
+    req_w, req_h, pitch, modelo = candidatos(args.candidatos)
+    tabla = tabla_modelos(MODELOS)
+    m = min(args.muestra_escalar, args.candidatos)
+    errores = 0
+    aceleraciones = []
+    for modo in MODOS:
+        t0 = time.perf_counter()
+        vec = barrer_candidatos(req_w, req_h, pitch, modelo, tabla, modo=modo)
+        t_vec = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        ref = escalar(req_w[:m], req_h[:m], pitch[:m], modelo[:m], modo)
+        t_esc = (time.perf_counter() - t0) * args.candidatos / m
+
+        for col in COLUMNAS:
+            esperado = np.array([r[col] for r in ref])
+            if not np.array_equal(vec[col][:m], esperado):
+                print(f"[!] {modo}: la columna {col} no coincide con la ruta escalar")
+                errores += 1
+        aceleraciones.append(t_esc / t_vec)
+        print(f"{modo:>5}: vectorizado {t_vec * 1000:8.2f} ms | escalar (extrap.) {t_esc * 1000:9.1f} ms "
+              f"| x{t_esc / t_vec:,.0f}")
+
+    if errores:
+        return 1
+    if min(aceleraciones) < 100:
+        print("[!] Aceleración por debajo de x100")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# ==========================================
+# BENCHMARK: MAPA DE SINCRONIZACIÓN CÁMARA / PANTALLA
+# ==========================================
+# Latencia de mapa_sincronizacion sobre grillas refresco x shutter de hasta
+# 1000 x 1000 (shutters como texto "1/N" y en grados), y sobre la grilla
+# completa de la UI (todos los fps de cámara y escaneos a la vez).
+# Objetivo: 1000 x 1000 en bastante menos de 100 ms.
+#
+#   python benchmarks/bench_camara.py [--repeticiones 7] [--limite-ms 100]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.camara import ESCANEOS, FPS_CAMARA, REFRESCOS_HZ, SHUTTERS, mapa_sincronizacion
+
+GRILLAS = [
+    ("UI completa", REFRESCOS_HZ, SHUTTERS, FPS_CAMARA, ESCANEOS),
+    ("100 x 100", np.linspace(960, 7680, 100), [f"1/{d}" for d in range(24, 124)], 50.0, 16),
+    ("1000 x 1000 (1/N)", np.linspace(960, 7680, 1000), [f"1/{d}" for d in range(24, 1024)], 50.0, 16),
+    ("1000 x 1000 (grados)", np.linspace(960, 7680, 1000), [f"{a / 10:g}°" for a in range(10, 3610, 36)] * 10, 23.976, 8),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia del mapa de sincronización de cámara")
+    parser.add_argument("--repeticiones", type=int, default=7)
+    parser.add_argument("--limite-ms", type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    peor = 0.0
+    for nombre, refrescos, shutters, fps, escaneos in GRILLAS:
+        tiempos = []
+        for _ in range(args.repeticiones):
+            t0 = time.perf_counter()
+            mapa = mapa_sincronizacion(refrescos, shutters, fps, escaneos)
+            tiempos.append((time.perf_counter() - t0) * 1000)
+        med = statistics.median(tiempos)
+        peor = max(peor, med)
+        riesgo = np.bincount(mapa["riesgo"].ravel(), minlength=3) / mapa["riesgo"].size
+        print(f"{nombre:>22}: {mapa['riesgo'].size:>8} celdas en {med:6.1f} ms | "
+              f"seguro {riesgo[0]:.0%}, advertencia {riesgo[1]:.0%}, crítico {riesgo[2]:.0%}")
+    if peor > args.limite_ms:
+        print(f"[!] Latencia por encima de {args.limite_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# ==========================================
+# BENCHMARK: CONSULTAS AL CATÁLOGO DE GABINETES
+# ==========================================
+# Latencia de CatalogoProductos.buscar sobre un catálogo sintético de varios
+# miles de SKUs. Objetivo interactivo: unos pocos ms por consulta.
+#
+#   python benchmarks/bench_catalogo.py [--skus 5000] [--repeticiones 50] [--limite-ms 10]
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.catalogo import CatalogoProductos, spec_desde_producto
+from ledscreencalc.proyecto import calculate_project
+
+PITCHES = [1.2, 1.5, 1.9, 2.5, 2.6, 2.9, 3.9, 4.8, 5.9, 6.6, 8.0, 10.0]
+GABINETES = [(500, 500, 250, 250), (500, 1000, 250, 250), (576, 576, 288, 288), (640, 480, 320, 160),
+             (960, 960, 320, 160), (1000, 1000, 250, 250), (1000, 500, 250, 250), (750, 750, 250, 250)]
+CONSULTAS = [
+    ("Outdoor <= 3.9 mm, >= 5000 nits, 12 x 6 m al 2%",
+     dict(entorno="Outdoor", pitch_max=3.9, brillo_min=5000, req_w=12000, req_h=6000, tolerancia=0.02)),
+    ("Indoor 1.5-2.6 mm, <= 8 kg, 10 x 5 m al 1%",
+     dict(entorno="Indoor", pitch_min=1.5, pitch_max=2.6, peso_max=8, req_w=10000, req_h=5000, tolerancia=0.01)),
+    ("Cualquier entorno <= 400 W/m², mejor ajuste a 7,3 x 4,1 m",
+     dict(watts_max=400, req_w=7300, req_h=4100)),
+]
+
+
+def productos_sinteticos(cantidad, semilla=1):
+    azar = random.Random(semilla)
+    for i in range(cantidad):
+        entorno = azar.choice(["Indoor", "Outdoor"])
+        pitch = azar.choice(PITCHES)
+        cab_w, cab_h, mod_w, mod_h = azar.choice(GABINETES)
+        yield {
+            "sku": f"SKU-{i:05d}", "marca": f"Marca {i % 40}", "modelo": f"M{pitch:g}-{cab_w}x{cab_h}",
+            "entorno": entorno, "pitch": pitch, "cab_w": cab_w, "cab_h": cab_h, "mod_w": mod_w, "mod_h": mod_h,
+            "mod_res_w": int(mod_w / pitch), "mod_res_h": int(mod_h / pitch),
+            "brillo": azar.randrange(600, 1800, 100) if entorno == "Indoor" else azar.randrange(4000, 10000, 500),
+            "peso_kg": round(azar.uniform(4.0, 12.0) * cab_w * cab_h / 250000, 1),
+            "watts_max_m2": azar.randrange(300, 650, 10) if entorno == "Indoor" else azar.randrange(600, 1100, 10),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia de consultas al catálogo de gabinetes")
+    parser.add_argument("--skus", type=int, default=5000)
+    parser.add_argument("--repeticiones", type=int, default=50)
+    parser.add_argument("--limite-ms", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    catalogo = CatalogoProductos()
+    t0 = time.perf_counter()
+    catalogo.agregar(productos_sinteticos(args.skus))
+    print(f"Carga de {len(catalogo)} SKUs: {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    peor = 0.0
+    for nombre, filtros in CONSULTAS:
+        tiempos = []
+        for _ in range(args.repeticiones):
+            t0 = time.perf_counter()
+            productos = catalogo.buscar(**filtros)
+            tiempos.append((time.perf_counter() - t0) * 1000)
+        med = statistics.median(tiempos)
+        peor = max(peor, med)
+        print(f"{nombre}: {med:6.2f} ms | {len(productos)} resultado(s)")
+        if productos:
+            mejor = productos[0]
+            resultado = calculate_project(spec_desde_producto(mejor, req_w=filtros["req_w"], req_h=filtros["req_h"]))
+            print(f"    mejor: {mejor['sku']} {mejor['modelo']} (error {mejor['error_ajuste'] * 100:.2f}%) -> "
+                  f"{resultado.raw['izaje']['carga_estatica_kg']:.0f} kg, {resultado.raw['energia']['pot_max_w']:.0f} W máx.")
+    if peor > args.limite_ms:
+        print(f"[!] Latencia por encima de {args.limite_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# ==========================================
+# BENCHMARK: ANÁLISIS DE POTENCIA SEGÚN CONTENIDO
+# ==========================================
+# Cuadros por segundo de serie_apl sobre streams 4K sintéticos (Y4M 4:2:0 y
+# RGB24 crudo) generados al vuelo, sin tocar disco, y pico de memoria con
+# tracemalloc. Objetivo: más rápido que tiempo real (>= --fps-objetivo) y
+# memoria que no crece con la cantidad de cuadros.
+#
+#   python benchmarks/bench_contenido.py [--cuadros 60] [--fps-objetivo 30]
+import argparse
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.contenido import serie_apl
+
+ANCHO, ALTO = 3840, 2160
+
+
+class StreamSintetico(io.RawIOBase):
+    # Cabecera + cuadros repetidos de un bloque aleatorio, entregados por readinto
+    def __init__(self, cabecera, cuadro, cuadros):
+        self._datos = [cabecera] + [cuadro] * cuadros
+        self._actual = 0
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, destino):
+        destino = memoryview(destino).cast("B")
+        escritos = 0
+        while escritos < len(destino) and self._actual < len(self._datos):
+            bloque = self._datos[self._actual]
+            n = min(len(destino) - escritos, len(bloque) - self._pos)
+            destino[escritos:escritos + n] = bloque[self._pos:self._pos + n]
+            escritos += n
+            self._pos += n
+            if self._pos == len(bloque):
+                self._actual += 1
+                self._pos = 0
+        return escritos
+
+
+def stream_y4m(cuadros):
+    azar = np.random.default_rng(1)
+    y = azar.integers(16, 236, ANCHO * ALTO, dtype=np.uint8).tobytes()
+    uv = azar.integers(16, 241, ANCHO * ALTO // 2, dtype=np.uint8).tobytes()
+    cabecera = f"YUV4MPEG2 W{ANCHO} H{ALTO} F30:1 Ip A1:1 C420jpeg\n".encode()
+    return io.BufferedReader(StreamSintetico(cabecera, b"FRAME\n" + y + uv, cuadros))
+
+
+def stream_rgb(cuadros):
+    cuadro = np.random.default_rng(2).integers(0, 256, ANCHO * ALTO * 3, dtype=np.uint8).tobytes()
+    return io.BufferedReader(StreamSintetico(b"", cuadro, cuadros))
+
+
+def medir(nombre, crear, cuadros, **lectura):
+    fuente = crear(cuadros)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    n = sum(1 for _ in serie_apl(fuente, **lectura))
+    dt = time.perf_counter() - t0
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    fps = n / dt
+    print(f"{nombre}: {n} cuadros en {dt:.2f} s -> {fps:6.1f} cuadros/s | pico de memoria {pico / 2**20:.1f} MiB")
+    return fps
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Velocidad del análisis de contenido 4K")
+    parser.add_argument("--cuadros", type=int, default=60)
+    parser.add_argument("--fps-objetivo", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    peor = min(medir("Y4M 4:2:0 3840x2160", stream_y4m, args.cuadros, formato="y4m"),
+               medir("RGB24 3840x2160", stream_rgb, args.cuadros, formato="rgb", ancho=ANCHO, alto=ALTO))
+    if peor < args.fps_objetivo:
+        print(f"[!] Más lento que tiempo real ({args.fps_objetivo:g} cuadros/s)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
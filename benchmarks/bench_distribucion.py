@@ -0,0 +1,60 @@
+# ==========================================
+# BENCHMARK: ASIGNACIÓN DE CIRCUITOS Y FASES
+# ==========================================
+# Latencia de asignar_circuitos para paredes de cientos a 50k gabinetes, con
+# carga uniforme y con carga por gabinete variable, y desbalance resultante.
+# Objetivo: paredes de 10k+ gabinetes en bastante menos de un segundo.
+#
+#   python benchmarks/bench_distribucion.py [--repeticiones 5] [--limite-ms 250]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.distribucion import asignar_circuitos
+
+# (columnas, filas, watts por gabinete, breaker)
+PAREDES = [
+    (20, 10, 125.0, 16),
+    (60, 20, 350.0, 32),
+    (200, 60, "variable", 16),
+    (250, 200, 200.0, 32),
+    (250, 200, "variable", 32),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia del asignador de circuitos")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--limite-ms", type=float, default=250.0)
+    args = parser.parse_args(argv)
+
+    azar = np.random.default_rng(1)
+    peor = 0.0
+    for columnas, filas, watts, breaker in PAREDES:
+        if watts == "variable":
+            watts = azar.uniform(80.0, 320.0, (filas, columnas))
+        tiempos = []
+        for _ in range(args.repeticiones):
+            t0 = time.perf_counter()
+            plan = asignar_circuitos(columnas, filas, watts, breaker_a=breaker)
+            tiempos.append((time.perf_counter() - t0) * 1000)
+        med = statistics.median(tiempos)
+        peor = max(peor, med)
+        v = plan.valores()
+        print(f"{columnas * filas:>6} gabinetes, {breaker} A: {med:7.1f} ms | {v['circuitos']} circuitos "
+              f"({'/'.join(str(n) for n in v['circuitos_por_fase'])}) | uso máx. {v['uso_max_circuito'] * 100:.1f}% | "
+              f"desbalance {v['desbalance_pct']:.3f}%")
+    if peor > args.limite_ms:
+        print(f"[!] Latencia por encima de {args.limite_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
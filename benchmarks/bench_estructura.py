@@ -0,0 +1,67 @@
+# ==========================================
+# BENCHMARK: DISTRIBUCIÓN DE CARGAS EN TRUSS
+# ==========================================
+# Latencia de resolver_rig para rigs de un muro simple a varios trusses con
+# cientos de motores y miles de bumpers desparejos, y cierre del equilibrio
+# (suma de reacciones = carga total). Objetivo: pocos milisegundos, para
+# poder recalcular en cada cambio de la interfaz.
+#
+#   python benchmarks/bench_estructura.py [--repeticiones 7] [--limite-ms 50]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.estructura import resolver_rig
+
+# (trusses, largo de cada truss en m, motores por truss, bumpers por truss)
+RIGS = [
+    (1, 11, 5, 20),
+    (2, 24, 9, 96),
+    (6, 60, 21, 240),
+    (12, 80, 41, 320),
+]
+
+
+def rig(trusses, largo, motores, bumpers, azar):
+    definicion = [{"largo_m": largo, "motores_m": np.linspace(0.5, largo - 0.5, motores)} for _ in range(trusses)]
+    x = (np.arange(bumpers) + 0.5) * (largo - 1) / bumpers + 0.5
+    cargas = [(k, xi, kg) for k in range(trusses) for xi, kg in zip(x, azar.uniform(40.0, 180.0, bumpers))]
+    return definicion, cargas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia del solver de cargas en truss")
+    parser.add_argument("--repeticiones", type=int, default=7)
+    parser.add_argument("--limite-ms", type=float, default=50.0)
+    args = parser.parse_args(argv)
+
+    azar = np.random.default_rng(1)
+    peor = 0.0
+    for trusses, largo, motores, bumpers in RIGS:
+        definicion, cargas = rig(trusses, largo, motores, bumpers, azar)
+        tiempos = []
+        for _ in range(args.repeticiones):
+            t0 = time.perf_counter()
+            resultado = resolver_rig(definicion, cargas)
+            tiempos.append((time.perf_counter() - t0) * 1000)
+        med = statistics.median(tiempos)
+        peor = max(peor, med)
+        v = resultado.valores()
+        cierre = abs(resultado.reaccion_kg.sum() - v["carga_total_kg"])
+        print(f"{trusses:>2} truss(es), {v['puntos_colgado']:>4} motores, {len(cargas):>5} bumpers: {med:6.1f} ms | "
+              f"reacción máx {v['reaccion_max_kg']:7.1f} kg | momento máx {v['momento_max_knm']:5.2f} kN·m | "
+              f"error de equilibrio {cierre:.2e} kg")
+    if peor > args.limite_ms:
+        print(f"[!] Latencia por encima de {args.limite_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# ==========================================
+# BENCHMARK: EXPORTACIÓN POR STREAMING
+# ==========================================
+# Escribe --filas filas de resultado de lote (las mismas columnas que
+# `python -m ledscreencalc lote`) en cada formato de exportar.FORMATOS y mide
+# filas/s y tamaño. La memoria se controla con tracemalloc sobre dos corridas
+# más cortas: si el pico crece con la cantidad de filas, el escritor está
+# acumulando en vez de volcar. Parquet se omite si falta pyarrow.
+# Objetivo: 100k proyectos en todos los formatos con memoria constante.
+#
+#   python benchmarks/bench_exportar.py [--filas 100000] [--min-filas-s 5000]
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.exportar import FORMATOS, abrir_escritor
+from ledscreencalc.lote import columnas_salida, procesar_fila, tipos_salida
+
+PROYECTOS_BASE = 200
+
+
+def filas_sinteticas(base, n):
+    for i in range(n):
+        fila = dict(base[i % len(base)])
+        fila["fila"] = i + 1
+        yield fila
+
+
+def exportar(ruta, formato, columnas, filas):
+    opciones = {"tipos": tipos_salida()} if formato == "parquet" else {}
+    with abrir_escritor(ruta, columnas, formato, **opciones) as escritor:
+        escritor.escribir_filas(filas)
+
+
+def pico_memoria(ruta, formato, columnas, base, n):
+    tracemalloc.start()
+    try:
+        exportar(ruta, formato, columnas, filas_sinteticas(base, n))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Velocidad y memoria de los escritores de exportación")
+    parser.add_argument("--filas", type=int, default=100000)
+    parser.add_argument("--min-filas-s", type=float, default=5000.0)
+    args = parser.parse_args(argv)
+
+    columnas = columnas_salida()
+    base = [procesar_fila(i, {"id": f"P{i}", "req_w": 2000 + i * 997 % 28000, "req_h": 1000 + i * 131 % 8000,
+                              "pitch": (1.9, 2.6, 3.9, 4.8)[i % 4]}) for i in range(PROYECTOS_BASE)]
+    codigo = 0
+    with tempfile.TemporaryDirectory() as carpeta:
+        for formato in FORMATOS:
+            ruta = os.path.join(carpeta, f"salida.{formato}")
+            try:
+                t0 = time.perf_counter()
+                exportar(ruta, formato, columnas, filas_sinteticas(base, args.filas))
+                dt = time.perf_counter() - t0
+            except ImportError as e:
+                print(f"{formato:<10} omitido: {e}")
+                continue
+            tamano = os.path.getsize(ruta)
+            corto = pico_memoria(ruta, formato, columnas, base, 5000)
+            largo = pico_memoria(ruta, formato, columnas, base, 25000)
+            velocidad = args.filas / dt
+            problemas = []
+            if velocidad < args.min_filas_s:
+                problemas.append(f"menos de {args.min_filas_s:g} filas/s")
+            if largo > 1.5 * corto + 1e6:
+                problemas.append("la memoria crece con las filas")
+            print(f"{formato:<10} {args.filas} filas en {dt:6.2f} s ({velocidad:>8,.0f} filas/s) | "
+                  f"{tamano / 1e6:7.1f} MB | pico 5k/25k filas {corto / 1e6:.1f}/{largo / 1e6:.1f} MB"
+                  + "".join(f"  [!] {p}" for p in problemas))
+            codigo |= bool(problemas)
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# ==========================================
+# BENCHMARK: ARRANQUE EN FRÍO DEL NÚCLEO DE CÁLCULO
+# ==========================================
+# Mide, en un intérprete nuevo por repetición, cuánto tarda importar el núcleo
+# y calcular un proyecto, y verifica que no se carguen Streamlit ni pandas.
+#
+#   python benchmarks/bench_importacion.py [--repeticiones 10]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT_HIJO = r"""
+import sys, time, json
+t0 = time.perf_counter()
+from ledscreencalc import LEDSCREENCALC, LedScreenProc, LedPowerCalc, LedRiggingCalc, LedSparesCalc, calculate_project
+t1 = time.perf_counter()
+calculate_project({})
+t2 = time.perf_counter()
+pesados = [m for m in ("streamlit", "pandas", "numpy") if m in sys.modules]
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "calculo_ms": (t2 - t1) * 1000, "pesados": pesados}))
+"""
+
+
+def medir(repeticiones):
+    muestras = []
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", SCRIPT_HIJO], cwd=RAIZ, check=True,
+                                capture_output=True, text=True).stdout
+        muestras.append(json.loads(salida))
+    return muestras
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de importación en frío de ledscreencalc")
+    parser.add_argument("--repeticiones", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    muestras = medir(args.repeticiones)
+    imp = [m["import_ms"] for m in muestras]
+    calc = [m["calculo_ms"] for m in muestras]
+    print(f"Importación: mediana {statistics.median(imp):.2f} ms | máx {max(imp):.2f} ms")
+    print(f"Primer cálculo: mediana {statistics.median(calc):.2f} ms")
+
+    pesados = sorted({p for m in muestras for p in m["pesados"]})
+    if pesados:
+        print(f"[!] Dependencias pesadas cargadas al importar: {', '.join(pesados)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
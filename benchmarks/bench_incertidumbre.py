@@ -0,0 +1,53 @@
+# ==========================================
+# BENCHMARK: ANÁLISIS DE INCERTIDUMBRE (MONTE CARLO)
+# ==========================================
+# Tiempo de analizar_incertidumbre con 100k muestras para proyectos de
+# distinto tamaño, con y sin la viga del truss, e intervalos resultantes.
+# Objetivo: 100k muestras en menos de un segundo (uso interactivo).
+#
+#   python benchmarks/bench_incertidumbre.py [--muestras 100000] [--limite-s 1]
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.incertidumbre import analizar_incertidumbre
+
+PROYECTOS = [
+    {"req_w": 6000, "req_h": 3000},
+    {"req_w": 12250, "req_h": 6000, "entorno": "Outdoor", "pitch": 3.9},
+    {"req_w": 60000, "req_h": 12000, "pitch": 2.6},
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Velocidad del Monte Carlo de incertidumbre")
+    parser.add_argument("--muestras", type=int, default=100000)
+    parser.add_argument("--limite-s", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    # Calentamiento: importa SciPy y deja en caché los proyectos nominales
+    for spec in PROYECTOS:
+        analizar_incertidumbre(spec, muestras=100)
+    peor = 0.0
+    for spec in PROYECTOS:
+        for viga in (False, True):
+            t0 = time.perf_counter()
+            mc = analizar_incertidumbre(spec, muestras=args.muestras, viga=viga)
+            dt = time.perf_counter() - t0
+            peor = max(peor, dt)
+            r = mc["resumen"]
+            motor = r["reaccion_max_kg"] if viga else r["carga_por_punto_kg"]
+            print(f"{spec['req_w']:>6} x {spec['req_h']:<6} {'viga ' if viga else 'parejo'}: {mc['n']} muestras en {dt:5.2f} s | "
+                  f"kW P50/P95 {r['pot_max_kw']['p50']:.1f}/{r['pot_max_kw']['p95']:.1f} | "
+                  f"kg total P99 {r['carga_estatica_kg']['p99']:.0f} | kg por motor P95 {motor['p95']:.0f}")
+    if peor > args.limite_s:
+        print(f"[!] Más lento que {args.limite_s:g} s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
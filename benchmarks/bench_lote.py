@@ -0,0 +1,65 @@
+# ==========================================
+# BENCHMARK: THROUGHPUT DEL LOTE vs. NÚCLEOS
+# ==========================================
+# Genera un JSONL sintético de proyectos y mide proyectos/segundo con 1..N
+# procesos, junto con la eficiencia de escalado respecto de 1 proceso.
+#
+#   python benchmarks/bench_lote.py [--proyectos 20000] [--max-trabajadores N]
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.lote import ejecutar_lote
+
+
+def generar_entrada(ruta, n, semilla=11):
+    rng = random.Random(semilla)
+    with open(ruta, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(json.dumps({
+                "id": f"P{i:06d}",
+                "uso": rng.choice(["Cine", "TV", "Publicidad"]),
+                "entorno": rng.choice(["Indoor", "Outdoor"]),
+                "req_w": round(rng.uniform(2000, 80000), 1),
+                "req_h": round(rng.uniform(1000, 20000), 1),
+                "pitch": rng.choice([1.5, 1.9, 2.6, 3.9, 4.8]),
+                "calidad": rng.choice(["SDR 8-bit", "HDR 10-bit"]),
+                "input_res": rng.choice(["HD (1080p)", "4K", "8K"]),
+                "distancia_cable_m": rng.choice([30.0, 80.0, 150.0]),
+                "shutter_speed_str": rng.choice(["1/50", "1/60", "1/100"]),
+                "porcentaje_repuestos": rng.choice([2.5, 5.0, 10.0]),
+            }) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput del procesamiento por lotes")
+    parser.add_argument("--proyectos", type=int, default=20000)
+    parser.add_argument("--max-trabajadores", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--bloque", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entrada = os.path.join(tmp, "proyectos.jsonl")
+        generar_entrada(entrada, args.proyectos)
+        base = None
+        trabajadores = 1
+        while trabajadores <= args.max_trabajadores:
+            salida = os.path.join(tmp, f"resultados_{trabajadores}.csv")
+            t0 = time.perf_counter()
+            total, errores = ejecutar_lote(entrada, salida, trabajadores=trabajadores, tam_bloque=args.bloque)
+            tasa = total / (time.perf_counter() - t0)
+            base = base or tasa
+            print(f"{trabajadores:3d} proceso(s): {tasa:10,.0f} proyectos/s | escalado x{tasa / base:5.2f} "
+                  f"(eficiencia {tasa / base / trabajadores:5.1%}) | errores {errores}")
+            trabajadores *= 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
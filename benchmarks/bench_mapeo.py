@@ -0,0 +1,59 @@
+# ==========================================
+# BENCHMARK: MAPEO DE PUERTOS EN PAREDES GRANDES
+# ==========================================
+# Latencia de mapear_puertos (8 recorridos evaluados) y de la exportación CSV
+# para paredes de hasta 50k+ gabinetes. Objetivo: muy por debajo de 1 s.
+#
+#   python benchmarks/bench_mapeo.py [--repeticiones 5] [--limite-ms 250]
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.calculos import capacidad_puerto_px
+from ledscreencalc.mapeo import mapear_puertos
+
+# (columnas, filas, cab_w, cab_h, cab_res_w, cab_res_h, calidad, fps)
+PAREDES = [
+    (20, 10, 500, 500, 192, 192, "HDR 10-bit", 60),
+    (125, 25, 480, 480, 168, 168, "SDR 8-bit", 60),
+    (250, 100, 500, 500, 128, 128, "HDR 10-bit", 120),
+    (400, 130, 500, 500, 192, 192, "HDR 10-bit", 60),
+    (520, 200, 500, 1000, 96, 192, "SDR 8-bit", 50),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia del mapeo de puertos")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--limite-ms", type=float, default=250.0)
+    args = parser.parse_args(argv)
+
+    peor = 0.0
+    for columnas, filas, cab_w, cab_h, res_w, res_h, calidad, fps in PAREDES:
+        capacidad = capacidad_puerto_px(calidad, fps)
+        tiempos = []
+        for _ in range(args.repeticiones):
+            t0 = time.perf_counter()
+            mapa = mapear_puertos(columnas, filas, cab_w, cab_h, res_w, res_h, capacidad)
+            tiempos.append((time.perf_counter() - t0) * 1000)
+        med = statistics.median(tiempos)
+        peor = max(peor, med)
+        t0 = time.perf_counter()
+        mapa.escribir_csv(io.StringIO())
+        t_csv = (time.perf_counter() - t0) * 1000
+        v = mapa.valores()
+        print(f"{columnas * filas:>7} gabinetes: mapa {med:7.1f} ms | CSV {t_csv:7.1f} ms | {v['puertos']} puertos x "
+              f"{v['gabinetes_por_puerto']}, {v['recorrido']} desde {v['esquina']}, {v['cable_total_m']:.0f} m de cable")
+    if peor > args.limite_ms:
+        print(f"[!] Latencia por encima de {args.limite_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+# ==========================================
+# BENCHMARK: SOLVER DE MOSAICO MIXTO
+# ==========================================
+# Latencia de resolver_mosaico para pedidos de estadio con decenas de tipos de
+# gabinete. Objetivo interactivo: < 50 ms por pedido.
+#
+#   python benchmarks/bench_mosaico.py [--repeticiones 5] [--limite-ms 50]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.mosaico import resolver_mosaico
+
+ANCHOS = [480, 500, 576, 600, 640, 750, 960, 1000]
+ALTOS = [250, 480, 500, 960, 1000, 1500]
+TIPOS = [{"cab_w": w, "cab_h": h, "cab_res_w": int(w / 3.9), "cab_res_h": int(h / 3.9)} for w in ANCHOS for h in ALTOS]
+PEDIDOS = [(10300.0, 5200.0), (60000.0, 12000.0), (120000.0, 12000.0), (200000.0, 24000.0), (350000.0, 40000.0)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia del solver de mosaico mixto")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--limite-ms", type=float, default=50.0)
+    args = parser.parse_args(argv)
+
+    peor = 0.0
+    for req_w, req_h in PEDIDOS:
+        resolver_mosaico(req_w, req_h, TIPOS)
+        tiempos = []
+        for _ in range(args.repeticiones):
+            t0 = time.perf_counter()
+            soluciones = resolver_mosaico(req_w, req_h, TIPOS)
+            tiempos.append((time.perf_counter() - t0) * 1000)
+        med = statistics.median(tiempos)
+        peor = max(peor, med)
+        mejor = soluciones[0]
+        print(f"{req_w / 1000:g} x {req_h / 1000:g} m, {len(TIPOS)} tipos: {med:6.1f} ms | "
+              f"{len(soluciones)} soluciones | mejor error {mejor['error_rel'] * 100:.3f}% "
+              f"con {mejor['total_gabinetes']} gabinetes")
+    if peor > args.limite_ms:
+        print(f"[!] Latencia por encima de {args.limite_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# ==========================================
+# BENCHMARK: COSTO DEL PERFILADO POR ETAPAS
+# ==========================================
+# Tiempo de calculate_project (sin caché) más los dos reportes, antes de
+# activar el perfilado, después de desactivarlo y con el perfilado encendido,
+# con y sin tracemalloc. Apagado no debe quedar ningún envoltorio: además del
+# tiempo se verifica que cada función y método reemplazado vuelva a ser el
+# objeto original. "Nunca activado" y "desactivado" se miden en procesos
+# hijos alternados (un proceso no puede volver a "nunca activado") y se
+# comparan las medianas, para que el ruido de la máquina afecte a los dos.
+# Objetivo: apagado, diferencia dentro del ruido de medición.
+#
+#   python benchmarks/bench_perfil.py [--repeticiones 200] [--pares 5] [--limite 0.2]
+import argparse
+import importlib
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.perfil import ETAPAS, PERFIL
+from ledscreencalc.proyecto import _calcular_cacheado, calculate_project
+
+SPEC = {"req_w": 24000, "req_h": 6000, "pitch": 2.6, "num_entradas": 4}
+
+
+def atributos():
+    # (dueño, nombre) -> objeto, para todos los módulos y clases que se instrumentan
+    salida = {}
+    for modulo, clase, _ in ETAPAS:
+        mod = importlib.import_module(f"ledscreencalc.{modulo}")
+        for duenio in (mod, getattr(mod, clase)) if clase else (mod,):
+            salida.update({(duenio.__name__, n): v for n, v in vars(duenio).items() if callable(getattr(v, "__func__", v))})
+    return salida
+
+
+def corrida(repeticiones, intentos=9):
+    mejor = float("inf")
+    for _ in range(intentos):
+        t0 = time.perf_counter()
+        for _ in range(repeticiones):
+            _calcular_cacheado.cache_clear()
+            r = calculate_project(SPEC)
+            r.reporte_txt()
+            r.reporte_csv()
+        mejor = min(mejor, (time.perf_counter() - t0) / repeticiones)
+    return mejor
+
+
+def hijo(modo, repeticiones):
+    # Tiempo apagado en un proceso nuevo: "nunca" sin tocar el perfilado,
+    # "ciclo" tras encenderlo (con tracemalloc) y apagarlo
+    corrida(10)
+    if modo == "ciclo":
+        with PERFIL.sesion(asignaciones=True):
+            corrida(1, 1)
+    return corrida(repeticiones, 5)
+
+
+def apagado(modo, repeticiones):
+    salida = subprocess.run([sys.executable, os.path.abspath(__file__), "--hijo", modo, "--repeticiones", str(repeticiones)],
+                            capture_output=True, text=True, check=True)
+    return float(salida.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Costo del perfilado por etapas encendido y apagado")
+    parser.add_argument("--repeticiones", type=int, default=200)
+    parser.add_argument("--pares", type=int, default=5, help="pares de procesos nunca activado / desactivado")
+    parser.add_argument("--limite", type=float, default=0.2, help="diferencia relativa máxima entre medianas")
+    parser.add_argument("--hijo", choices=("nunca", "ciclo"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.hijo:
+        print(hijo(args.hijo, args.repeticiones))
+        return 0
+
+    originales = atributos()
+    corrida(10)
+    base = corrida(args.repeticiones)
+    with PERFIL.sesion():
+        encendido = corrida(args.repeticiones)
+    etapas = len(PERFIL.tabla())
+    with PERFIL.sesion(asignaciones=True):
+        con_asignaciones = corrida(max(1, args.repeticiones // 10))
+    restantes = [f"{d}.{n}" for (d, n), v in atributos().items() if originales.get((d, n)) is not v]
+
+    nunca, ciclo = [], []
+    for _ in range(args.pares):
+        nunca.append(apagado("nunca", args.repeticiones))
+        ciclo.append(apagado("ciclo", args.repeticiones))
+    antes, despues = statistics.median(nunca), statistics.median(ciclo)
+    diferencia = despues / antes - 1
+    print(f"nunca activado {antes * 1000:.3f} ms | desactivado {despues * 1000:.3f} ms ({diferencia:+.1%}, "
+          f"medianas de {args.pares} procesos c/u) | encendido {encendido * 1000:.3f} ms ({encendido / base - 1:+.1%}, "
+          f"{etapas} etapas) | con tracemalloc {con_asignaciones * 1000:.3f} ms ({con_asignaciones / base:.1f}x)")
+    if restantes:
+        print(f"[!] Quedaron envoltorios tras desactivar: {', '.join(restantes)}")
+        return 1
+    if diferencia > args.limite:
+        print(f"[!] Apagado cuesta más de {args.limite:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
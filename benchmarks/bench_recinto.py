@@ -0,0 +1,71 @@
+# ==========================================
+# BENCHMARK: PLANIFICADOR DE RECINTO
+# ==========================================
+# Latencia de planificar_recinto para recintos de 10 a 60 superficies, con el
+# empaquetado heurístico (interactivo) y con la refinación exacta acotada.
+# Muestra también cuántos núcleos se ahorran frente a un procesador por pantalla.
+#
+#   python benchmarks/bench_recinto.py [--repeticiones 5] [--limite-ms 50]
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.recinto import planificar_recinto
+
+
+def recinto_sintetico(cantidad, semilla=1):
+    azar = random.Random(semilla)
+    pantallas = []
+    for i in range(cantidad):
+        pantallas.append({
+            "nombre": f"Superficie {i + 1}",
+            "req_w": azar.choice([3000.0, 6000.0, 10000.0, 20000.0, 40000.0]),
+            "req_h": azar.choice([1000.0, 2000.0, 4000.0, 6000.0]),
+            "pitch": azar.choice([1.9, 2.6, 3.9, 5.9]),
+            "entorno": azar.choice(["Indoor", "Outdoor"]),
+            "input_res": azar.choice(["HD (1080p)", "4K", "8K"]),
+            "num_entradas": azar.randint(1, 2),
+            "calidad": azar.choice(["SDR 8-bit", "HDR 10-bit"]),
+            "distancia_cable_m": azar.choice([30.0, 80.0, 150.0]),
+        })
+    return pantallas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia del planificador de recinto")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--limite-ms", type=float, default=50.0, help="límite para el modo heurístico")
+    parser.add_argument("--limite-exacto-s", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    peor = 0.0
+    for cantidad in (10, 20, 40, 60):
+        pantallas = recinto_sintetico(cantidad)
+        planificar_recinto(pantallas)
+        tiempos = []
+        for _ in range(args.repeticiones):
+            t0 = time.perf_counter()
+            plan = planificar_recinto(pantallas)
+            tiempos.append((time.perf_counter() - t0) * 1000)
+        med = statistics.median(tiempos)
+        peor = max(peor, med)
+        t0 = time.perf_counter()
+        exacto = planificar_recinto(pantallas, exacto=True, limite_s=args.limite_exacto_s)
+        t_exacto = (time.perf_counter() - t0) * 1000
+        f, fe = plan["factura"], exacto["factura"]
+        print(f"{cantidad:>2} pantallas: heurístico {med:6.1f} ms -> {f['nucleos']} núcleos / {f['tarjetas_salida']} salidas | "
+              f"exacto {t_exacto:6.0f} ms -> {fe['nucleos']} / {fe['tarjetas_salida']}{' (óptimo)' if exacto['optimo'] else ''} | "
+              f"cota {plan['cota_nucleos']} | por separado {plan['sin_compartir']['nucleos']} núcleos")
+    if peor > args.limite_ms:
+        print(f"[!] Latencia por encima de {args.limite_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+# ==========================================
+# SUITE DE REGRESIÓN: VALORES GOLDEN Y TIEMPOS
+# ==========================================
+# Corre sobre proyectos representativos (FIXTURES) y controla dos cosas:
+#   - Valores golden: raw completo de calculate_project, reporte de texto y
+#     CSV de cada proyecto contra datos/golden_regresion.json. Cualquier
+#     diferencia falla: una optimización no puede cambiar resultados.
+#   - Tiempos: cada calculadora por separado (_calcular_configuracion,
+#     generar_opciones, LedScreenProc, LedPowerCalc, LedRiggingCalc,
+#     LedSparesCalc), formato_latam, generar_texto_reporte,
+#     generar_csv_reporte, calculate_project sin caché y la corrida completa
+#     de app_led.py sin navegador (streamlit.testing AppTest), contra
+#     datos/linea_base.json. Falla si un caso tarda más que su línea base x
+#     (1 + --umbral) y además la diferencia supera --piso-us: en casos de
+#     pocos µs el ruido de la máquina solo ya llega al umbral relativo.
+# Cada caso se mide en --rondas rondas intercaladas (todos los casos por
+# ronda) y se compara la mediana, así un pico de carga afecta a una ronda y
+# no decide el resultado.
+# Los tiempos se guardan junto con el de un bucle de referencia en Python puro
+# y se escalan por él al comparar, para que la línea base sirva en otra
+# máquina más rápida o más lenta. Los tiempos de la app se toman con los
+# paneles a pedido (Monte Carlo, temporada de repuestos) apagados, que es lo
+# que paga cada clic. La línea base no se regraba para absorber una
+# regresión: si un cambio vuelve más lenta la app, se arregla el cambio.
+# --actualizar-linea-base sólo agrega los casos que faltan; para regrabar
+# uno existente (p. ej. tras una optimización) hay que nombrarlo con --regrabar.
+#
+#   python benchmarks/bench_regresion.py [--umbral 0.5] [--piso-us 50] [--rondas 3] [--sin-app]
+#   python benchmarks/bench_regresion.py --actualizar-linea-base [--regrabar "*/generar_csv_reporte"]
+#   python benchmarks/bench_regresion.py --actualizar-golden   (sólo si el cambio de resultados es intencional)
+import argparse
+import fnmatch
+import json
+import os
+import statistics
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from ledscreencalc.formato import formato_latam
+from ledscreencalc.proyecto import (_calcular_cacheado, calculadora_energia, calculadora_hardware, calculadora_izaje,
+                                    calculadora_procesamiento, calculadora_repuestos, calculate_project,
+                                    construir_calculadoras, normalizar_spec)
+from ledscreencalc.reportes import generar_csv_reporte, generar_texto_reporte
+
+DATOS = os.path.join(RAIZ, "benchmarks", "datos")
+ARCHIVO_GOLDEN = os.path.join(DATOS, "golden_regresion.json")
+ARCHIVO_LINEA_BASE = os.path.join(DATOS, "linea_base.json")
+
+FIXTURES = {
+    "interior_chico": {"uso": "Cine", "entorno": "Indoor", "req_w": 3000, "req_h": 2000, "pitch": 1.9,
+                       "dist_vis_m": 4},
+    "estadio_exterior": {"uso": "Publicidad", "entorno": "Outdoor", "contenido": "Video", "req_w": 60000,
+                         "req_h": 8000, "pitch": 10.0, "dist_vis_m": 60, "voltaje": 380, "distancia_cable_m": 250.0,
+                         "cab_peso_kg": 28.0},
+    "entrada_16k": {"uso": "TV", "req_w": 24000, "req_h": 6000, "pitch": 1.5, "input_res": "16K",
+                    "puerto": "HDMI 2.1", "calidad": "HDR 12-bit", "refresh_rate_hz": 7680.0,
+                    "shutter_speed_str": "172.8°", "fps_video": 24},
+    "muchas_entradas": {"uso": "Publicidad", "req_w": 16000, "req_h": 4500, "pitch": 3.9, "num_entradas": 12,
+                        "input_res": "HD (1080p)", "puerto": "12G-SDI", "modo_repuestos": "confiabilidad",
+                        "disponibilidad_repuestos": 0.99, "dias_show": 5},
+    "marca_manual": {"uso": "Cine", "req_w": 7200, "req_h": 4000, "pitch": 2.5, "mod_res_w": 128, "mod_res_h": 64,
+                     "mod_w": 320, "mod_h": 160, "cab_w": 640, "cab_h": 480, "brillo": 1500},
+}
+NUMEROS_FORMATO = [0, 1, 12.5, -3.25, 1234.5678, 98765432.1, 0.004, 3840, 1e9 / 7]
+
+
+def _json(datos):
+    # Raw comparable: MappingProxyType a dict y tuplas a listas
+    return json.loads(json.dumps(datos, ensure_ascii=False, default=dict))
+
+
+def resultados_golden():
+    salida = {}
+    for nombre, spec in FIXTURES.items():
+        s, res_hw, proc, pwr, rig, rep = construir_calculadoras(spec)
+        salida[nombre] = {
+            "raw": _json(calculate_project(spec).raw),
+            "txt": generar_texto_reporte(s["req_w"], s["req_h"], res_hw, proc, pwr, rig, rep),
+            "csv": generar_csv_reporte(s["req_w"], s["req_h"], res_hw, proc, pwr, rig, rep),
+        }
+    return salida
+
+
+def _diferencias(esperado, actual, ruta=""):
+    if isinstance(esperado, dict) and isinstance(actual, dict):
+        for k in sorted(set(esperado) | set(actual)):
+            yield from _diferencias(esperado.get(k, "<falta>"), actual.get(k, "<falta>"), f"{ruta}/{k}")
+    elif esperado != actual:
+        yield f"{ruta or '/'}: {esperado!r} -> {actual!r}"
+
+
+def comparar_golden(esperado, actual):
+    fallas = []
+    for nombre in sorted(set(esperado) | set(actual)):
+        if nombre not in esperado or nombre not in actual:
+            fallas.append(f"{nombre}: proyecto sin valores golden (use --actualizar-golden)")
+            continue
+        fallas += [f"{nombre} raw{d}" for d in _diferencias(esperado[nombre]["raw"], actual[nombre]["raw"])]
+        for clave in ("txt", "csv"):
+            if esperado[nombre][clave] != actual[nombre][clave]:
+                a, b = esperado[nombre][clave].splitlines(), actual[nombre][clave].splitlines()
+                linea = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+                fallas.append(f"{nombre} {clave}: difiere en la línea {linea + 1}")
+    return fallas
+
+
+def cronometrar(funcion, minimo_s=0.1, repeticiones=5):
+    # Mejor promedio por llamada (s) de varias tandas de al menos minimo_s
+    n, dt = 1, 0.0
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            funcion()
+        dt = time.perf_counter() - t0
+        if dt >= minimo_s:
+            break
+        n *= 2 if dt <= 0 else max(2, min(10, int(minimo_s / dt) + 1))
+    mejor = dt / n
+    for _ in range(repeticiones - 1):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            funcion()
+        mejor = min(mejor, (time.perf_counter() - t0) / n)
+    return mejor
+
+
+def _referencia():
+    total = 0
+    for i in range(200000):
+        total += i * i % 7
+    return total
+
+
+def _procesamiento(s, base):
+    proc = calculadora_procesamiento(s, base)
+    return proc.calcular_procesamiento(), proc.calcular_hardware_procesador()
+
+
+def casos_calculo():
+    casos = {"formato_latam": lambda: [formato_latam(v, d) for v in NUMEROS_FORMATO for d in (0, 2)]}
+    for nombre, spec in FIXTURES.items():
+        s = normalizar_spec(spec)
+        hw = calculadora_hardware(s)
+        s, res_hw, proc, pwr, rig, rep = construir_calculadoras(s)
+        base = res_hw["Opcion 1 (Ideal)"]["raw"]
+        datos = (s["req_w"], s["req_h"], res_hw, proc, pwr, rig, rep)
+        casos.update({
+            f"{nombre}/_calcular_configuracion": lambda hw=hw, b=base: hw._calcular_configuracion(b["columnas"], b["filas"]),
+            f"{nombre}/LEDSCREENCALC": lambda s=s: calculadora_hardware(s).generar_opciones(),
+            f"{nombre}/LedScreenProc": lambda s=s, b=base: _procesamiento(s, b),
+            f"{nombre}/LedPowerCalc": lambda s=s, b=base: calculadora_energia(s, b).calcular_energia_y_clima(),
+            f"{nombre}/LedRiggingCalc": lambda s=s, b=base: calculadora_izaje(s, b).calcular_izaje(),
+            f"{nombre}/LedSparesCalc": lambda s=s, b=base: calculadora_repuestos(s, b).calcular_repuestos(),
+            f"{nombre}/generar_texto_reporte": lambda d=datos: generar_texto_reporte(*d),
+            f"{nombre}/generar_csv_reporte": lambda d=datos: generar_csv_reporte(*d),
+            f"{nombre}/calculate_project": lambda s=s: (_calcular_cacheado.cache_clear(), calculate_project(s)),
+        })
+    return casos
+
+
+def tiempos_app():
+    # Corrida completa de app_led.py sin navegador: la primera y una
+    # re-ejecución tras cambiar un widget (lo que hace Streamlit en cada clic)
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(RAIZ)
+    t0 = time.perf_counter()
+    at = AppTest.from_file(os.path.join(RAIZ, "app_led.py"), default_timeout=60).run()
+    inicial = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(f"app_led.py falló: {at.exception[0].value}")
+    cambios = []
+    for entorno in ("Outdoor", "Indoor", "Outdoor"):
+        t0 = time.perf_counter()
+        at.sidebar.radio[0].set_value(entorno).run()
+        cambios.append(time.perf_counter() - t0)
+        if at.exception:
+            raise RuntimeError(f"app_led.py falló al re-ejecutar: {at.exception[0].value}")
+    return {"app/corrida_inicial": inicial, "app/rerun_widget": min(cambios)}
+
+
+def _duracion(segundos):
+    return f"{segundos * 1000:.1f} ms" if segundos >= 1e-3 else f"{segundos * 1e6:.1f} µs"
+
+
+def _leer(ruta):
+    if not os.path.exists(ruta):
+        return None
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _escribir(ruta, datos):
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Valores golden y regresiones de tiempo de todas las calculadoras")
+    parser.add_argument("--umbral", type=float, default=0.5, help="tolerancia sobre la línea base (0.5 = +50%%)")
+    parser.add_argument("--sin-app", action="store_true", help="no corre app_led.py con AppTest")
+    parser.add_argument("--piso-us", type=float, default=50.0, help="diferencia absoluta mínima (µs) para contar una regresión")
+    parser.add_argument("--rondas", type=int, default=3, help="rondas intercaladas por caso; se compara la mediana")
+    parser.add_argument("--actualizar-linea-base", action="store_true", help="agrega a la línea base los casos que faltan")
+    parser.add_argument("--regrabar", action="append", default=[], metavar="PATRÓN",
+                        help="con --actualizar-linea-base, regraba también los casos que coinciden (fnmatch)")
+    parser.add_argument("--actualizar-golden", action="store_true")
+    args = parser.parse_args(argv)
+    codigo = 0
+
+    actual = resultados_golden()
+    if args.actualizar_golden:
+        _escribir(ARCHIVO_GOLDEN, actual)
+        print(f"Valores golden guardados en {ARCHIVO_GOLDEN}")
+    else:
+        esperado = _leer(ARCHIVO_GOLDEN)
+        fallas = ["no hay valores golden (use --actualizar-golden)"] if esperado is None else comparar_golden(esperado, actual)
+        for falla in fallas[:40]:
+            print(f"[!] Golden: {falla}")
+        if fallas:
+            codigo = 1
+        else:
+            print(f"Valores golden OK ({len(actual)} proyectos)")
+
+    # Rondas intercaladas: en cada una, la referencia y todos los casos
+    casos = casos_calculo()
+    referencias, muestras = [], {nombre: [] for nombre in casos}
+    for _ in range(args.rondas):
+        referencias.append(cronometrar(_referencia, repeticiones=3))
+        for nombre, f in casos.items():
+            muestras[nombre].append(cronometrar(f, repeticiones=3))
+    referencias.append(cronometrar(_referencia, repeticiones=3))
+    referencia = statistics.median(referencias)
+    tiempos = {nombre: statistics.median(m) for nombre, m in muestras.items()}
+    if not args.sin_app:
+        tiempos.update(tiempos_app())
+
+    base = _leer(ARCHIVO_LINEA_BASE) or {"referencia_s": referencia, "tiempos_s": {}}
+    escala = referencia / base["referencia_s"]
+    if args.actualizar_linea_base:
+        # Los casos se guardan en la escala de la referencia ya grabada
+        nuevos = {nombre: t / escala for nombre, t in tiempos.items()
+                  if nombre not in base["tiempos_s"] or any(fnmatch.fnmatch(nombre, p) for p in args.regrabar)}
+        base["tiempos_s"].update(nuevos)
+        _escribir(ARCHIVO_LINEA_BASE, base)
+        print(f"Línea base: {len(nuevos)} caso(s) grabados en {ARCHIVO_LINEA_BASE}")
+    piso = args.piso_us / 1e6
+
+    def lento(nombre):
+        b = base["tiempos_s"].get(nombre)
+        return b is not None and tiempos[nombre] > b * escala * (1 + args.umbral) and tiempos[nombre] - b * escala > piso
+
+    # Una ronda dura varios segundos y en máquinas compartidas la carga cambia
+    # entre la referencia y el caso: los casos marcados se vuelven a medir
+    # cada uno justo después de su propia referencia, y cuenta esa mediana
+    for nombre, f in casos.items():
+        if lento(nombre):
+            pares = []
+            for _ in range(3):
+                ref_local = cronometrar(_referencia, repeticiones=3)
+                pares.append(cronometrar(f, minimo_s=0.3, repeticiones=3) * referencia / ref_local)
+            tiempos[nombre] = statistics.median(pares)
+    # Sólo el rerun se vuelve a medir: una segunda corrida inicial en el mismo
+    # proceso ya tiene todo importado y saldría más rápida de lo real
+    for _ in range(3 if "app/rerun_widget" in tiempos else 0):
+        if not lento("app/rerun_widget"):
+            break
+        tiempos["app/rerun_widget"] = min(tiempos["app/rerun_widget"], tiempos_app()["app/rerun_widget"])
+    print(f"{'caso':<44} {'actual':>11} {'base':>11} {'relación':>9}   (escala de máquina {escala:.2f})")
+    regresiones = 0
+    for nombre, t in tiempos.items():
+        b = base["tiempos_s"].get(nombre)
+        if b is None:
+            print(f"{nombre:<44} {_duracion(t):>11} {'-':>11} {'-':>9}   sin línea base")
+            continue
+        relacion = t / (b * escala)
+        marca = "  [!] REGRESIÓN" if lento(nombre) else ""
+        regresiones += bool(marca)
+        print(f"{nombre:<44} {_duracion(t):>11} {_duracion(b * escala):>11} {relacion:>8.2f}x{marca}")
+    if regresiones:
+        print(f"[!] {regresiones} caso(s) más lentos que la línea base + {args.umbral:.0%}")
+        codigo = 1
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# ==========================================
+# BENCHMARK: REPUESTOS DE FLOTA POR MONTE CARLO
+# ==========================================
+# Tiempo de temporada_repuestos sobre una temporada sintética de shows
+# superpuestos (60 a 120 shows de 1 a 7 días en un año) con la cantidad de
+# simulaciones necesaria para superar --show-dias show-días simulados, y
+# ahorro de capital del pool compartido frente a un kit por show.
+# Objetivo: 1M+ show-días en pocos segundos.
+#
+#   python benchmarks/bench_repuestos.py [--show-dias 1000000] [--limite-s 5]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledscreencalc.repuestos import temporada_repuestos
+
+TEMPORADAS = [60, 120]
+
+
+def temporada(shows, azar):
+    return [{
+        "nombre": f"Show {i + 1}",
+        "inicio": int(azar.integers(0, 358)),
+        "dias": int(azar.integers(1, 8)),
+        "modulos": int(azar.integers(200, 4000)),
+        "rcards": int(azar.integers(50, 1000)),
+        "psu": int(azar.integers(50, 1000)),
+    } for i in range(shows)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Velocidad del Monte Carlo de repuestos de flota")
+    parser.add_argument("--show-dias", type=int, default=1000000)
+    parser.add_argument("--limite-s", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    azar = np.random.default_rng(1)
+    peor = 0.0
+    for cantidad in TEMPORADAS:
+        shows = temporada(cantidad, azar)
+        simulaciones = -(-args.show_dias // sum(s["dias"] for s in shows))
+        t0 = time.perf_counter()
+        plan = temporada_repuestos(shows, simulaciones=simulaciones)
+        dt = time.perf_counter() - t0
+        peor = max(peor, dt)
+        s, sc = plan["repuestos"], plan["sin_compartir"]
+        print(f"{cantidad:>4} shows (hasta {plan['concurrencia_max']} simultáneos), {plan['show_dias_simulados']:>9} show-días: "
+              f"{dt:5.2f} s | pool {s['modulos']}/{s['rcards']}/{s['psu']} vs kit por show {sc['modulos']}/{sc['rcards']}/{sc['psu']} | "
+              f"ahorro USD {plan['ahorro_usd']:.0f} ({plan['ahorro_usd'] / plan['capital_sin_compartir_usd']:.0%}) | "
+              f"disponibilidad {plan['disponibilidad']:.3f}")
+    if peor > args.limite_s:
+        print(f"[!] Más lento que {args.limite_s:g} s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
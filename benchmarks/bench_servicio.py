@@ -0,0 +1,115 @@
+# ==========================================
+# BENCHMARK: CARGA DEL SERVICIO JSON LOCAL
+# ==========================================
+# Prueba de carga contra localhost: levanta `python -m ledscreencalc servir`
+# en otro proceso (o usa uno ya levantado con --host/--puerto) y lo golpea con
+# --conexiones clientes asyncio keep-alive. Las especificaciones salen de un
+# pool de --distintas variantes repartidas entre las secciones, así que hay
+# fallos de caché al principio y aciertos después; --lote N manda además un
+# pedido de lote cada 50. Reporta pedidos/s y latencia P50/P99.
+# Objetivo: miles de pedidos por segundo en una sola máquina.
+#
+#   python benchmarks/bench_servicio.py [--pedidos 20000] [--conexiones 64] [--min-rps 2000]
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SECCIONES = ["proyecto", "layout", "procesamiento", "energia", "izaje", "repuestos"]
+
+
+def pedidos_sinteticos(distintas, lote, azar):
+    specs = [{
+        "req_w": int(azar.integers(2000, 30000)),
+        "req_h": int(azar.integers(1000, 10000)),
+        "pitch": float(azar.choice([1.9, 2.6, 2.9, 3.9, 4.8])),
+        "entorno": str(azar.choice(["Indoor", "Outdoor"])),
+    } for _ in range(distintas)]
+    cuerpos = []
+    for i, spec in enumerate(specs):
+        cuerpos.append((f"/v1/{SECCIONES[i % len(SECCIONES)]}", json.dumps(spec).encode()))
+    if lote:
+        elegidos = [specs[int(j)] for j in azar.integers(0, distintas, lote)]
+        cuerpos.append(("/v1/lote/energia", json.dumps(elegidos).encode()))
+    return cuerpos
+
+
+async def cliente(host, puerto, cuerpos, orden, latencias, errores):
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    for i in orden:
+        ruta, cuerpo = cuerpos[i]
+        t0 = time.perf_counter()
+        escritor.write(b"POST %s HTTP/1.1\r\nHost: %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n"
+                       % (ruta.encode(), host.encode(), len(cuerpo)) + cuerpo)
+        cabecera = await lector.readuntil(b"\r\n\r\n")
+        largo = int(cabecera.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+        await lector.readexactly(largo)
+        latencias.append(time.perf_counter() - t0)
+        if not cabecera.startswith(b"HTTP/1.1 200"):
+            errores.append(cabecera.split(b"\r\n")[0].decode())
+    escritor.close()
+
+
+async def carga(host, puerto, cuerpos, pedidos, conexiones, lote, azar):
+    orden = azar.integers(0, len(cuerpos) - (1 if lote else 0), pedidos)
+    if lote:
+        orden[::50] = len(cuerpos) - 1
+    latencias, errores = [], []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(cliente(host, puerto, cuerpos, orden[k::conexiones].tolist(), latencias, errores)
+                           for k in range(conexiones)))
+    return time.perf_counter() - t0, np.asarray(latencias), errores
+
+
+def levantar(cache):
+    proceso = subprocess.Popen([sys.executable, "-m", "ledscreencalc", "servir", "--puerto", "0", "--cache", str(cache)],
+                               cwd=RAIZ, stdout=subprocess.PIPE, text=True)
+    linea = proceso.stdout.readline()
+    if not linea:
+        proceso.kill()
+        raise RuntimeError("El servicio no arrancó")
+    return proceso, int(linea.rsplit(":", 1)[1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio JSON contra localhost")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, help="servicio ya levantado; si se omite se levanta uno")
+    parser.add_argument("--pedidos", type=int, default=20000)
+    parser.add_argument("--conexiones", type=int, default=64)
+    parser.add_argument("--distintas", type=int, default=500, help="especificaciones distintas en el pool")
+    parser.add_argument("--lote", type=int, default=100, help="especificaciones por pedido de lote (0 = sin lotes)")
+    parser.add_argument("--cache", type=int, default=4096)
+    parser.add_argument("--min-rps", type=float, default=2000.0)
+    args = parser.parse_args(argv)
+
+    azar = np.random.default_rng(1)
+    cuerpos = pedidos_sinteticos(args.distintas, args.lote, azar)
+    proceso, puerto = (None, args.puerto) if args.puerto else levantar(args.cache)
+    try:
+        dt, lat, errores = asyncio.run(carga(args.host, puerto, cuerpos, args.pedidos, args.conexiones, args.lote, azar))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+    rps = lat.size / dt
+    p50, p99 = np.percentile(lat, [50, 99]) * 1000
+    print(f"{lat.size} pedidos en {dt:.2f} s con {args.conexiones} conexiones: {rps:,.0f} pedidos/s | "
+          f"latencia P50 {p50:.2f} ms, P99 {p99:.2f} ms | {len(errores)} error(es)")
+    if errores:
+        print(f"[!] Primer error: {errores[0]}")
+        return 1
+    if rps < args.min_rps:
+        print(f"[!] Menos de {args.min_rps:g} pedidos/s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# Núcleo de cálculo de LEDSCREENCALC, importable sin Streamlit ni pandas.
+# Los submódulos se cargan bajo demanda (PEP 562) para que un worker que sólo
+# necesita una clase no pague el coste de importar el resto del paquete.
+import importlib
+
+_EXPORTS = {
+    "formato_latam": "formato",
+    "LEDSCREENCALC": "calculos",
+    "LedScreenProc": "calculos",
+    "LedPowerCalc": "calculos",
+    "LedRiggingCalc": "calculos",
+    "LedSparesCalc": "calculos",
+    "generar_texto_reporte": "reportes",
+    "recopilar_datos_tabulares": "reportes",
+    "generar_csv_reporte": "reportes",
+    "SPEC_DEFAULTS": "proyecto",
+    "normalizar_spec": "proyecto",
+    "validar_spec": "proyecto",
+    "calculadora_hardware": "proyecto",
+    "construir_calculadoras": "proyecto",
+    "calculate_project": "proyecto",
+    "ResultadoProyecto": "resultado",
+    "GrafoCalculo": "grafo",
+    "barrer_configuraciones": "barrido",
+    "barrer_candidatos": "barrido",
+    "tabla_modelos": "barrido",
+    "resolver_mosaico": "mosaico",
+    "familia_estandar": "mosaico",
+    "tipos_desde_modelos": "mosaico",
+    "CatalogoProductos": "catalogo",
+    "spec_desde_producto": "catalogo",
+    "mapear_puertos": "mapeo",
+    "mapa_desde_resultado": "mapeo",
+    "MapaPuertos": "mapeo",
+    "planificar_recinto": "recinto",
+    "analizar_contenido": "contenido",
+    "analizar_para_resultado": "contenido",
+    "asignar_circuitos": "distribucion",
+    "distribucion_desde_resultado": "distribucion",
+    "resolver_rig": "estructura",
+    "rig_muro": "estructura",
+    "rig_desde_resultado": "estructura",
+    "kit_show": "repuestos",
+    "mapa_sincronizacion": "camara",
+    "analizar_incertidumbre": "incertidumbre",
+    "temporada_repuestos": "repuestos",
+    "ServicioCalculo": "servicio",
+    "servir": "servicio",
+    "PERFIL": "perfil",
+    "Perfilador": "perfil",
+    "abrir_escritor": "exportar",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(nombre):
+    modulo = _EXPORTS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,341 @@
+# Punto de entrada de línea de comandos:
+#   python -m ledscreencalc lote proyectos.csv -o resultados.csv -j 8
+#   python -m ledscreencalc lote proyectos.jsonl -o resultados.xlsx --formato-salida xlsx
+#   python -m ledscreencalc mapa req_w=60000 req_h=12000 pitch=3.9 -o mapa.csv
+#   python -m ledscreencalc recinto pantallas.csv --exacto
+#   python -m ledscreencalc contenido spot.y4m req_w=12000 req_h=6000 entorno=Outdoor -o potencia.csv
+#   python -m ledscreencalc distro req_w=20000 req_h=8000 --breaker 32 -o circuitos.csv
+#   python -m ledscreencalc rig req_w=12000 req_h=6000 --motores 6 --trusses 2 -o puntos.csv
+#   python -m ledscreencalc repuestos temporada.csv --disponibilidad 0.99 --reparacion 10
+#   python -m ledscreencalc incertidumbre req_w=12000 req_h=6000 --muestras 100000
+#   python -m ledscreencalc servir --puerto 8765 --cache 4096
+#   python -m ledscreencalc catalogo catalogo.db --importar skus.csv
+#   python -m ledscreencalc catalogo catalogo.db --entorno Outdoor --pitch-max 3.9 --brillo-min 5000 --medida 12000 6000 --tolerancia 0.02
+import argparse
+import csv
+import json
+import sys
+
+
+def _cmd_lote(args):
+    from .lote import ejecutar_lote
+
+    total, errores = ejecutar_lote(args.entrada, args.salida, trabajadores=args.trabajadores, tam_bloque=args.bloque,
+                                   formato_entrada=args.formato_entrada, formato_salida=args.formato_salida)
+    print(f"{total} proyecto(s) procesados, {errores} con error.", file=sys.stderr)
+    return 0 if errores == 0 or not args.estricto else 1
+
+
+def _campo_valor(texto):
+    campo, igual, valor = texto.partition("=")
+    if not igual:
+        raise argparse.ArgumentTypeError(f"se esperaba campo=valor (recibido {texto!r})")
+    return campo, valor
+
+
+def _cmd_mapa(args):
+    from .lote import spec_desde_fila
+    from .mapeo import mapa_desde_resultado
+    from .proyecto import calculate_project, validar_spec
+
+    try:
+        mapa = mapa_desde_resultado(calculate_project(validar_spec(spec_desde_fila(dict(args.campos)))), opcion=args.opcion)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    v = mapa.valores()
+    print(f"{v['puertos']} puerto(s) x {v['gabinetes_por_puerto']} gabinete(s), recorrido {v['recorrido']} desde {v['esquina']}, "
+          f"cable {v['cable_total_m']:.1f} m ({v['cable_saltos_m']:.1f} m saltos + {v['cable_tendidos_m']:.1f} m tendidos)",
+          file=sys.stderr)
+    if args.salida == "-":
+        mapa.escribir_csv(sys.stdout)
+    else:
+        with open(args.salida, "w", newline="", encoding="utf-8") as f:
+            mapa.escribir_csv(f)
+    return 0
+
+
+def _cmd_recinto(args):
+    from .lote import leer_filas, spec_desde_fila
+    from .recinto import planificar_recinto
+
+    try:
+        pantallas = []
+        for fila in leer_filas(args.entrada, args.formato_entrada):
+            if isinstance(fila, Exception):
+                raise ValueError(fila)
+            nombre = fila.get("nombre") or fila.get("id")
+            spec = spec_desde_fila({k: v for k, v in fila.items() if k != "nombre"})
+            pantallas.append(dict(spec, nombre=nombre))
+        plan = planificar_recinto(pantallas, exacto=args.exacto, limite_s=args.limite_s)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    f = plan["factura"]
+    print(f"{len(plan['pantallas'])} pantalla(s): {f['nucleos']} núcleo(s), {f['tarjetas_salida']} tarjeta(s) de salida "
+          f"(por separado: {plan['sin_compartir']['nucleos']} núcleo(s)){'' if plan['optimo'] else ' [heurístico]'}",
+          file=sys.stderr)
+    json.dump(plan, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    return 0
+
+
+def _cmd_contenido(args):
+    from .contenido import analizar_para_resultado
+    from .lote import spec_desde_fila
+    from .proyecto import calculate_project, validar_spec
+
+    try:
+        resultado = calculate_project(validar_spec(spec_desde_fila(dict(args.campos))))
+        fuente = sys.stdin.buffer if args.fuente == "-" else args.fuente
+        a = analizar_para_resultado(fuente, resultado, fps=args.fps, consumo_reposo=args.reposo,
+                                    formato=args.formato, ancho=args.ancho, alto=args.alto)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    print(f"{a['cuadros']} cuadro(s), {a['duracion_s']:.1f} s | pico {a['pot_pico_w'] / 1000:.2f} kW, "
+          f"P95 {a['pot_p95_w'] / 1000:.2f} kW, promedio {a['pot_prom_w'] / 1000:.2f} kW "
+          f"(factor_promedio={a['factor_promedio']:.3f}, máx. {resultado.raw['energia']['pot_max_w'] / 1000:.2f} kW)",
+          file=sys.stderr)
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", newline="", encoding="utf-8")
+    try:
+        escritor = csv.writer(salida, delimiter=";")
+        escritor.writerow(["cuadro", "tiempo_s", "apl", "pot_w", "btu_hr"])
+        escritor.writerows(zip(range(1, a["cuadros"] + 1), a["tiempo_s"].tolist(), a["apl"].tolist(),
+                               a["pot_w"].tolist(), a["btu_hr"].tolist()))
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+
+def _cmd_distro(args):
+    from .distribucion import distribucion_desde_resultado
+    from .lote import spec_desde_fila
+    from .proyecto import calculate_project, validar_spec
+
+    try:
+        resultado = calculate_project(validar_spec(spec_desde_fila(dict(args.campos))))
+        plan = distribucion_desde_resultado(resultado, opcion=args.opcion, breaker_a=args.breaker,
+                                            factor_carga=args.factor_carga, recorrido=args.recorrido)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    v = plan.valores()
+    fases = " / ".join(f"{a:.1f}" for a in v["corriente_fase_a"])
+    print(f"{v['circuitos']} circuito(s) de {v['breaker_a']} A en {v['distros']} distro(s) | L1/L2/L3: {fases} A | "
+          f"desbalance {v['desbalance_pct']:.2f}%, neutro {v['corriente_neutro_a']:.2f} A", file=sys.stderr)
+    if args.salida == "-":
+        plan.escribir_csv(sys.stdout)
+    else:
+        with open(args.salida, "w", newline="", encoding="utf-8") as f:
+            plan.escribir_csv(f)
+    return 0
+
+
+def _cmd_rig(args):
+    from .estructura import rig_desde_resultado
+    from .lote import spec_desde_fila
+    from .proyecto import calculate_project, validar_spec
+
+    try:
+        resultado = calculate_project(validar_spec(spec_desde_fila(dict(args.campos))))
+        rig = rig_desde_resultado(resultado, opcion=args.opcion, motores=args.motores, voladizo_m=args.voladizo,
+                                  trusses=args.trusses)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    v = rig.valores()
+    print(f"{v['puntos_colgado']} punto(s) | carga total {v['carga_total_kg']:.1f} kg | reacción máx {v['reaccion_max_kg']:.1f} kg "
+          f"(+{v['sobrecarga_vs_parejo']:.1%} vs parejo) | momento máx {v['momento_max_knm']:.2f} kN·m", file=sys.stderr)
+    if args.salida == "-":
+        rig.escribir_csv(sys.stdout)
+    else:
+        with open(args.salida, "w", newline="", encoding="utf-8") as f:
+            rig.escribir_csv(f)
+    return 0
+
+
+def _cmd_repuestos(args):
+    from .lote import leer_filas
+    from .repuestos import temporada_repuestos
+
+    try:
+        shows = []
+        for fila in leer_filas(args.entrada, args.formato_entrada):
+            if isinstance(fila, Exception):
+                raise ValueError(fila)
+            show = dict(fila, nombre=fila.get("nombre") or fila.get("id"))
+            for campo in ("dias", "modulos", "rcards", "psu"):
+                if isinstance(show.get(campo), str):
+                    show[campo] = int(show[campo] or 0)
+            if isinstance(show["inicio"], str) and show["inicio"].strip().lstrip("-").isdigit():
+                show["inicio"] = int(show["inicio"])
+            shows.append(show)
+        plan = temporada_repuestos(shows, disponibilidad=args.disponibilidad, simulaciones=args.simulaciones,
+                                   reparacion_dias=args.reparacion, horas_dia=args.horas_dia, semilla=args.semilla)
+    except (ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    s, sc = plan["repuestos"], plan["sin_compartir"]
+    print(f"{plan['shows']} show(s), hasta {plan['concurrencia_max']} en simultáneo | pool: {s['modulos']} módulos, "
+          f"{s['rcards']} receptoras, {s['psu']} fuentes (kit por show: {sc['modulos']}/{sc['rcards']}/{sc['psu']}) | "
+          f"USD {plan['capital_usd']:.0f} vs {plan['capital_sin_compartir_usd']:.0f} | "
+          f"{plan['disponibilidad']:.2%} de shows sin faltantes en {plan['show_dias_simulados']} show-días simulados",
+          file=sys.stderr)
+    json.dump(plan, sys.stdout, ensure_ascii=False, indent=2, default=str)
+    print()
+    return 0
+
+
+def _cmd_incertidumbre(args):
+    from .incertidumbre import analizar_incertidumbre
+    from .lote import spec_desde_fila
+
+    try:
+        mc = analizar_incertidumbre(spec_desde_fila(dict(args.campos)), muestras=args.muestras, semilla=args.semilla,
+                                    viga=not args.sin_viga)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    r = mc["resumen"]
+    print(f"{mc['n']} muestras | potencia P50 {r['pot_max_kw']['p50']:.2f} kW, P95 {r['pot_max_kw']['p95']:.2f} kW | "
+          f"carga total P99 {r['carga_estatica_kg']['p99']:.0f} kg | carga por motor P95 "
+          f"{r.get('reaccion_max_kg', r['carga_por_punto_kg'])['p95']:.0f} kg", file=sys.stderr)
+    json.dump({"n": mc["n"], "kit_cubre_show": mc["kit_cubre_show"], "resumen": r}, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    return 0
+
+
+def _cmd_servir(args):
+    from .servicio import servir
+
+    servir(args.host, args.puerto, tamano_cache=args.cache, max_lote=args.max_lote)
+    return 0
+
+
+def _cmd_catalogo(args):
+    from .catalogo import CatalogoProductos
+
+    with CatalogoProductos(args.base) as catalogo:
+        for ruta in args.importar or ():
+            catalogo.importar_csv(ruta, separador=args.separador)
+        if args.importar:
+            print(f"{len(catalogo)} producto(s) en el catálogo.", file=sys.stderr)
+            return 0
+        req_w, req_h = args.medida or (None, None)
+        productos = catalogo.buscar(entorno=args.entorno, req_w=req_w, req_h=req_h, tolerancia=args.tolerancia,
+                                    limite=args.limite, pitch_min=args.pitch_min, pitch_max=args.pitch_max,
+                                    brillo_min=args.brillo_min, peso_max=args.peso_max, watts_max=args.watts_max)
+    escritor = csv.writer(sys.stdout, delimiter=";")
+    columnas = list(productos[0]) if productos else []
+    escritor.writerow(columnas)
+    for producto in productos:
+        escritor.writerow([producto[c] for c in columnas])
+    return 0 if productos else 1
+
+
+def main(argv=None):
+    from .exportar import FORMATOS
+
+    parser = argparse.ArgumentParser(prog="python -m ledscreencalc", description="LEDSCREENCALC sin interfaz gráfica")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    lote = sub.add_parser("lote", help="Calcula un archivo CSV/JSONL de proyectos en paralelo")
+    lote.add_argument("entrada", help="CSV o JSONL con una especificación por fila ('-' = stdin)")
+    lote.add_argument("-o", "--salida", default="-", help="archivo de resultados ('-' = stdout)")
+    lote.add_argument("-j", "--trabajadores", type=int, default=None, help="procesos (por defecto, uno por núcleo)")
+    lote.add_argument("--bloque", type=int, default=64, help="proyectos por tarea enviada al pool")
+    lote.add_argument("--formato-entrada", choices=["csv", "jsonl"])
+    lote.add_argument("--formato-salida", choices=FORMATOS,
+                      help="por defecto según la extensión de --salida (.csv, .jsonl, .xlsx, .parquet)")
+    lote.add_argument("--estricto", action="store_true", help="código de salida 1 si alguna fila falla")
+    lote.set_defaults(func=_cmd_lote)
+
+    mapa = sub.add_parser("mapa", help="Asigna cada gabinete a un puerto y posición de cadena (CSV)")
+    mapa.add_argument("campos", nargs="*", type=_campo_valor, metavar="campo=valor", help="campos de la especificación (p. ej. req_w=60000)")
+    mapa.add_argument("--opcion", default="Opcion 1 (Ideal)", choices=["Opcion 1 (Ideal)", "Opcion 2 (Inferior)", "Opcion 3 (Superior)"])
+    mapa.add_argument("-o", "--salida", default="-", help="CSV del mapa ('-' = stdout)")
+    mapa.set_defaults(func=_cmd_mapa)
+
+    recinto = sub.add_parser("recinto", help="Empaqueta varias pantallas sobre procesadores compartidos (JSON)")
+    recinto.add_argument("entrada", help="CSV o JSONL con una pantalla por fila (columna opcional 'nombre')")
+    recinto.add_argument("--formato-entrada", choices=["csv", "jsonl"])
+    recinto.add_argument("--exacto", action="store_true", help="refina con búsqueda exacta (tiempo acotado)")
+    recinto.add_argument("--limite-s", type=float, default=2.0, help="tiempo máximo de la búsqueda exacta")
+    recinto.set_defaults(func=_cmd_recinto)
+
+    cont = sub.add_parser("contenido", help="Serie de potencia/BTU cuadro a cuadro según el contenido (CSV)")
+    cont.add_argument("fuente", help="Y4M, RGB24 crudo, directorio o patrón de imágenes ('-' = stdin)")
+    cont.add_argument("campos", nargs="*", type=_campo_valor, metavar="campo=valor", help="especificación de la pantalla")
+    cont.add_argument("--formato", choices=["y4m", "rgb", "imagenes"])
+    cont.add_argument("--ancho", type=int, help="ancho del RGB crudo (px)")
+    cont.add_argument("--alto", type=int, help="alto del RGB crudo (px)")
+    cont.add_argument("--fps", type=float, help="por defecto, el de la cabecera Y4M o 30")
+    cont.add_argument("--reposo", type=float, default=0.10, help="fracción de la potencia máxima consumida en negro")
+    cont.add_argument("-o", "--salida", default="-", help="CSV de la serie ('-' = stdout)")
+    cont.set_defaults(func=_cmd_contenido)
+
+    distro = sub.add_parser("distro", help="Asigna gabinetes a circuitos y fases (plan de distribución CSV)")
+    distro.add_argument("campos", nargs="*", type=_campo_valor, metavar="campo=valor", help="campos de la especificación")
+    distro.add_argument("--opcion", default="Opcion 1 (Ideal)", choices=["Opcion 1 (Ideal)", "Opcion 2 (Inferior)", "Opcion 3 (Superior)"])
+    distro.add_argument("--breaker", type=int, default=16, choices=[16, 32], help="amperes por circuito")
+    distro.add_argument("--factor-carga", type=float, default=0.8, help="fracción utilizable del breaker")
+    distro.add_argument("--recorrido", default="vertical", choices=["vertical", "horizontal"], help="sentido del power-link")
+    distro.add_argument("-o", "--salida", default="-", help="CSV del plan ('-' = stdout)")
+    distro.set_defaults(func=_cmd_distro)
+
+    rig = sub.add_parser("rig", help="Reacción por motor y flexión del truss (CSV de puntos de colgado)")
+    rig.add_argument("campos", nargs="*", type=_campo_valor, metavar="campo=valor", help="campos de la especificación")
+    rig.add_argument("--opcion", default="Opcion 1 (Ideal)", choices=["Opcion 1 (Ideal)", "Opcion 2 (Inferior)", "Opcion 3 (Superior)"])
+    rig.add_argument("--motores", type=int, default=None, help="motores por truss (por defecto, uno cada 3 m)")
+    rig.add_argument("--voladizo", type=float, default=0.5, help="distancia de los motores extremos a las puntas (m)")
+    rig.add_argument("--trusses", type=int, default=1, help="trusses paralelos que comparten cada bumper")
+    rig.add_argument("-o", "--salida", default="-", help="CSV de puntos de colgado ('-' = stdout)")
+    rig.set_defaults(func=_cmd_rig)
+
+    rep = sub.add_parser("repuestos", help="Pool de repuestos de una temporada de shows por Monte Carlo (JSON)")
+    rep.add_argument("entrada", help="CSV o JSONL con un show por fila: nombre, inicio (fecha ISO o día), dias, modulos, rcards, psu")
+    rep.add_argument("--formato-entrada", choices=["csv", "jsonl"])
+    rep.add_argument("--disponibilidad", type=float, default=0.95, help="fracción de shows que deben terminar sin faltantes")
+    rep.add_argument("--simulaciones", type=int, default=10000)
+    rep.add_argument("--reparacion", type=int, default=14, help="días hasta que una pieza fallada vuelve al pool")
+    rep.add_argument("--horas-dia", type=float, default=12.0, help="horas de operación por día de show")
+    rep.add_argument("--semilla", type=int, default=0)
+    rep.set_defaults(func=_cmd_repuestos)
+
+    mc = sub.add_parser("incertidumbre", help="Intervalos de confianza por Monte Carlo sobre toda la cadena (JSON)")
+    mc.add_argument("campos", nargs="*", type=_campo_valor, metavar="campo=valor", help="campos de la especificación")
+    mc.add_argument("--muestras", type=int, default=100000)
+    mc.add_argument("--semilla", type=int, default=0)
+    mc.add_argument("--sin-viga", action="store_true", help="no resuelve el truss como viga (no requiere SciPy)")
+    mc.set_defaults(func=_cmd_incertidumbre)
+
+    srv = sub.add_parser("servir", help="Servicio HTTP local con los cálculos como endpoints JSON")
+    srv.add_argument("--host", default="127.0.0.1")
+    srv.add_argument("--puerto", type=int, default=8765)
+    srv.add_argument("--cache", type=int, default=4096, help="respuestas guardadas en la caché LRU")
+    srv.add_argument("--max-lote", type=int, default=1000, help="especificaciones máximas por pedido de lote")
+    srv.set_defaults(func=_cmd_servir)
+
+    cat = sub.add_parser("catalogo", help="Importa o consulta el catálogo de gabinetes (SQLite)")
+    cat.add_argument("base", help="archivo SQLite del catálogo (se crea si no existe)")
+    cat.add_argument("--importar", action="append", metavar="CSV", help="agrega/actualiza SKUs desde un CSV")
+    cat.add_argument("--separador", default=",", help="separador del CSV a importar")
+    cat.add_argument("--entorno", choices=["Indoor", "Outdoor"])
+    cat.add_argument("--pitch-min", type=float)
+    cat.add_argument("--pitch-max", type=float)
+    cat.add_argument("--brillo-min", type=float)
+    cat.add_argument("--peso-max", type=float, help="kg por gabinete")
+    cat.add_argument("--watts-max", type=float, help="W/m² máximos")
+    cat.add_argument("--medida", type=float, nargs=2, metavar=("ANCHO", "ALTO"), help="medida solicitada en mm")
+    cat.add_argument("--tolerancia", type=float, help="desvío relativo máximo del ajuste (0.02 = 2%%)")
+    cat.add_argument("--limite", type=int, default=20)
+    cat.set_defaults(func=_cmd_catalogo)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
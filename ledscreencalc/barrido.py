@@ -0,0 +1,97 @@
+# ==========================================
+# MOTOR DE BARRIDO VECTORIZADO (NumPy)
+# ==========================================
+# Evalúa miles de combinaciones (ancho, alto, pitch, modelo de gabinete) con
+# operaciones de arreglo. Reproduce exactamente LEDSCREENCALC._calcular_configuracion
+# y generar_opciones, pero devuelve columnas numéricas sin formatear.
+import numpy as np
+
+MODOS = ("round", "floor", "ceil")
+
+# Gabinetes estándar usados cuando no hay datos de marca: (cab_w, cab_h, mod/cab W, mod/cab H)
+_ESTANDAR = {"Indoor": (500.0, 500.0, 2, 2), "Outdoor": (960.0, 960.0, 3, 3)}
+
+
+def _columnas_filas(exacto, modo):
+    if modo == "round":
+        # np.rint redondea al par más cercano, igual que round() de Python
+        n = np.rint(exacto)
+    elif modo == "floor":
+        n = np.floor(exacto)
+    elif modo == "ceil":
+        n = np.ceil(exacto)
+    else:
+        raise ValueError(f"Modo desconocido: {modo!r} (use uno de {MODOS})")
+    return np.maximum(1, n.astype(np.int64))
+
+
+def barrer_configuraciones(req_w, req_h, cab_w, cab_h, cab_res_w, cab_res_h, modulos_por_cab, modo="round"):
+    req_w, req_h, cab_w, cab_h = (np.asarray(a, dtype=np.float64) for a in (req_w, req_h, cab_w, cab_h))
+    cab_res_w, cab_res_h, modulos_por_cab = (np.asarray(a, dtype=np.int64) for a in (cab_res_w, cab_res_h, modulos_por_cab))
+
+    columnas = _columnas_filas(req_w / cab_w, modo)
+    filas = _columnas_filas(req_h / cab_h, modo)
+    return configuraciones(columnas, filas, cab_w, cab_h, cab_res_w, cab_res_h, modulos_por_cab)
+
+
+def configuraciones(columnas, filas, cab_w, cab_h, cab_res_w, cab_res_h, modulos_por_cab):
+    columnas = np.asarray(columnas, dtype=np.int64)
+    filas = np.asarray(filas, dtype=np.int64)
+    total_gabinetes = columnas * filas
+    ancho_fisico = columnas * np.asarray(cab_w, dtype=np.float64)
+    alto_fisico = filas * np.asarray(cab_h, dtype=np.float64)
+    res_total_w = columnas * np.asarray(cab_res_w, dtype=np.int64)
+    res_total_h = filas * np.asarray(cab_res_h, dtype=np.int64)
+    diag_mm = np.sqrt(ancho_fisico * ancho_fisico + alto_fisico * alto_fisico)
+    return {
+        "columnas": columnas,
+        "filas": filas,
+        "res_total_w": res_total_w,
+        "res_total_h": res_total_h,
+        "total_px": res_total_w * res_total_h,
+        "ancho_fisico": ancho_fisico,
+        "alto_fisico": alto_fisico,
+        "area_m2": (ancho_fisico / 1000) * (alto_fisico / 1000),
+        "diag_mm": diag_mm,
+        "diag_in": diag_mm / 25.4,
+        "total_gabinetes": total_gabinetes,
+        "total_modulos": total_gabinetes * np.asarray(modulos_por_cab, dtype=np.int64),
+    }
+
+
+def tabla_modelos(modelos):
+    # modelos: lista de dicts con "entorno" (modo Auto-Estándar) o con los datos de
+    # marca de LEDSCREENCALC (mod_res_w, mod_res_h, mod_w, mod_h, cab_w, cab_h).
+    n = len(modelos)
+    tabla = {
+        "cab_w": np.empty(n), "cab_h": np.empty(n),
+        "cab_res_w": np.zeros(n, dtype=np.int64), "cab_res_h": np.zeros(n, dtype=np.int64),
+        "modulos_por_cab": np.empty(n, dtype=np.int64), "manual": np.zeros(n, dtype=bool),
+    }
+    for i, m in enumerate(modelos):
+        if all(m.get(k) is not None for k in ("mod_res_w", "mod_res_h", "mod_w", "mod_h", "cab_w", "cab_h")):
+            mw, mh = int(m["cab_w"] // m["mod_w"]), int(m["cab_h"] // m["mod_h"])
+            tabla["cab_w"][i], tabla["cab_h"][i] = m["cab_w"], m["cab_h"]
+            tabla["cab_res_w"][i] = int(m["mod_res_w"] * mw)
+            tabla["cab_res_h"][i] = int(m["mod_res_h"] * mh)
+            tabla["modulos_por_cab"][i] = mw * mh
+            tabla["manual"][i] = True
+        else:
+            cw, ch, mw, mh = _ESTANDAR["Indoor" if m.get("entorno", "Indoor") == "Indoor" else "Outdoor"]
+            tabla["cab_w"][i], tabla["cab_h"][i] = cw, ch
+            tabla["modulos_por_cab"][i] = mw * mh
+    return tabla
+
+
+def barrer_candidatos(req_w, req_h, pitch, modelo, modelos, modo="round"):
+    # modelo: índice (por candidato) dentro de la lista/tabla de modelos.
+    tabla = modelos if isinstance(modelos, dict) else tabla_modelos(modelos)
+    modelo = np.asarray(modelo, dtype=np.intp)
+    pitch = np.asarray(pitch, dtype=np.float64)
+    cab_w, cab_h = tabla["cab_w"][modelo], tabla["cab_h"][modelo]
+    manual = tabla["manual"][modelo]
+    # En modo Auto-Estándar la resolución sale del pitch: int(cab / pitch)
+    cab_res_w = np.where(manual, tabla["cab_res_w"][modelo], np.trunc(cab_w / pitch).astype(np.int64))
+    cab_res_h = np.where(manual, tabla["cab_res_h"][modelo], np.trunc(cab_h / pitch).astype(np.int64))
+    return barrer_configuraciones(req_w, req_h, cab_w, cab_h, cab_res_w, cab_res_h,
+                                  tabla["modulos_por_cab"][modelo], modo=modo)
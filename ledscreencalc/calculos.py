@@ -0,0 +1,422 @@
+import functools
+import math
+
+from .formato import formato_latam
+
+
+# ==========================================
+# 1. MÓDULOS DE CLASES (Core Lógico)
+# ==========================================
+SUFIJOS_ANGULO = ("°", "º", "deg")
+
+@functools.lru_cache(maxsize=1024)
+def leer_shutter(shutter_speed_str):
+    # (valor, es_angulo): "1/60" y "60" son segundos (1/60); "180°", "172.8°"
+    # o "180deg" son grados de obturador, que dependen de los fps de cámara.
+    # Se cachea: la UI y los mapas de sincronización repiten los mismos textos.
+    texto = shutter_speed_str.strip().lower()
+    for sufijo in SUFIJOS_ANGULO:
+        if texto.endswith(sufijo):
+            return float(texto[:-len(sufijo)]), True
+    if "/" in texto:
+        num, den = texto.split("/")
+        return float(num) / float(den), False
+    return 1.0 / float(texto), False
+
+def segundos_shutter(shutter_speed_str, fps=60.0):
+    valor, es_angulo = leer_shutter(shutter_speed_str)
+    return valor / 360.0 / fps if es_angulo else valor
+
+def leer_shutter_estricto(shutter_speed_str):
+    # Como leer_shutter, pero levanta ValueError ante texto inválido ("1/0",
+    # "0"), tiempos no positivos o infinitos y ángulos de más de 360°
+    try:
+        valor, es_angulo = leer_shutter(shutter_speed_str)
+    except (ValueError, TypeError, ZeroDivisionError, AttributeError):
+        raise ValueError(f"Shutter inválido: {shutter_speed_str!r} (use p. ej. '1/60', '60' o '180°')") from None
+    if not (0 < valor < math.inf) or (es_angulo and valor > 360):
+        raise ValueError(f"Shutter inválido: {shutter_speed_str!r} (debe ser un tiempo positivo o un ángulo de hasta 360°)")
+    return valor, es_angulo
+
+def parsear_shutter_estricto(shutter_speed_str, fps=60.0):
+    # Como parsear_shutter, pero levanta ValueError en vez de asumir 1/60
+    valor, es_angulo = leer_shutter_estricto(shutter_speed_str)
+    try:
+        segundos = valor / 360.0 / fps if es_angulo else valor
+    except (TypeError, ZeroDivisionError):
+        raise ValueError(f"Shutter inválido: {shutter_speed_str!r} (use p. ej. '1/60', '60' o '180°')") from None
+    if not 0 < segundos < math.inf:
+        raise ValueError(f"Shutter inválido: {shutter_speed_str!r} (debe ser un tiempo positivo o un ángulo de hasta 360°)")
+    return segundos
+
+def parsear_shutter(shutter_speed_str, fps=60.0):
+    try:
+        return segundos_shutter(shutter_speed_str, fps)
+    except:
+        return 1.0 / 60.0 
+
+# La sincronización de cámara sólo depende del refresco y del shutter, por eso
+# vive fuera de LedScreenProc y puede recalcularse sola.
+def valores_sincronizacion(refresh_rate_hz, shutter_speed_str, fps=60.0):
+    shutter_segundos = parsear_shutter(shutter_speed_str, fps)
+    return {
+        "refresh_rate_hz": refresh_rate_hz,
+        "shutter_s": shutter_segundos,
+        "ciclos_por_exposicion": refresh_rate_hz * shutter_segundos,
+    }
+
+def calcular_sincronizacion(valores):
+    ciclos_por_exposicion = valores["ciclos_por_exposicion"]
+    res_sync = f"Ciclos: {formato_latam(ciclos_por_exposicion, 1)} -> "
+    res_sync += "🟢 ÓPTIMO" if ciclos_por_exposicion >= 50 else ("🟠 ADVERTENCIA" if ciclos_por_exposicion >= 25 else "🔴 CRÍTICO")
+    return res_sync
+
+def capacidad_puerto_px(calidad, fps):
+    # Píxeles por puerto RJ45 (Gigabit): la mitad con 10/12-bit o HDR y
+    # proporcionalmente menos por encima de 60 fps.
+    capacidad_base_px = 650000
+    if "10-bit" in calidad or "12-bit" in calidad or "HDR" in calidad:
+        capacidad_base_px = capacidad_base_px // 2
+    if fps > 60:
+        capacidad_base_px = int(capacidad_base_px * (60.0 / fps))
+    return capacidad_base_px
+
+class LedScreenProc:
+    def __init__(self, uso, total_px, total_gabinetes, input_res, puerto, calidad, fps_video=60, 
+                 distancia_cable_m=50, refresh_rate_hz=3840, shutter_speed_str="1/60",
+                 res_w=0, res_h=0, fis_w_mm=0, fis_h_mm=0, num_entradas=1):
+        self.uso = uso
+        self.total_px = total_px
+        self.total_gabinetes = total_gabinetes
+        self.input_res = input_res
+        self.puerto = puerto
+        self.calidad = calidad
+        self.fps = fps_video
+        self.distancia_cable_m = distancia_cable_m
+        self.refresh_rate_hz = refresh_rate_hz
+        self.shutter_speed_str = shutter_speed_str
+        self.res_w = res_w
+        self.res_h = res_h
+        self.fis_w_mm = int(fis_w_mm)
+        self.fis_h_mm = int(fis_h_mm)
+        self.num_entradas = num_entradas
+
+    def _parsear_shutter(self):
+        return parsear_shutter(self.shutter_speed_str, self.fps)
+
+    def _calcular_ratio(self, w, h):
+        if w == 0 or h == 0: return "N/A"
+        divisor = math.gcd(int(w), int(h))
+        relacion = f"{int(w)//divisor}:{int(h)//divisor}"
+        decimal = w / h
+        return f"{relacion} ({formato_latam(decimal, 2)})"
+
+    def valores_procesamiento(self):
+        capacidad_base_px = capacidad_puerto_px(self.calidad, self.fps)
+
+        self.puertos_rj45 = max(1, math.ceil(self.total_px / capacidad_base_px))
+        valores = {
+            "total_px": self.total_px,
+            "capacidad_puerto_px": capacidad_base_px,
+            "puertos_rj45": self.puertos_rj45,
+            "requiere_fibra": self.distancia_cable_m > 100,
+            "total_gabinetes": self.total_gabinetes,
+        }
+        valores.update(valores_sincronizacion(self.refresh_rate_hz, self.shutter_speed_str, self.fps))
+        return valores
+
+    def calcular_procesamiento(self, valores=None):
+        v = valores or self.valores_procesamiento()
+        infraestructura = f"{v['puertos_rj45']} puertos RJ45 (Cat6)."
+        if v["requiere_fibra"]:
+            infraestructura += " [!] Distancia crítica: requiere salto a fibra óptica."
+
+        ratio_fisico = self._calcular_ratio(self.fis_w_mm, self.fis_h_mm)
+        ratio_logico = self._calcular_ratio(self.res_w, self.res_h)
+
+        res_sync = calcular_sincronizacion(v)
+
+        return {
+            "Total Px Calculados": f"{formato_latam(self.total_px, 0)} px",
+            "Relación de Aspecto Física": ratio_fisico,
+            "Relación de Aspecto Lógica (Mapeo)": ratio_logico,
+            "Tasa de Refrescamiento": f"{formato_latam(v['refresh_rate_hz'], 0)} Hz",
+            "Sincronización de Cámara": res_sync,
+            "Puertos RJ45 de Salida Req.": v["puertos_rj45"],
+            "Tarjetas Receptoras (R-Cards)": f"{self.total_gabinetes} tarjetas (1 por gabinete)",
+            "Topología de Red": infraestructura
+        }
+
+    def valores_hardware_procesador(self):
+        capacidad_max_4k = 8800000
+        equipos_4k_necesarios = max(1, math.ceil(self.total_px / capacidad_max_4k))
+        if not hasattr(self, 'puertos_rj45'):
+            self.valores_procesamiento()
+        return {
+            "nucleos": equipos_4k_necesarios,
+            "capacidad_total_px": equipos_4k_necesarios * capacidad_max_4k,
+            "tarjetas_salida": max(1, math.ceil(self.puertos_rj45 / 16)),
+            "puertos_opt": math.ceil(self.puertos_rj45 / 10) if self.distancia_cable_m > 100 else 0,
+        }
+
+    def calcular_hardware_procesador(self, valores=None):
+        v = valores or self.valores_hardware_procesador()
+        if "8K" in self.input_res:
+            base_cards = self.num_entradas * 4
+            tarjetas_entrada = f"{self.num_entradas}x señal(es) 8K -> Req. {base_cards}x Entradas 4K (Quad-Link) o {self.num_entradas}x Tarjetas HDMI 2.1"
+        elif "16K" in self.input_res:
+            base_cards = self.num_entradas * 16
+            tarjetas_entrada = f"{self.num_entradas}x señal(es) 16K -> Req. {base_cards}x Entradas 4K o {self.num_entradas * 4}x Tarjetas HDMI 2.1"
+        elif "4K" in self.input_res:
+            tarjetas_entrada = f"{self.num_entradas}x señal(es) 4K -> Req. {math.ceil(self.num_entradas/2)}x Tarjetas Dual-4K (o similar)"
+        else:
+            tarjetas_entrada = f"{self.num_entradas}x señal(es) HD -> Req. {math.ceil(self.num_entradas/4)}x Tarjetas Quad-HD"
+
+        opt_ports = v["puertos_opt"]
+        if opt_ports:
+            interfaces_opt = f"SÍ: {opt_ports} puertos OPT 10G (Requiere {opt_ports} conversores CVT10 en pantalla)"
+        else:
+            interfaces_opt = "NO (Distancia segura < 100m)"
+
+        return {
+            "Formato y Calidad Base": f"{self.input_res} {self.calidad} @ {self.fps}fps",
+            "Capacidad Máx. de Carga (Salida)": f"{formato_latam(v['capacidad_total_px'], 0)} px ({v['nucleos']} núcleo(s) de procesamiento)",
+            "Módulos de Entrada Req.": tarjetas_entrada,
+            "Módulos de Salida Req.": f"{v['tarjetas_salida']} tarjeta(s) de salida (Modular 16-port)",
+            "Interfaces Ópticas (OPT)": interfaces_opt
+        }
+
+class LEDSCREENCALC:
+    def __init__(self, uso, entorno, contenido, dim_req_w, dim_req_h, dist_vis_m, pitch, 
+                 mod_res_w=None, mod_res_h=None, mod_w=None, mod_h=None, cab_w=None, cab_h=None, brillo=1000):
+        self.uso = uso
+        self.entorno = entorno
+        self.contenido = contenido
+        self.req_w = dim_req_w
+        self.req_h = dim_req_h
+        self.dist_vis_m = dist_vis_m
+        self.pitch = pitch
+        self.brillo = brillo
+        
+        self.datos_marca_suministrados = all(v is not None for v in [mod_res_w, mod_res_h, mod_w, mod_h, cab_w, cab_h])
+        
+        if self.datos_marca_suministrados:
+            self.cab_w = cab_w
+            self.cab_h = cab_h
+            self.mod_w = mod_w
+            self.mod_h = mod_h
+            self.mod_res_w = mod_res_w
+            self.mod_res_h = mod_res_h
+            self.modulos_por_cab_w = int(self.cab_w // mod_w)
+            self.modulos_por_cab_h = int(self.cab_h // mod_h)
+            self.total_modulos_por_cab = self.modulos_por_cab_w * self.modulos_por_cab_h
+            self.cab_res_w = int(mod_res_w * self.modulos_por_cab_w)
+            self.cab_res_h = int(mod_res_h * self.modulos_por_cab_h)
+        else:
+            if self.entorno == "Indoor":
+                self.cab_w, self.cab_h = 500.0, 500.0
+                self.modulos_por_cab_w = 2
+                self.modulos_por_cab_h = 2
+            else:
+                self.cab_w, self.cab_h = 960.0, 960.0
+                self.modulos_por_cab_w = 3
+                self.modulos_por_cab_h = 3
+                
+            self.mod_w = self.cab_w / self.modulos_por_cab_w
+            self.mod_h = self.cab_h / self.modulos_por_cab_h
+            self.cab_res_w = int(self.cab_w / self.pitch)
+            self.cab_res_h = int(self.cab_h / self.pitch)
+            self.mod_res_w = int(self.mod_w / self.pitch)
+            self.mod_res_h = int(self.mod_h / self.pitch)
+            self.total_modulos_por_cab = self.modulos_por_cab_w * self.modulos_por_cab_h
+
+    def _calcular_configuracion(self, columnas, filas):
+        total_gabinetes = int(columnas * filas)
+        total_modulos = int(total_gabinetes * self.total_modulos_por_cab)
+        ancho_fisico = columnas * self.cab_w
+        alto_fisico = filas * self.cab_h
+        res_total_w = int(columnas * self.cab_res_w)
+        res_total_h = int(filas * self.cab_res_h)
+        total_px = res_total_w * res_total_h
+        area_m2 = (ancho_fisico / 1000) * (alto_fisico / 1000)
+        
+        diag_mm = math.sqrt(ancho_fisico**2 + alto_fisico**2)
+        diag_in = diag_mm / 25.4
+        
+        formatted = {}
+        etiqueta_auto = "" if self.datos_marca_suministrados else " (Auto-Estándar)"
+
+        formatted["Resolución de módulos (px)"] = f"{formato_latam(self.mod_res_w, 0)} (W) x {formato_latam(self.mod_res_h, 0)} (H){etiqueta_auto}"
+        formatted["Tamaño de módulo (mm)"] = f"{formato_latam(self.mod_w, 2)} (W) x {formato_latam(self.mod_h, 2)} (H){etiqueta_auto}"
+        formatted["Tamaño del Gabinete (mm)"] = f"{formato_latam(self.cab_w, 2)} (W) x {formato_latam(self.cab_h, 2)} (H){etiqueta_auto}"
+        formatted["Módulos x Gabinete"] = f"{self.modulos_por_cab_w} (W) x {self.modulos_por_cab_h} (H) = {self.total_modulos_por_cab} mód.{etiqueta_auto}"
+
+        formatted["Gabinetes (Column x Filas)"] = f"{columnas} x {filas}"
+        formatted["Piezas"] = f"{total_gabinetes} gabinetes ({total_modulos} módulos)"
+        formatted["Resolución Total"] = f"{formato_latam(res_total_w, 0)} x {formato_latam(res_total_h, 0)} ({formato_latam(total_px, 0)} px)"
+        formatted["Dimensiones Finales"] = f"{formato_latam(ancho_fisico, 1)} x {formato_latam(alto_fisico, 1)} mm"
+        formatted["Diagonal de Pantalla"] = f"{formato_latam(diag_in, 2)}\" Pulgadas ({formato_latam(diag_mm, 2)} mm)"
+        formatted["Tamaño en m²"] = f"{formato_latam(area_m2, 2)} m²"
+        formatted["Brillo Objetivo"] = f"{formato_latam(self.brillo, 0)} Nits (cd/m²)"
+
+        return {
+            "raw": {"columnas": columnas, "filas": filas, "area_m2": area_m2, "total_px": total_px, 
+                    "cab_w": self.cab_w, "total_gabinetes": total_gabinetes, "total_modulos": total_modulos,
+                    "res_total_w": res_total_w, "res_total_h": res_total_h, 
+                    "ancho_fisico": ancho_fisico, "alto_fisico": alto_fisico},
+            "formatted": formatted
+        }
+
+    def generar_opciones(self):
+        col_exact = self.req_w / self.cab_w
+        fil_exact = self.req_h / self.cab_h
+        
+        opt_a = self._calcular_configuracion(max(1, round(col_exact)), max(1, round(fil_exact)))
+        opt_b = self._calcular_configuracion(max(1, math.floor(col_exact)), max(1, math.floor(fil_exact)))
+        opt_c = self._calcular_configuracion(max(1, math.ceil(col_exact)), max(1, math.ceil(fil_exact)))
+        
+        vis_min_m = self.pitch * 1
+        vis_opt_m = self.pitch * 3
+        agudeza_pies = self.pitch * 10
+        
+        return {"Opcion 1 (Ideal)": opt_a, "Opcion 2 (Inferior)": opt_b, "Opcion 3 (Superior)": opt_c, 
+                "Visualizacion": {"Mínima": f"{formato_latam(vis_min_m, 2)} m", "Óptima": f"{formato_latam(vis_opt_m, 2)} m", "Retina (Agudeza)": f"{formato_latam(agudeza_pies, 2)} ft"}}
+
+class LedPowerCalc:
+    def __init__(self, area_m2, voltaje=220, entorno="Indoor", watts_max_m2=None, factor_promedio=0.34):
+        self.area = area_m2
+        self.voltaje = voltaje
+        if watts_max_m2 is None:
+            watts_max_m2 = 800 if entorno == "Outdoor" else 500
+        self.watts_max_m2 = watts_max_m2
+        # Potencia promedio / máxima; 0.34 es el supuesto genérico, contenido.py
+        # lo mide sobre el material real
+        self.factor_promedio = factor_promedio
+
+    def valores_energia_y_clima(self):
+        pot_max_w = self.area * self.watts_max_m2
+        amp_total = pot_max_w / self.voltaje
+        btu_max_hr = pot_max_w * 3.412
+        return {
+            "watts_max_m2": self.watts_max_m2,
+            "factor_promedio": self.factor_promedio,
+            "pot_max_w": pot_max_w,
+            "pot_prom_w": pot_max_w * self.factor_promedio,
+            "amp_total": amp_total,
+            "amp_fase": amp_total / 3,
+            "btu_max_hr": btu_max_hr,
+            "hvac_ton": btu_max_hr / 12000,
+        }
+
+    def calcular_energia_y_clima(self, valores=None):
+        v = valores or self.valores_energia_y_clima()
+        return {
+            "Potencia Máxima": f"{formato_latam(v['pot_max_w'] / 1000, 2)} kW",
+            "Potencia Promedio": f"{formato_latam(v['pot_prom_w'] / 1000, 2)} kW",
+            f"Amperaje Total ({self.voltaje}V)": f"{formato_latam(v['amp_total'], 2)} A",
+            "Amperaje por Fase (3F)": f"{formato_latam(v['amp_fase'], 2)} A / fase",
+            "Carga Térmica (Max)": f"{formato_latam(v['btu_max_hr'], 2)} BTU/hr",
+            "HVAC Requerido": f"{formato_latam(v['hvac_ton'], 2)} Toneladas AC"
+        }
+
+# Capacidades de motor estándar (WLL, kg)
+MOTORES_KG = (250, 500, 1000, 2000)
+# Peso de un bumper por columna y del cableado como fracción del peso de la pantalla
+PESO_BUMPER_KG = 3.5
+FRACCION_CABLEADO = 0.10
+
+def seleccionar_motor(carga_kg, factor_seguridad=8):
+    # Menor motor estándar que cubre carga x factor; None si ninguno alcanza
+    return next((m for m in MOTORES_KG if m >= (carga_kg * factor_seguridad)), None)
+
+class LedRiggingCalc:
+    def __init__(self, columnas, filas, cab_w_mm, cab_peso_kg=11.0, factor_seguridad=8):
+        self.columnas = columnas
+        self.filas = filas
+        self.cab_peso_kg = cab_peso_kg
+        self.cab_w_m = cab_w_mm / 1000.0
+        self.factor_seguridad = factor_seguridad
+
+    def valores_izaje(self):
+        peso_pura = self.columnas * self.filas * self.cab_peso_kg
+        peso_bumpers = self.columnas * PESO_BUMPER_KG
+        peso_cableado = peso_pura * FRACCION_CABLEADO
+        carga_estatica = peso_pura + peso_bumpers + peso_cableado
+        truss_m = math.ceil((self.columnas * self.cab_w_m) + 1.0)
+        puntos_colgado = max(2, math.ceil(truss_m / 3.0) + 1)
+        carga_por_punto = carga_estatica / puntos_colgado
+        return {
+            "carga_estatica_kg": carga_estatica,
+            "truss_m": truss_m,
+            "puntos_colgado": puntos_colgado,
+            "carga_por_punto_kg": carga_por_punto,
+            # None cuando ningún motor estándar alcanza: requiere ingeniería estructural
+            "motor_kg": seleccionar_motor(carga_por_punto, self.factor_seguridad),
+        }
+
+    def calcular_izaje(self, valores=None):
+        v = valores or self.valores_izaje()
+        motor_sel = v["motor_kg"] if v["motor_kg"] is not None else "Ing. Estructural Req."
+
+        return {
+            "Carga Estática TOTAL (Dead Load)": f"{formato_latam(v['carga_estatica_kg'], 2)} kg",
+            "Truss Sugerido (Min)": f"{formato_latam(v['truss_m'], 2)} m",
+            "Puntos de Motor": f"{v['puntos_colgado']} puntos (Max 3m)",
+            f"Capacidad Motor Req. (SF {self.factor_seguridad}:1)": f"{formato_latam(motor_sel, 0)} kg (WLL) / motor"
+        }
+
+class LedSparesCalc:
+    # modo "porcentaje": porcentaje fijo de cada pieza. modo "confiabilidad":
+    # kit por tasa de falla (MTBF) para un show de dias_show x horas_dia con
+    # la disponibilidad objetivo (ver repuestos.py).
+    def __init__(self, total_modulos, total_gabinetes, porcentaje, modo="porcentaje", disponibilidad=0.95,
+                 dias_show=3, horas_dia=12.0):
+        self.total_modulos = total_modulos
+        self.total_gabinetes = total_gabinetes
+        self.porcentaje = porcentaje / 100.0
+        self.modo = modo
+        self.disponibilidad = disponibilidad
+        self.dias_show = dias_show
+        self.horas_dia = horas_dia
+
+    def valores_repuestos(self):
+        if self.modo == "confiabilidad":
+            from .repuestos import kit_show
+            kit = kit_show({"modulos": self.total_modulos, "rcards": self.total_gabinetes, "psu": self.total_gabinetes},
+                           self.dias_show, self.horas_dia, self.disponibilidad)
+            return {
+                "porcentaje": None,
+                **kit["repuestos"],
+                "modo": self.modo,
+                "disponibilidad": kit["disponibilidad"],
+            }
+        return {
+            "porcentaje": self.porcentaje * 100,
+            "modulos": math.ceil(self.total_modulos * self.porcentaje),
+            "rcards": math.ceil(self.total_gabinetes * self.porcentaje),
+            "psu": math.ceil(self.total_gabinetes * self.porcentaje),
+            "modo": self.modo,
+            "disponibilidad": None,
+        }
+
+    def calcular_repuestos(self, valores=None):
+        v = valores or self.valores_repuestos()
+        rep_modulos, rep_rcards, rep_psu = v["modulos"], v["rcards"], v["psu"]
+
+        if v.get("modo") == "confiabilidad":
+            return {
+                "Criterio": f"Confiabilidad (MTBF): show de {self.dias_show} día(s) x {formato_latam(self.horas_dia, 0)} h",
+                "Disponibilidad del Kit": f"{formato_latam(v['disponibilidad'] * 100, 2)} % (objetivo {formato_latam(self.disponibilidad * 100, 1)} %)",
+                "Módulos LED": f"{rep_modulos} und.",
+                "Tarjetas Receptoras (R-Cards)": f"{rep_rcards} und.",
+                "Fuentes de Poder (PSU)": f"{rep_psu} und."
+            }
+
+        pct_display = int(self.porcentaje * 100) if (self.porcentaje * 100).is_integer() else self.porcentaje * 100
+
+        return {
+            "Porcentaje Seleccionado": f"{pct_display}% de las piezas",
+            "Módulos LED": f"{rep_modulos} und.",
+            "Tarjetas Receptoras (R-Cards)": f"{rep_rcards} und.",
+            "Fuentes de Poder (PSU)": f"{rep_psu} und."
+        }
@@ -0,0 +1,111 @@
+# ==========================================
+# MAPA DE SINCRONIZACIÓN CÁMARA / PANTALLA
+# ==========================================
+# calcular_sincronizacion evalúa un solo par refresco x shutter con el umbral
+# de ciclos por exposición. Aquí se evalúa la grilla completa refresco x
+# shutter x fps de cámara x relación de escaneo de una sola pasada con NumPy:
+#   - ciclos: ciclos de refresco que entran en una exposición.
+#   - modulación: con escaneo 1/N cada fila del LED está encendida 1/N de cada
+#     ciclo; si la exposición no abarca un número entero de ciclos, según la
+#     fase en que empieza captura más o menos tiempo encendido. Es la pérdida
+#     de brillo relativa entre la fila mejor y la peor expuesta (bandas con
+#     rolling shutter, parpadeo con global shutter). Con escaneo estático
+#     (1/1) o ciclos enteros es cero.
+#   - deriva de fase: ciclos que se desplaza la ventana de exposición en cada
+#     cuadro (refresco / fps menos el entero más cercano); el batido
+#     |deriva| x fps es la velocidad a la que ruedan las bandas. Cero = banda
+#     quieta (refresco múltiplo de los fps, como con genlock).
+#   - riesgo: 0 seguro, 1 advertencia, 2 crítico según la modulación; una
+#     advertencia con bandas que ruedan lento (visibles) sube a crítico.
+# Los shutters se aceptan como en la especificación ("1/50", "50", "180°",
+# "172.8°"); los ángulos se convierten con los fps de cada columna.
+import numpy as np
+
+from .calculos import leer_shutter_estricto
+
+# Modulación por debajo de un código de 8 bits (~0,4%) no se ve; por encima del 2% sí
+MODULACION_OK = 0.005
+MODULACION_CRITICA = 0.02
+# Bandas que ruedan más lento que esto se siguen con la vista
+BATIDO_VISIBLE_HZ = 2.0
+NIVELES_RIESGO = ("🟢 SEGURO", "🟠 ADVERTENCIA", "🔴 CRÍTICO")
+
+REFRESCOS_HZ = (960.0, 1920.0, 2880.0, 3840.0, 5760.0, 7680.0)
+SHUTTERS = ("1/24", "1/25", "1/30", "1/48", "1/50", "1/60", "1/100", "1/120", "1/250", "1/500", "1/1000",
+            "180°", "172.8°", "144°", "90°", "45°")
+FPS_CAMARA = (23.976, 24.0, 25.0, 29.97, 30.0, 50.0, 59.94, 60.0)
+ESCANEOS = (1, 2, 4, 8, 16, 32)
+
+
+def _shutters(shutters):
+    # (valor, es_angulo) por shutter; números sueltos se toman como segundos.
+    # Los textos se validan como en la especificación (ValueError con "1/0",
+    # "0" o "400°")
+    valores, angulos = [], []
+    for s in shutters:
+        valor, es_angulo = leer_shutter_estricto(s) if isinstance(s, str) else (float(s), False)
+        valores.append(valor)
+        angulos.append(es_angulo)
+    return np.asarray(valores, dtype=np.float64), np.asarray(angulos)
+
+
+def mapa_sincronizacion(refrescos_hz, shutters, fps=60.0, escaneos=1):
+    # Grillas de forma (refrescos, shutters, fps, escaneos): cada eje puede ser
+    # un escalar o una secuencia. Devuelve dict de arreglos más los ejes.
+    refrescos = np.atleast_1d(np.asarray(refrescos_hz, dtype=np.float64))
+    fps = np.atleast_1d(np.asarray(fps, dtype=np.float64))
+    escaneos = np.atleast_1d(np.asarray(escaneos, dtype=np.float64))
+    shutters = [shutters] if isinstance(shutters, (str, int, float)) else list(shutters)
+    valor, es_angulo = _shutters(shutters)
+    if (refrescos <= 0).any() or (fps <= 0).any() or (escaneos < 1).any() or not (valor > 0).all() or not np.isfinite(valor).all():
+        raise ValueError("Refrescos, shutters y fps deben ser positivos y el escaneo >= 1")
+
+    r = refrescos[:, None, None, None]
+    q = fps[None, None, :, None]
+    duty = (1.0 / escaneos)[None, None, None, :]
+    # Exposición (s) por shutter y fps: forma (1, shutters, fps, 1)
+    exposicion = np.where(es_angulo[:, None], valor[:, None] / 360.0 / fps[None, :], valor[:, None])[None, :, :, None]
+
+    ciclos = r * exposicion
+    enteros = np.floor(ciclos)
+    f = ciclos - enteros
+    # Tiempo encendido capturado (en ciclos) en la mejor y la peor fase de inicio
+    mejor = enteros * duty + np.minimum(f, duty)
+    peor = enteros * duty + np.maximum(0.0, f + duty - 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        modulacion = np.where(mejor > 0, (mejor - peor) / mejor, 1.0)
+
+    cociente = r / q
+    deriva = cociente - np.round(cociente)
+    batido = np.abs(deriva) * q
+    riesgo = (modulacion >= MODULACION_OK).astype(np.int8) + (modulacion >= MODULACION_CRITICA)
+    riesgo = np.where((riesgo == 1) & (batido > 1e-9) & (batido < BATIDO_VISIBLE_HZ), 2, riesgo).astype(np.int8)
+
+    forma = (refrescos.size, len(shutters), fps.size, escaneos.size)
+    return {
+        "refrescos_hz": refrescos,
+        "shutters": shutters,
+        "fps": fps,
+        "escaneos": escaneos,
+        "exposicion_s": exposicion[0, :, :, 0],
+        "ciclos": np.broadcast_to(ciclos, forma),
+        "modulacion": np.broadcast_to(modulacion, forma),
+        "deriva_fase": np.broadcast_to(deriva, forma),
+        "batido_hz": np.broadcast_to(batido, forma),
+        "riesgo": np.broadcast_to(riesgo, forma),
+    }
+
+
+def celdas_mapa(mapa, fps_i=0, escaneo_i=0):
+    # Filas planas (refresco x shutter) de un corte del mapa, para tablas y heatmaps
+    corte = (slice(None), slice(None), fps_i, escaneo_i)
+    ciclos, modulacion = mapa["ciclos"][corte], mapa["modulacion"][corte]
+    batido, riesgo = mapa["batido_hz"][corte], mapa["riesgo"][corte]
+    return [{
+        "refresco_hz": float(hz),
+        "shutter": str(sh),
+        "ciclos": float(ciclos[i, j]),
+        "modulacion_pct": float(modulacion[i, j] * 100),
+        "batido_hz": float(batido[i, j]),
+        "riesgo": NIVELES_RIESGO[riesgo[i, j]],
+    } for i, hz in enumerate(mapa["refrescos_hz"].tolist()) for j, sh in enumerate(mapa["shutters"])]
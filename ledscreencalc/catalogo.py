@@ -0,0 +1,144 @@
+# ==========================================
+# CATÁLOGO LOCAL DE GABINETES / MÓDULOS (SQLite)
+# ==========================================
+# Reemplaza la carga manual de "Ingresar Marca/Modelo Manual" por un catálogo
+# de SKUs indexado por pitch, entorno, tamaño de gabinete, brillo, peso y
+# consumo. Las búsquedas combinan filtros indexados con un ajuste a la medida
+# solicitada calculado en SQL, y cada producto se convierte directamente en
+# campos de especificación para calculate_project (incluidos cab_peso_kg y
+# watts_max_m2).
+import csv
+import sqlite3
+
+# (columna, tipo SQL); el orden es el de importación/exportación CSV
+COLUMNAS = (
+    ("sku", "TEXT PRIMARY KEY"),
+    ("marca", "TEXT"),
+    ("modelo", "TEXT"),
+    ("entorno", "TEXT NOT NULL"),
+    ("pitch", "REAL NOT NULL"),
+    ("cab_w", "REAL NOT NULL"),
+    ("cab_h", "REAL NOT NULL"),
+    ("mod_w", "REAL NOT NULL"),
+    ("mod_h", "REAL NOT NULL"),
+    ("mod_res_w", "INTEGER NOT NULL"),
+    ("mod_res_h", "INTEGER NOT NULL"),
+    ("brillo", "REAL NOT NULL"),
+    ("peso_kg", "REAL NOT NULL"),
+    ("watts_max_m2", "REAL NOT NULL"),
+)
+NOMBRES = tuple(c for c, _ in COLUMNAS)
+
+_INDICES = (
+    ("ix_gab_entorno_pitch", "entorno, pitch"),
+    ("ix_gab_pitch", "pitch"),
+    ("ix_gab_tamano", "cab_w, cab_h"),
+    ("ix_gab_brillo", "brillo"),
+    ("ix_gab_peso", "peso_kg"),
+    ("ix_gab_watts", "watts_max_m2"),
+)
+
+# Filtros de rango admitidos por buscar(): argumento -> (columna, operador)
+_FILTROS = {
+    "pitch_min": ("pitch", ">="), "pitch_max": ("pitch", "<="),
+    "brillo_min": ("brillo", ">="), "brillo_max": ("brillo", "<="),
+    "peso_max": ("peso_kg", "<="), "watts_max": ("watts_max_m2", "<="),
+    "cab_w": ("cab_w", "="), "cab_h": ("cab_h", "="),
+}
+
+# Error relativo de ajuste de un eje: |max(1, round(req / cab)) * cab - req| / req
+_ERROR_EJE = "ABS(MAX(1, ROUND(:{req} / {cab})) * {cab} - :{req}) / :{req}"
+_ERROR_AJUSTE = (f"MAX({_ERROR_EJE.format(req='req_w', cab='cab_w')}, "
+                 f"{_ERROR_EJE.format(req='req_h', cab='cab_h')})")
+
+
+class CatalogoProductos:
+    def __init__(self, ruta=":memory:"):
+        self.ruta = ruta
+        self._con = sqlite3.connect(ruta)
+        self._con.row_factory = sqlite3.Row
+        columnas = ", ".join(f"{c} {t}" for c, t in COLUMNAS)
+        self._con.execute(f"CREATE TABLE IF NOT EXISTS gabinetes ({columnas})")
+        for nombre, cols in _INDICES:
+            self._con.execute(f"CREATE INDEX IF NOT EXISTS {nombre} ON gabinetes ({cols})")
+        self._con.commit()
+
+    def cerrar(self):
+        self._con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def __len__(self):
+        return self._con.execute("SELECT COUNT(*) FROM gabinetes").fetchone()[0]
+
+    def agregar(self, productos):
+        marcadores = ", ".join(f":{c}" for c in NOMBRES)
+        filas = ({c: p.get(c) for c in NOMBRES} for p in productos)
+        with self._con:
+            self._con.executemany(f"INSERT OR REPLACE INTO gabinetes ({', '.join(NOMBRES)}) VALUES ({marcadores})", filas)
+        self._con.execute("ANALYZE gabinetes")
+
+    def importar_csv(self, ruta, separador=","):
+        with open(ruta, newline="", encoding="utf-8-sig") as f:
+            self.agregar(csv.DictReader(f, delimiter=separador))
+
+    def obtener(self, sku):
+        fila = self._con.execute("SELECT * FROM gabinetes WHERE sku = ?", (sku,)).fetchone()
+        if fila is None:
+            raise KeyError(sku)
+        return dict(fila)
+
+    def buscar(self, entorno=None, req_w=None, req_h=None, tolerancia=None, limite=50, **filtros):
+        # Filtros: pitch_min/max, brillo_min/max, peso_max, watts_max, cab_w, cab_h.
+        # Con req_w/req_h cada resultado trae "error_ajuste" (mayor desvío relativo
+        # de ancho/alto con el ajuste ideal) y se ordena por él; con tolerancia se
+        # descartan los que no entran. Desempate: pitch más fino, más brillo.
+        desconocidos = set(filtros) - set(_FILTROS)
+        if desconocidos:
+            raise TypeError(f"Filtros desconocidos: {', '.join(sorted(desconocidos))}")
+        condiciones, params = [], {}
+        if entorno is not None:
+            condiciones.append("entorno = :entorno")
+            params["entorno"] = entorno
+        for nombre, valor in filtros.items():
+            if valor is not None:
+                columna, operador = _FILTROS[nombre]
+                condiciones.append(f"{columna} {operador} :{nombre}")
+                params[nombre] = valor
+
+        ajuste = req_w is not None and req_h is not None
+        seleccion = f"*, {_ERROR_AJUSTE} AS error_ajuste" if ajuste else "*"
+        if ajuste:
+            params.update(req_w=float(req_w), req_h=float(req_h))
+            if tolerancia is not None:
+                condiciones.append(f"{_ERROR_AJUSTE} <= :tolerancia")
+                params["tolerancia"] = tolerancia
+        orden = ("error_ajuste ASC, " if ajuste else "") + "pitch ASC, brillo DESC, sku ASC"
+        donde = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        sql = f"SELECT {seleccion} FROM gabinetes{donde} ORDER BY {orden} LIMIT :limite"
+        params["limite"] = -1 if limite is None else limite
+        return [dict(fila) for fila in self._con.execute(sql, params)]
+
+
+def spec_desde_producto(producto, **spec):
+    # Campos de especificación para calculate_project a partir de un SKU;
+    # spec agrega/reemplaza el resto (req_w, req_h, uso, ...).
+    datos = {
+        "entorno": producto["entorno"],
+        "pitch": producto["pitch"],
+        "brillo": producto["brillo"],
+        "mod_res_w": int(producto["mod_res_w"]),
+        "mod_res_h": int(producto["mod_res_h"]),
+        "mod_w": producto["mod_w"],
+        "mod_h": producto["mod_h"],
+        "cab_w": producto["cab_w"],
+        "cab_h": producto["cab_h"],
+        "cab_peso_kg": producto["peso_kg"],
+        "watts_max_m2": producto["watts_max_m2"],
+    }
+    datos.update(spec)
+    return datos
@@ -0,0 +1,259 @@
+# ==========================================
+# ANÁLISIS DE POTENCIA SEGÚN CONTENIDO (STREAMING)
+# ==========================================
+# LedPowerCalc supone que la potencia promedio es el 34% de la máxima. Aquí se
+# mide sobre el material real: se lee el contenido cuadro a cuadro (Y4M, RGB24
+# crudo o secuencia de imágenes) reutilizando un único buffer, se calcula el
+# nivel medio de imagen en luz lineal (APL) y se escala a la potencia de la
+# pantalla. La memoria no depende de la duración del archivo: sólo crece la
+# serie de un valor por cuadro.
+#
+# El APL se mide sobre la grilla de píxeles de la pantalla (el procesador
+# escala el contenido a esa resolución), acotada a max_muestras puntos, así
+# que un stream 4K se procesa más rápido que en tiempo real.
+import glob
+import os
+
+import numpy as np
+
+GAMMA = 2.2
+# Luz lineal relativa de cada nivel de 8 bits
+_LUT = ((np.arange(256) / 255.0) ** GAMMA).astype(np.float32)
+
+EXTENSIONES_IMAGEN = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".ppm")
+# Submuestreos Y4M de 8 bits y 3 planos (o sólo luma) que entran en el buffer
+# de cuadro; 10/12/16 bits (C420p10, mono16...) y alfa (C444alpha) no
+CROMAS_Y4M = ("420", "420jpeg", "420paldv", "420mpeg2", "444", "mono")
+
+
+def _leer_exacto(archivo, buffer):
+    vista = memoryview(buffer).cast("B")
+    leidos = 0
+    while leidos < len(vista):
+        n = archivo.readinto(vista[leidos:])
+        if not n:
+            return leidos
+        leidos += n
+    return leidos
+
+
+def _cabecera_y4m(archivo):
+    linea = archivo.readline()
+    if not linea.startswith(b"YUV4MPEG2"):
+        raise ValueError("No es un archivo Y4M (falta la cabecera YUV4MPEG2)")
+    ancho = alto = None
+    fps = 30.0
+    croma = "420"
+    for campo in linea.split()[1:]:
+        clave, valor = chr(campo[0]), campo[1:].decode("ascii")
+        if clave == "W":
+            ancho = int(valor)
+        elif clave == "H":
+            alto = int(valor)
+        elif clave == "F":
+            num, den = valor.split(":")
+            fps = int(num) / int(den)
+        elif clave == "C":
+            croma = valor
+    if ancho is None or alto is None:
+        raise ValueError("Cabecera Y4M sin W/H")
+    if croma not in CROMAS_Y4M:
+        raise ValueError(f"Formato Y4M no soportado: C{croma} (sólo 8 bits: {', '.join('C' + c for c in CROMAS_Y4M)}); "
+                         "convertir p. ej. con ffmpeg -pix_fmt yuv420p")
+    return ancho, alto, fps, croma
+
+
+def cuadros_y4m(archivo, info=None):
+    # Genera (Y, U, V) por cuadro; las vistas se sobreescriben en el siguiente
+    ancho, alto, fps, croma = _cabecera_y4m(archivo)
+    if info is not None:
+        info.update(ancho=ancho, alto=alto, fps=fps)
+    if croma.startswith("420"):
+        cw, ch = (ancho + 1) // 2, (alto + 1) // 2
+    elif croma == "444":
+        cw, ch = ancho, alto
+    else:
+        cw = ch = 0
+    buffer = np.empty(ancho * alto + 2 * cw * ch, dtype=np.uint8)
+    y = buffer[:ancho * alto].reshape(alto, ancho)
+    u = buffer[ancho * alto:ancho * alto + cw * ch].reshape(ch, cw)
+    v = buffer[ancho * alto + cw * ch:].reshape(ch, cw)
+    while True:
+        marca = archivo.readline()
+        if not marca:
+            return
+        if not marca.startswith(b"FRAME"):
+            raise ValueError("Y4M corrupto: se esperaba FRAME")
+        if _leer_exacto(archivo, buffer) < buffer.size:
+            return
+        yield (y, u, v) if cw else (y, None, None)
+
+
+def cuadros_rgb(archivo, ancho, alto):
+    # RGB24 crudo (rgb24 de ffmpeg), cuadros consecutivos sin cabecera
+    buffer = np.empty((alto, ancho, 3), dtype=np.uint8)
+    while _leer_exacto(archivo, buffer) == buffer.size:
+        yield buffer
+
+
+def cuadros_imagenes(rutas):
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Leer secuencias de imágenes requiere Pillow (pip install pillow)") from None
+    for ruta in rutas:
+        with Image.open(ruta) as img:
+            yield np.asarray(img.convert("RGB"))
+
+
+def _grilla(alto, ancho, res_w, res_h, max_muestras):
+    # Índices de fila/columna del contenido que caen en cada píxel de la pantalla
+    # (vecino más cercano), reducidos proporcionalmente si superan max_muestras
+    res_w, res_h = min(res_w or ancho, ancho), min(res_h or alto, alto)
+    escala = min(1.0, (max_muestras / (res_w * res_h)) ** 0.5)
+    res_w, res_h = max(1, int(res_w * escala)), max(1, int(res_h * escala))
+    filas = ((np.arange(res_h) + 0.5) * alto / res_h).astype(np.intp)
+    columnas = ((np.arange(res_w) + 0.5) * ancho / res_w).astype(np.intp)
+    return filas, columnas
+
+
+def _indices(filas, columnas, ancho):
+    return (filas[:, None] * ancho + columnas[None, :]).ravel()
+
+
+def apl_rgb(cuadro, indices):
+    # indices: posiciones planas (fila * ancho + columna) a muestrear
+    muestra = cuadro.reshape(-1, 3)[indices]
+    return float(np.take(_LUT, muestra).mean(dtype=np.float64))
+
+
+def apl_yuv(y, u, v, indices_y, indices_c):
+    # BT.709 rango limitado (16-235 / 16-240) -> R'G'B' de 8 bits -> luz lineal
+    yy = np.take(y, indices_y).astype(np.float32)
+    yy -= 16.0
+    yy *= 255 / 219.0
+    if u is None:
+        canales = (yy,)
+    else:
+        cb = np.take(u, indices_c).astype(np.float32)
+        cr = np.take(v, indices_c).astype(np.float32)
+        cb -= 128.0
+        cb *= 255 / 224.0
+        cr -= 128.0
+        cr *= 255 / 224.0
+        canales = (yy + 1.5748 * cr, yy - 0.1873 * cb - 0.4681 * cr, yy + 1.8556 * cb)
+    total = 0.0
+    for canal in canales:
+        canal += 0.5
+        np.clip(canal, 0.0, 255.0, out=canal)
+        total += np.take(_LUT, canal.astype(np.uint8)).sum(dtype=np.float64)
+    return total / (len(canales) * indices_y.size)
+
+
+def _abrir(fuente):
+    if hasattr(fuente, "readinto"):
+        return fuente, False
+    return open(fuente, "rb"), True
+
+
+def detectar_formato(fuente):
+    if isinstance(fuente, str) and (os.path.isdir(fuente) or glob.has_magic(fuente)):
+        return "imagenes"
+    if isinstance(fuente, str):
+        with open(fuente, "rb") as f:
+            inicio = f.read(9)
+    elif hasattr(fuente, "peek"):
+        inicio = fuente.peek(9)[:9]
+    elif fuente.seekable():
+        posicion = fuente.tell()
+        inicio = fuente.read(9)
+        fuente.seek(posicion)
+    else:
+        inicio = b""
+    return "y4m" if inicio == b"YUV4MPEG2" else "rgb"
+
+
+def serie_apl(fuente, formato=None, ancho=None, alto=None, res_w=None, res_h=None, max_muestras=250000, info=None):
+    # Genera el APL (0..1, luz lineal) de cada cuadro. fuente: ruta, archivo
+    # binario abierto, directorio o patrón glob de imágenes. Si se pasa un
+    # dict en info, se completa con formato, ancho, alto y fps (Y4M) al leer.
+    formato = formato or detectar_formato(fuente)
+    info = {} if info is None else info
+    info["formato"] = formato
+
+    if formato == "imagenes":
+        patron = os.path.join(fuente, "*") if os.path.isdir(fuente) else fuente
+        rutas = sorted(r for r in glob.glob(patron) if r.lower().endswith(EXTENSIONES_IMAGEN))
+        forma = None
+        for cuadro in cuadros_imagenes(rutas):
+            if cuadro.shape != forma:
+                forma = cuadro.shape
+                info["alto"], info["ancho"] = forma[:2]
+                indices = _indices(*_grilla(forma[0], forma[1], res_w, res_h, max_muestras), forma[1])
+            yield apl_rgb(cuadro, indices)
+        return
+
+    archivo, propio = _abrir(fuente)
+    try:
+        if formato == "y4m":
+            indices_y = None
+            for y, u, v in cuadros_y4m(archivo, info):
+                if indices_y is None:
+                    filas, columnas = _grilla(y.shape[0], y.shape[1], res_w, res_h, max_muestras)
+                    indices_y = _indices(filas, columnas, y.shape[1])
+                    indices_c = None
+                    if u is not None:
+                        sub_h, sub_w = -(-y.shape[0] // u.shape[0]), -(-y.shape[1] // u.shape[1])
+                        indices_c = _indices(filas // sub_h, columnas // sub_w, u.shape[1])
+                yield apl_yuv(y, u, v, indices_y, indices_c)
+        elif formato == "rgb":
+            if not ancho or not alto:
+                raise ValueError("El formato RGB crudo requiere ancho y alto")
+            info["ancho"], info["alto"] = ancho, alto
+            indices = _indices(*_grilla(alto, ancho, res_w, res_h, max_muestras), ancho)
+            for cuadro in cuadros_rgb(archivo, ancho, alto):
+                yield apl_rgb(cuadro, indices)
+        else:
+            raise ValueError(f"Formato de contenido desconocido: {formato!r}")
+    finally:
+        if propio:
+            archivo.close()
+
+
+def analizar_contenido(fuente, pot_max_w, fps=None, consumo_reposo=0.10, **lectura):
+    # Serie de potencia y carga térmica cuadro a cuadro, con pico, P95 y
+    # promedio. consumo_reposo es la fracción de pot_max_w que la pantalla
+    # consume en negro (fuentes, receptoras, ventilación).
+    # lectura: formato, ancho, alto, res_w, res_h, max_muestras (ver serie_apl).
+    # fps: por defecto el de la cabecera Y4M, o 30 para RGB crudo e imágenes.
+    info = {}
+    apl = np.fromiter(serie_apl(fuente, info=info, **lectura), dtype=np.float64)
+    if apl.size == 0:
+        raise ValueError("El contenido no tiene cuadros completos")
+    fps = fps or info.get("fps") or 30.0
+    pot_w = pot_max_w * (consumo_reposo + (1 - consumo_reposo) * apl)
+    btu_hr = pot_w * 3.412
+    return {
+        "cuadros": int(apl.size),
+        "fps": fps,
+        "duracion_s": apl.size / fps,
+        "tiempo_s": np.arange(apl.size) / fps,
+        "apl": apl,
+        "pot_w": pot_w,
+        "btu_hr": btu_hr,
+        "apl_promedio": float(apl.mean()),
+        "pot_pico_w": float(pot_w.max()),
+        "pot_p95_w": float(np.percentile(pot_w, 95)),
+        "pot_prom_w": float(pot_w.mean()),
+        "btu_pico_hr": float(btu_hr.max()),
+        "btu_prom_hr": float(btu_hr.mean()),
+        # Reemplazo medido del 0.34 de LedPowerCalc (spec "factor_promedio")
+        "factor_promedio": float(pot_w.mean() / pot_max_w),
+    }
+
+
+def analizar_para_resultado(fuente, resultado, opcion="Opcion 1 (Ideal)", **kw):
+    # Usa la potencia máxima y la resolución de la pantalla de un ResultadoProyecto
+    o = resultado.raw["opciones"][opcion]
+    return analizar_contenido(fuente, resultado.raw["energia"]["pot_max_w"],
+                              res_w=o["res_total_w"], res_h=o["res_total_h"], **kw)
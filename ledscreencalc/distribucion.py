@@ -0,0 +1,270 @@
+# ==========================================
+# DISTRIBUCIÓN ELÉCTRICA: CIRCUITOS Y FASES
+# ==========================================
+# LedPowerCalc reporta amp_total / 3 por fase. Aquí se arma el plan de
+# distribución: cada gabinete va a un circuito monofásico (16 A / 32 A) y cada
+# circuito a una fase L1/L2/L3.
+#   1. Los gabinetes se recorren en serpentina (como el power-link en obra),
+#      así cada circuito es un tramo físicamente contiguo.
+#   2. La serpentina se corta en la menor cantidad de circuitos que respeta el
+#      límite del breaker (corte voraz, óptimo para tramos contiguos). Los
+#      cortes se ubican en los múltiplos de carga total / circuitos; si así
+#      algún circuito excede el breaker, se busca el corte que minimiza el
+#      circuito más cargado (búsqueda binaria sobre el límite). Con
+#      equilibrar=True la cantidad de circuitos se lleva al múltiplo de 3
+#      siguiente para poder repartirlos parejo.
+#   3. Los circuitos se reparten entre fases con LPT (el más cargado a la fase
+#      menos cargada) y se refina intercambiando pares entre la fase más y la
+#      menos cargada.
+# Todo trabaja sobre sumas acumuladas de NumPy: 10k+ gabinetes en milisegundos.
+import cmath
+import csv
+import heapq
+import io
+
+import numpy as np
+
+from .mapeo import orden_serpentina
+
+FASES = ("L1", "L2", "L3")
+BREAKERS_A = (16, 32)
+
+
+def _cortes(acum, limite):
+    # Corte voraz: tramos contiguos de carga <= limite. acum = [0, cumsum...]
+    cortes = [0]
+    n = len(acum) - 1
+    tolerancia = limite * 1e-9
+    while cortes[-1] < n:
+        i = cortes[-1]
+        j = int(np.searchsorted(acum, acum[i] + limite + tolerancia, side="right")) - 1
+        if j <= i:
+            return None
+        cortes.append(min(j, n))
+    return cortes
+
+
+def _cortes_equitativos(acum, cantidad, capacidad):
+    # Cortes en el gabinete más cercano a cada múltiplo de total / cantidad;
+    # None si algún tramo queda vacío o excede la capacidad
+    objetivos = np.arange(1, cantidad) * (acum[-1] / cantidad)
+    j = np.clip(np.searchsorted(acum, objetivos), 1, len(acum) - 1)
+    j = np.where(np.abs(acum[j - 1] - objetivos) < np.abs(acum[j] - objetivos), j - 1, j)
+    cortes = np.concatenate(([0], j, [len(acum) - 1]))
+    if np.any(np.diff(cortes) <= 0) or np.any(np.diff(acum[cortes]) > capacidad * (1 + 1e-9)):
+        return None
+    return cortes.tolist()
+
+
+def _cortes_balanceados(acum, cantidad, capacidad):
+    # Menor límite con el que el corte voraz usa <= cantidad tramos
+    total = float(acum[-1])
+    bajo = max(total / cantidad, float(np.max(np.diff(acum))))
+    alto = capacidad
+    mejor = _cortes(acum, alto)
+    for _ in range(40):
+        if alto - bajo <= capacidad * 1e-6:
+            break
+        medio = (bajo + alto) / 2
+        cortes = _cortes(acum, medio)
+        if cortes is not None and len(cortes) - 1 <= cantidad:
+            alto, mejor = medio, cortes
+        else:
+            bajo = medio
+    return mejor
+
+
+def _mejor_movimiento(cargas, fase, alta, baja, brecha):
+    # Mejor traspaso de la fase alta a la baja: mover un circuito (d = carga) o
+    # intercambiar dos (d = ca - cb). Deja entre ambas una diferencia |brecha - 2d|.
+    a = np.flatnonzero(fase == alta)
+    b = np.flatnonzero(fase == baja)
+    b = b[np.argsort(cargas[b])]
+    cb = np.concatenate(([0.0], cargas[b]))
+    pos = np.searchsorted(cb, cargas[a] - brecha / 2)
+    mejor = None
+    for p in (np.clip(pos, 0, len(cb) - 1), np.clip(pos - 1, 0, len(cb) - 1)):
+        d = cargas[a] - cb[p]
+        nueva = np.where(d > 0, np.abs(brecha - 2 * d), np.inf)
+        k = int(np.argmin(nueva))
+        if nueva[k] < brecha - 1e-9 and (mejor is None or d[k] < mejor[0]):
+            mejor = (d[k], a[k], b[p[k] - 1] if p[k] > 0 else None)
+    return mejor
+
+
+def _repartir_exacto(cargas):
+    # Todas las asignaciones (el primer circuito fijo en L1): 3^(m-1) combinaciones
+    m = len(cargas)
+    fases = (np.arange(3 ** (m - 1))[:, None] // 3 ** np.arange(m - 1)[None, :]) % 3
+    fases = np.concatenate((np.zeros((len(fases), 1), dtype=fases.dtype), fases), axis=1)
+    por_fase = np.stack([(fases == f) @ cargas for f in range(3)], axis=1)
+    mejor = int(np.argmin(por_fase.max(axis=1) - por_fase.min(axis=1)))
+    return fases[mejor].astype(np.int8)
+
+
+def _repartir_fases(cargas, iteraciones=200, max_exacto=10):
+    # Exacto hasta max_exacto circuitos; si no, LPT y luego traspasos/intercambios
+    # entre pares de fases mientras baje la diferencia entre la fase más y la
+    # menos cargada
+    if 0 < len(cargas) <= max_exacto:
+        return _repartir_exacto(cargas)
+    fase = np.empty(len(cargas), dtype=np.int8)
+    monticulo = [(0.0, f) for f in range(3)]
+    for i in np.argsort(-cargas, kind="stable"):
+        carga, f = heapq.heappop(monticulo)
+        fase[i] = f
+        heapq.heappush(monticulo, (carga + cargas[i], f))
+    for _ in range(iteraciones):
+        por_fase = np.bincount(fase, weights=cargas, minlength=3)
+        actual = por_fase.max() - por_fase.min()
+        elegido = None
+        for alta, baja in ((0, 1), (0, 2), (1, 2), (1, 0), (2, 0), (2, 1)):
+            brecha = por_fase[alta] - por_fase[baja]
+            if brecha <= 0:
+                continue
+            movimiento = _mejor_movimiento(cargas, fase, alta, baja, brecha)
+            if movimiento is None:
+                continue
+            nuevas = por_fase.copy()
+            nuevas[alta] -= movimiento[0]
+            nuevas[baja] += movimiento[0]
+            dispersion = nuevas.max() - nuevas.min()
+            if dispersion < actual - 1e-9 and (elegido is None or dispersion < elegido[0]):
+                elegido = (dispersion, alta, baja, movimiento)
+        if elegido is None:
+            break
+        _, alta, baja, (_, i, j) = elegido
+        fase[i] = baja
+        if j is not None:
+            fase[j] = alta
+    return fase
+
+
+def desbalance(cargas_fase):
+    # Desbalance NEMA (máx. desvío respecto del promedio, %) y corriente de neutro relativa
+    cargas_fase = np.asarray(cargas_fase, dtype=float)
+    promedio = cargas_fase.mean()
+    if promedio == 0:
+        return 0.0, 0.0
+    nema = float(np.max(np.abs(cargas_fase - promedio)) / promedio * 100)
+    neutro = abs(sum(c * cmath.exp(-2j * cmath.pi * k / 3) for k, c in enumerate(cargas_fase)))
+    return nema, float(neutro)
+
+
+class PlanDistribucion:
+    __slots__ = ("circuito", "fase", "voltaje", "breaker_a", "factor_carga", "recorrido", "esquina",
+                 "cargas_circuito", "fase_circuito", "circuitos_por_distro", "_orden", "_cortes", "_watts")
+
+    def __init__(self, pos, cortes, watts, fase_circuito, voltaje, breaker_a, factor_carga, recorrido, esquina,
+                 circuitos_por_distro):
+        self.voltaje = voltaje
+        self.breaker_a = breaker_a
+        self.factor_carga = factor_carga
+        self.recorrido = recorrido
+        self.esquina = esquina
+        self.circuitos_por_distro = circuitos_por_distro
+        self._cortes = np.asarray(cortes)
+        self._orden = np.empty(pos.size, dtype=np.int64)
+        self._orden[pos.ravel()] = np.arange(pos.size)
+        self._watts = watts
+        # Grillas filas x columnas: circuito 1-based y fase 0..2 (L1..L3)
+        circuito_pos = np.searchsorted(self._cortes, np.arange(pos.size), side="right").astype(np.int32)
+        self.circuito = circuito_pos[pos]
+        self.fase_circuito = fase_circuito
+        self.fase = fase_circuito[self.circuito - 1]
+        acum = np.concatenate(([0.0], np.cumsum(watts.ravel()[self._orden])))
+        self.cargas_circuito = acum[self._cortes[1:]] - acum[self._cortes[:-1]]
+
+    @property
+    def circuitos(self):
+        return len(self.cargas_circuito)
+
+    def valores(self):
+        por_fase = np.bincount(self.fase_circuito, weights=self.cargas_circuito, minlength=3)
+        nema, neutro_w = desbalance(por_fase)
+        capacidad = self.voltaje * self.breaker_a * self.factor_carga
+        return {
+            "circuitos": self.circuitos,
+            "breaker_a": self.breaker_a,
+            "distros": -(-self.circuitos // self.circuitos_por_distro),
+            "carga_max_circuito_w": float(self.cargas_circuito.max()),
+            "uso_max_circuito": float(self.cargas_circuito.max() / capacidad),
+            "circuitos_por_fase": np.bincount(self.fase_circuito, minlength=3).tolist(),
+            "carga_fase_w": por_fase.tolist(),
+            "corriente_fase_a": (por_fase / self.voltaje).tolist(),
+            "desbalance_pct": nema,
+            "corriente_neutro_a": neutro_w / self.voltaje,
+            "pot_total_w": float(por_fase.sum()),
+        }
+
+    def plan(self):
+        # Una fila por circuito, en orden de serpentina
+        columnas = self.circuito.shape[1]
+        inicio_f, inicio_c = np.divmod(self._orden[self._cortes[:-1]], columnas)
+        fin_f, fin_c = np.divmod(self._orden[self._cortes[1:] - 1], columnas)
+        capacidad = self.voltaje * self.breaker_a * self.factor_carga
+        return [{
+            "circuito": i + 1,
+            "distro": i // self.circuitos_por_distro + 1,
+            "fase": FASES[self.fase_circuito[i]],
+            "breaker_a": self.breaker_a,
+            "gabinetes": int(self._cortes[i + 1] - self._cortes[i]),
+            "carga_w": float(self.cargas_circuito[i]),
+            "corriente_a": float(self.cargas_circuito[i] / self.voltaje),
+            "uso": float(self.cargas_circuito[i] / capacidad),
+            "desde": (int(inicio_c[i]) + 1, int(inicio_f[i]) + 1),
+            "hasta": (int(fin_c[i]) + 1, int(fin_f[i]) + 1),
+        } for i in range(self.circuitos)]
+
+    def escribir_csv(self, archivo, separador=";"):
+        escritor = csv.writer(archivo, delimiter=separador)
+        escritor.writerow(["Circuito", "Distro", "Fase", "Breaker (A)", "Gabinetes", "Carga (W)", "Corriente (A)",
+                           "Uso (%)", "Desde (Col, Fila)", "Hasta (Col, Fila)"])
+        for c in self.plan():
+            escritor.writerow([c["circuito"], c["distro"], c["fase"], c["breaker_a"], c["gabinetes"], round(c["carga_w"], 1),
+                               round(c["corriente_a"], 2), round(c["uso"] * 100, 1),
+                               f"{c['desde'][0]}, {c['desde'][1]}", f"{c['hasta'][0]}, {c['hasta'][1]}"])
+
+    def reporte_csv(self):
+        salida = io.StringIO()
+        self.escribir_csv(salida)
+        return salida.getvalue()
+
+
+def asignar_circuitos(columnas, filas, watts_gabinete, voltaje=220, breaker_a=16, factor_carga=0.8,
+                      recorrido="vertical", esquina="inf-izq", equilibrar=True, circuitos_por_distro=6):
+    # watts_gabinete: potencia máxima por gabinete (escalar o grilla filas x columnas).
+    # factor_carga: fracción utilizable del breaker en carga continua (80%).
+    columnas, filas = int(columnas), int(filas)
+    watts = np.broadcast_to(np.asarray(watts_gabinete, dtype=float), (filas, columnas))
+    capacidad = voltaje * breaker_a * factor_carga
+    if watts.max() > capacidad:
+        raise ValueError(f"Un gabinete de {watts.max():.0f} W excede un circuito de {breaker_a} A "
+                         f"({capacidad:.0f} W al {factor_carga:.0%})")
+
+    pos = orden_serpentina(filas, columnas, recorrido, esquina)
+    orden = np.empty(pos.size, dtype=np.int64)
+    orden[pos.ravel()] = np.arange(pos.size)
+    acum = np.concatenate(([0.0], np.cumsum(watts.ravel()[orden])))
+
+    minimos = len(_cortes(acum, capacidad)) - 1
+    cantidad = min(pos.size, -(-minimos // 3) * 3) if equilibrar else minimos
+    cortes = _cortes_equitativos(acum, cantidad, capacidad) or _cortes_balanceados(acum, cantidad, capacidad)
+    while len(cortes) - 1 < cantidad:
+        # Partir el tramo con más gabinetes no aumenta la carga máxima
+        i = int(np.argmax(np.diff(cortes)))
+        cortes.insert(i + 1, (cortes[i] + cortes[i + 1]) // 2)
+    cargas = acum[cortes[1:]] - acum[cortes[:-1]]
+    fase = _repartir_fases(cargas)
+    return PlanDistribucion(pos, cortes, watts, fase, voltaje, breaker_a, factor_carga, recorrido, esquina,
+                            circuitos_por_distro)
+
+
+def distribucion_desde_resultado(resultado, opcion="Opcion 1 (Ideal)", **kw):
+    # Plan para una opción de layout de un ResultadoProyecto, con la potencia
+    # máxima por gabinete = watts_max_m2 x superficie del gabinete
+    o = resultado.raw["opciones"][opcion]
+    columnas, filas = o["columnas"], o["filas"]
+    area_gabinete_m2 = (o["ancho_fisico"] / columnas / 1000) * (o["alto_fisico"] / filas / 1000)
+    watts = resultado.raw["energia"]["watts_max_m2"] * area_gabinete_m2
+    return asignar_circuitos(columnas, filas, watts, voltaje=resultado.spec["voltaje"], **kw)
@@ -0,0 +1,254 @@
+# ==========================================
+# DISTRIBUCIÓN DE CARGAS EN TRUSS Y PUNTOS DE COLGADO
+# ==========================================
+# LedRiggingCalc reparte la carga estática en partes iguales entre los motores.
+# Aquí cada truss es una viga continua (Euler-Bernoulli) apoyada en sus motores,
+# que se modelan como resortes verticales (cadena + cuerpo del motor), y cada
+# bumper es una carga puntual en su posición real. Con eso:
+#   - muros desparejos (distintas filas por columna) o corridos respecto del
+#     truss cargan más los motores cercanos,
+#   - los voladizos en las puntas descargan el motor vecino,
+#   - muros colgados de dos trusses paralelos reparten cada bumper entre ambos,
+#   - muros curvos se cargan con la posición de cada bumper proyectada sobre
+#     el eje del truss.
+# Todos los trusses se ensamblan en una sola matriz de rigidez rala (bloques
+# independientes) y se resuelven con un único spsolve: cientos de puntos en
+# pocos milisegundos. Se reporta la reacción de cada motor, el motor estándar
+# que le corresponde, el momento flector máximo y la flecha de cada truss.
+import csv
+import io
+import math
+
+import numpy as np
+
+from .calculos import FRACCION_CABLEADO, PESO_BUMPER_KG, seleccionar_motor
+
+G = 9.81
+# Truss cuadrado de 29 cm de referencia (aluminio); reemplazar con la tabla del fabricante
+TRUSS_ESTANDAR = {
+    "ei_knm2": 1800.0,       # rigidez a flexión E*I
+    "peso_kg_m": 6.0,        # peso propio
+    "momento_adm_knm": 10.0, # momento flector admisible
+}
+# Estiramiento de cadena y cuerpo del motor: ~1 mm cada 100 kg
+RIGIDEZ_MOTOR_KN_M = 1000.0
+
+
+def _sparse():
+    try:
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.linalg import spsolve
+    except ImportError:
+        raise ImportError("El cálculo estructural requiere SciPy (pip install scipy)") from None
+    return coo_matrix, spsolve
+
+
+class RigEstructural:
+    __slots__ = ("trusses", "truss_punto", "x_punto", "reaccion_kg", "motor_kg", "factor_seguridad",
+                 "momento_max_knm", "flecha_max_mm", "carga_total_kg", "x_nodo", "momento_knm")
+
+    def __init__(self, trusses, truss_punto, x_punto, reaccion_kg, factor_seguridad, x_nodo, momento_knm,
+                 flecha_max_mm, carga_total_kg):
+        self.trusses = trusses
+        self.truss_punto = truss_punto
+        self.x_punto = x_punto
+        self.reaccion_kg = reaccion_kg
+        self.factor_seguridad = factor_seguridad
+        self.motor_kg = [seleccionar_motor(max(r, 0.0), factor_seguridad) for r in reaccion_kg.tolist()]
+        # Diagrama de momentos por truss (kN·m, positivo = tracción abajo), sobre sus nodos
+        self.x_nodo = x_nodo
+        self.momento_knm = momento_knm
+        self.momento_max_knm = np.array([float(np.abs(m).max()) for m in momento_knm])
+        self.flecha_max_mm = flecha_max_mm
+        self.carga_total_kg = carga_total_kg
+
+    @property
+    def puntos(self):
+        return len(self.reaccion_kg)
+
+    def valores(self):
+        reparto = self.carga_total_kg / self.puntos
+        motores = [m for m in self.motor_kg if m is not None]
+        return {
+            "puntos_colgado": self.puntos,
+            "carga_total_kg": self.carga_total_kg,
+            "reaccion_max_kg": float(self.reaccion_kg.max()),
+            "reaccion_min_kg": float(self.reaccion_kg.min()),
+            # Cuánto más carga el motor más exigido respecto del reparto parejo
+            "sobrecarga_vs_parejo": float(self.reaccion_kg.max() / reparto - 1),
+            "levantamiento": bool(self.reaccion_kg.min() < 0),
+            "motor_max_kg": max(motores) if len(motores) == self.puntos else None,
+            "motores_kg": {m: self.motor_kg.count(m) for m in sorted(set(motores))},
+            "momento_max_knm": float(self.momento_max_knm.max()),
+            "uso_flexion_max": float(max(m / t["momento_adm_knm"] for m, t in zip(self.momento_max_knm, self.trusses))),
+            "flecha_max_mm": float(self.flecha_max_mm.max()),
+        }
+
+    def plan(self):
+        # Una fila por punto de colgado, agrupados por truss
+        return [{
+            "punto": i + 1,
+            "truss": int(self.truss_punto[i]) + 1,
+            "x_m": float(self.x_punto[i]),
+            "reaccion_kg": float(self.reaccion_kg[i]),
+            "reaccion_kn": float(self.reaccion_kg[i] * G / 1000),
+            # None cuando ningún motor estándar alcanza: requiere ingeniería estructural
+            "motor_kg": self.motor_kg[i],
+        } for i in range(self.puntos)]
+
+    def escribir_csv(self, archivo, separador=";"):
+        escritor = csv.writer(archivo, delimiter=separador)
+        escritor.writerow(["Punto", "Truss", "Posicion (m)", "Reaccion (kg)", "Reaccion (kN)",
+                           f"Motor (kg WLL, SF {self.factor_seguridad}:1)"])
+        for p in self.plan():
+            escritor.writerow([p["punto"], p["truss"], round(p["x_m"], 3), round(p["reaccion_kg"], 1),
+                               round(p["reaccion_kn"], 2), p["motor_kg"] if p["motor_kg"] is not None else "Ing. Estructural Req."])
+
+    def reporte_csv(self):
+        salida = io.StringIO()
+        self.escribir_csv(salida)
+        return salida.getvalue()
+
+
+def _matriz_elementos(ei, h):
+    # Rigidez 4x4 de cada elemento de viga (dof: w1, θ1, w2, θ2), apilada (n, 4, 4)
+    c = (ei / h ** 3)[:, None, None]
+    h = h[:, None, None]
+    uno = np.ones_like(h)
+    return c * np.block([
+        [12 * uno, 6 * h, -12 * uno, 6 * h],
+        [6 * h, 4 * h ** 2, -6 * h, 2 * h ** 2],
+        [-12 * uno, -6 * h, 12 * uno, -6 * h],
+        [6 * h, 2 * h ** 2, -6 * h, 4 * h ** 2],
+    ])
+
+
+def resolver_rig(trusses, cargas, factor_seguridad=8, rigidez_motor_kn_m=RIGIDEZ_MOTOR_KN_M, paso_m=0.25):
+    # trusses: lista de dicts con "largo_m" y "motores_m" (posiciones desde el
+    #   inicio del truss) y, opcionales, "ei_knm2", "peso_kg_m" y
+    #   "momento_adm_knm" (por defecto TRUSS_ESTANDAR).
+    # cargas: iterable de (truss, x_m, kg) con truss 0-based.
+    # paso_m: largo máximo de elemento para el diagrama de momentos.
+    coo_matrix, spsolve = _sparse()
+    trusses = [dict(TRUSS_ESTANDAR, **t) for t in trusses]
+    cargas = np.asarray(list(cargas), dtype=float).reshape(-1, 3)
+    truss_carga = cargas[:, 0].astype(np.int64)
+    if len(trusses) == 0:
+        raise ValueError("El rig no tiene trusses")
+    if truss_carga.size and (truss_carga.min() < 0 or truss_carga.max() >= len(trusses)):
+        raise ValueError("Carga asignada a un truss inexistente")
+
+    xs, eis, hs, ini_elem, offsets = [], [], [], [], [0]
+    motores_globales, truss_punto, x_punto, pesos = [], [], [], []
+    for k, t in enumerate(trusses):
+        largo = float(t["largo_m"])
+        motores = np.sort(np.asarray(t["motores_m"], dtype=float))
+        x_cargas = cargas[truss_carga == k, 1]
+        if len(motores) < 2:
+            raise ValueError(f"Truss {k + 1}: se necesitan al menos 2 motores")
+        if largo <= 0 or motores[0] < 0 or motores[-1] > largo or (x_cargas.size and (x_cargas.min() < 0 or x_cargas.max() > largo)):
+            raise ValueError(f"Truss {k + 1}: motores y cargas deben estar dentro de 0..{largo:g} m")
+        # Nodos: motores, cargas (al mm) y extremos, más una grilla de paso_m sin
+        # los puntos demasiado cercanos a un nodo obligatorio (elementos muy
+        # cortos empeoran el condicionamiento de la matriz)
+        fijos = np.unique(np.round(np.concatenate(([0.0, largo], motores, x_cargas)), 3))
+        grilla = np.linspace(0, largo, max(1, math.ceil(largo / paso_m)) + 1)
+        cerca = np.minimum(np.abs(grilla - fijos[np.clip(np.searchsorted(fijos, grilla), 0, fijos.size - 1)]),
+                           np.abs(grilla - fijos[np.clip(np.searchsorted(fijos, grilla) - 1, 0, fijos.size - 1)]))
+        x = np.union1d(fijos, grilla[cerca > paso_m / 4])
+        h = np.diff(x)
+        xs.append(x)
+        hs.append(h)
+        eis.append(np.full(h.size, t["ei_knm2"] * 1000))
+        ini_elem.append(offsets[-1] + np.arange(h.size))
+        pesos.append(np.full(h.size, t["peso_kg_m"] * G))
+        motores_globales.append(offsets[-1] + np.searchsorted(x, np.round(motores, 3)))
+        truss_punto.append(np.full(motores.size, k))
+        x_punto.append(motores)
+        offsets.append(offsets[-1] + x.size)
+
+    n = offsets[-1]
+    h = np.concatenate(hs)
+    ini = np.concatenate(ini_elem)
+    q = np.concatenate(pesos)
+    motores = np.concatenate(motores_globales)
+
+    # Ensamble: cada elemento une los nodos ini e ini + 1 (2 dof por nodo)
+    ke = _matriz_elementos(np.concatenate(eis), h)
+    dof = np.stack((2 * ini, 2 * ini + 1, 2 * ini + 2, 2 * ini + 3), axis=1)
+    filas = np.broadcast_to(dof[:, :, None], ke.shape).ravel()
+    columnas = np.broadcast_to(dof[:, None, :], ke.shape).ravel()
+    k_motor = rigidez_motor_kn_m * 1000
+    filas = np.concatenate((filas, 2 * motores))
+    columnas = np.concatenate((columnas, 2 * motores))
+    datos = np.concatenate((ke.ravel(), np.full(motores.size, k_motor)))
+    rigidez = coo_matrix((datos, (filas, columnas)), shape=(2 * n, 2 * n)).tocsc()
+
+    # Fuerzas (N, positivas hacia arriba): peso propio con cargas nodales
+    # equivalentes y bumpers como cargas puntuales en sus nodos
+    f_elem = np.stack((-q * h / 2, -q * h ** 2 / 12, -q * h / 2, q * h ** 2 / 12), axis=1)
+    fuerzas = np.zeros(2 * n)
+    np.add.at(fuerzas, dof.ravel(), f_elem.ravel())
+    for k, x in enumerate(xs):
+        en_truss = truss_carga == k
+        nodo_carga = offsets[k] + np.searchsorted(x, np.round(cargas[en_truss, 1], 3))
+        np.add.at(fuerzas, 2 * nodo_carga, -cargas[en_truss, 2] * G)
+
+    u = spsolve(rigidez, fuerzas)
+    w = u[0::2]
+    reaccion_kg = -k_motor * w[motores] / G
+
+    # Momento flector en los extremos de cada elemento a partir de sus fuerzas internas
+    extremos = np.einsum("eij,ej->ei", ke, u[dof]) - f_elem
+    m_ini, m_fin = -extremos[:, 1], extremos[:, 3]
+    momento, flecha = [], []
+    for k in range(len(trusses)):
+        e = slice(offsets[k] - k, offsets[k + 1] - k - 1)
+        momento.append(np.concatenate((m_ini[e][:1], m_fin[e])) / 1000)
+        nodos = slice(offsets[k], offsets[k + 1])
+        # Flecha respecto de la línea que une los motores estirados
+        base = np.interp(xs[k], x_punto[k], w[motores_globales[k]])
+        flecha.append(float(np.abs(w[nodos] - base).max() * 1000))
+
+    carga_total = float(cargas[:, 2].sum() + sum(t["peso_kg_m"] * t["largo_m"] for t in trusses))
+    return RigEstructural(trusses, np.concatenate(truss_punto), np.concatenate(x_punto), reaccion_kg,
+                          factor_seguridad, xs, momento, np.array(flecha), carga_total)
+
+
+def cargas_bumpers(columnas, filas, cab_w_mm, cab_peso_kg=11.0, inicio_m=0.0, posiciones_m=None):
+    # Carga de cada bumper (una columna colgada) con el mismo criterio que
+    # LedRiggingCalc: gabinetes + cableado + bumper. filas: escalar o una
+    # cantidad por columna (muros desparejos). posiciones_m: centro de cada
+    # columna sobre el eje del truss (muros curvos); por defecto, en fila
+    # desde inicio_m.
+    columnas = int(columnas)
+    filas = np.broadcast_to(np.asarray(filas, dtype=float), (columnas,))
+    kg = filas * cab_peso_kg * (1 + FRACCION_CABLEADO) + PESO_BUMPER_KG
+    if posiciones_m is None:
+        posiciones_m = inicio_m + (np.arange(columnas) + 0.5) * cab_w_mm / 1000
+    return np.asarray(posiciones_m, dtype=float), kg
+
+
+def rig_muro(columnas, filas, cab_w_mm, cab_peso_kg=11.0, motores=None, voladizo_m=0.5, trusses=1, truss_m=None,
+             posiciones_m=None, factor_seguridad=8, truss=None, **kw):
+    # Muro colgado centrado bajo uno o más trusses paralelos idénticos (cada
+    # bumper se reparte en partes iguales entre ellos). truss_m y motores (una
+    # cantidad, repartida entre voladizo_m y truss_m - voladizo_m, o una lista
+    # de posiciones) siguen por defecto el criterio de LedRiggingCalc.
+    ancho_m = int(columnas) * cab_w_mm / 1000
+    truss_m = truss_m or math.ceil(ancho_m + 1.0)
+    if motores is None:
+        motores = max(2, math.ceil(truss_m / 3.0) + 1)
+    if np.ndim(motores) == 0:
+        motores = np.linspace(voladizo_m, truss_m - voladizo_m, int(motores))
+    x, kg = cargas_bumpers(columnas, filas, cab_w_mm, cab_peso_kg, (truss_m - ancho_m) / 2, posiciones_m)
+    cargas = [(k, xi, ki / trusses) for k in range(trusses) for xi, ki in zip(x.tolist(), kg.tolist())]
+    definicion = dict(truss or {}, largo_m=truss_m, motores_m=motores)
+    return resolver_rig([definicion] * trusses, cargas, factor_seguridad=factor_seguridad, **kw)
+
+
+def rig_desde_resultado(resultado, opcion="Opcion 1 (Ideal)", **kw):
+    # Rig para una opción de layout de un ResultadoProyecto con el peso de
+    # gabinete de la especificación
+    o = resultado.raw["opciones"][opcion]
+    return rig_muro(o["columnas"], o["filas"], o["cab_w"], resultado.spec["cab_peso_kg"], **kw)
@@ -0,0 +1,384 @@
+# ==========================================
+# EXPORTACIÓN POR STREAMING (CSV / JSON / XLSX / PARQUET)
+# ==========================================
+# Escritores que reciben filas de a una (dict por nombre de columna o
+# secuencia en el orden de columnas) y las vuelcan al destino a medida que
+# llegan, así exportar 100k proyectos no junta todo en memoria:
+#   - csv:        números crudos, separador ",".
+#   - csv-latam:  separador ";", números con formato_latam y BOM UTF-8 para
+#                 que Excel en español los abra como números.
+#   - jsonl:      un objeto JSON por línea.
+#   - json:       un arreglo JSON, escrito elemento por elemento.
+#   - xlsx:       hoja única armada con zipfile; la hoja se comprime mientras
+#                 se escribe (celdas con texto en línea, sin tabla de strings
+#                 compartidos que habría que guardar hasta el final).
+#   - parquet:    requiere pyarrow; se juntan filas_por_grupo filas y se
+#                 escribe un row group. Los números van como float64 salvo
+#                 tipos explícitos: un proyecto puede traer 650.5 W/m² donde
+#                 otro trae 500 y el esquema no puede cambiar a mitad del archivo.
+#
+#   with abrir_escritor("resultados.xlsx", columnas) as escritor:
+#       for fila in filas:
+#           escritor.escribir(fila)
+import io
+import json
+import math
+import os
+
+from .formato import _INTERCAMBIO, formato_latam
+
+FORMATOS = ("csv", "csv-latam", "jsonl", "json", "xlsx", "parquet")
+EXTENSIONES = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "json", ".xlsx": "xlsx",
+               ".parquet": "parquet"}
+MAX_FILAS_XLSX = 1048576
+
+
+def formato_desde_ruta(ruta, defecto="csv"):
+    return EXTENSIONES.get(os.path.splitext(str(ruta))[1].lower(), defecto)
+
+
+# Tipos que los escritores manejan directo; el resto pasa por _nativo
+_NATIVOS = frozenset((int, float, str, bool, type(None)))
+
+
+def _nativo(v):
+    # Escalares numéricos de otras bibliotecas (np.float64, np.int64, ...) como
+    # int/float nativos: repr(np.float64(1.5)) es "np.float64(1.5)" en NumPy 2.
+    # numbers se importa recién cuando aparece un tipo no nativo.
+    import numbers
+    if isinstance(v, bool):
+        return v
+    if not isinstance(v, numbers.Real):
+        # np.bool_ no es numbers.Real
+        return bool(v) if getattr(getattr(v, "dtype", None), "kind", None) == "b" else v
+    return int(v) if isinstance(v, numbers.Integral) else float(v)
+
+
+class _Escritor:
+    # Abre el destino (ruta o archivo ya abierto) y sólo cierra lo que abrió
+    __slots__ = ("columnas", "filas", "_archivo", "_propio")
+    binario = False
+
+    def __init__(self, destino, columnas, **abrir):
+        self.columnas = list(columnas)
+        self.filas = 0
+        self._propio = not hasattr(destino, "write")
+        if self._propio:
+            modo = "wb" if self.binario else "w"
+            self._archivo = open(destino, modo, **({} if self.binario else dict({"newline": "", "encoding": "utf-8"}, **abrir)))
+        else:
+            self._archivo = destino
+
+    def _valores(self, fila):
+        if isinstance(fila, (list, tuple)):
+            return fila
+        return [fila.get(c) for c in self.columnas]
+
+    def escribir(self, fila):
+        raise NotImplementedError
+
+    def escribir_filas(self, filas):
+        for fila in filas:
+            self.escribir(fila)
+
+    def _terminar(self):
+        pass
+
+    def cerrar(self):
+        if self._archivo is None:
+            return
+        self._terminar()
+        if self._propio:
+            self._archivo.close()
+        else:
+            self._archivo.flush()
+        self._archivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class EscritorCSV(_Escritor):
+    __slots__ = ("latam", "decimales", "_spec", "_csv")
+
+    def __init__(self, destino, columnas, latam=False, decimales=2, separador=None, encabezado=True):
+        # La BOM sólo se agrega al crear el archivo; un stream abierto se respeta tal cual
+        super().__init__(destino, columnas, **({"encoding": "utf-8-sig"} if latam else {}))
+        self.latam = latam
+        self.decimales = decimales
+        self._spec = f",.{decimales}f"
+        # csv se importa acá para no sumarlo al arranque del núcleo de cálculo
+        import csv
+        self._csv = csv.writer(self._archivo, delimiter=separador or (";" if latam else ","), lineterminator="\n")
+        if encabezado:
+            self._csv.writerow(self.columnas)
+
+    def escribir(self, fila):
+        valores = self._valores(fila)
+        if self.latam:
+            valores = [v if type(v) in _NATIVOS else _nativo(v) for v in valores]
+            # formato_latam en línea: con 100k filas la llamada por celda domina el
+            # tiempo. bool, None, texto y NaN/inf pasan tal cual.
+            if self.decimales == 0:
+                valores = [formato_latam(v, 0) if type(v) in (int, float) and v - v == 0 else v for v in valores]
+            else:
+                spec = self._spec
+                valores = [f"{v:,}".replace(",", ".") if type(v) is int
+                           else format(v, spec).translate(_INTERCAMBIO) if type(v) is float and v - v == 0
+                           else v for v in valores]
+        self._csv.writerow(valores)
+        self.filas += 1
+
+
+class EscritorJSON(_Escritor):
+    # lineas=True: JSONL; si no, un arreglo con un objeto por fila
+    __slots__ = ("lineas",)
+
+    def __init__(self, destino, columnas, lineas=False):
+        super().__init__(destino, columnas)
+        self.lineas = lineas
+
+    def escribir(self, fila):
+        if not isinstance(fila, dict):
+            fila = dict(zip(self.columnas, fila))
+        texto = json.dumps(fila, ensure_ascii=False, default=dict)
+        if self.lineas:
+            self._archivo.write(texto + "\n")
+        else:
+            self._archivo.write(("[\n" if self.filas == 0 else ",\n") + texto)
+        self.filas += 1
+
+    def _terminar(self):
+        if not self.lineas:
+            self._archivo.write("[]\n" if self.filas == 0 else "\n]\n")
+
+
+_XLSX_ESTATICOS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '</Relationships>'),
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font><font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+        '</styleSheet>'),
+}
+# Escapes de XML y caracteres de control que XML 1.0 no admite, en una sola tabla
+_ESCAPE_XML = str.maketrans(dict(dict.fromkeys([chr(c) for c in range(32) if c not in (9, 10, 13)]),
+                                 **{"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}))
+
+
+def _columna_excel(i):
+    letras = ""
+    i += 1
+    while i:
+        i, resto = divmod(i - 1, 26)
+        letras = chr(65 + resto) + letras
+    return letras
+
+
+class EscritorXLSX(_Escritor):
+    __slots__ = ("_zip", "_hoja", "_refs", "_pendiente")
+    binario = True
+
+    def __init__(self, destino, columnas, hoja="Resultados", encabezado=True):
+        # zipfile trae bz2/lzma/shutil: se importa sólo al exportar a XLSX
+        import zipfile
+
+        super().__init__(destino, columnas)
+        self._zip = zipfile.ZipFile(self._archivo, "w", compression=zipfile.ZIP_DEFLATED)
+        for nombre, contenido in _XLSX_ESTATICOS.items():
+            self._zip.writestr(nombre, contenido)
+        self._zip.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name={_atributo(hoja[:31])} sheetId="1" r:id="rId1"/></sheets></workbook>'))
+        self._hoja = self._zip.open("xl/worksheets/sheet1.xml", "w")
+        self._hoja.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            b'<sheetViews><sheetView workbookViewId="0">'
+            + (b'<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>' if encabezado else b"")
+            + b'</sheetView></sheetViews><sheetData>')
+        self._refs = [_columna_excel(i) for i in range(len(self.columnas))]
+        self._pendiente = []
+        if encabezado:
+            self._fila(self.columnas, ' s="1"')
+
+    def _fila(self, valores, estilo=""):
+        n = len(self._pendiente) + self.filas + 1
+        if n > MAX_FILAS_XLSX:
+            raise ValueError(f"XLSX admite hasta {MAX_FILAS_XLSX} filas por hoja")
+        celdas = []
+        for ref, v in zip(self._refs, valores):
+            if v is None:
+                continue
+            if type(v) not in _NATIVOS:
+                v = _nativo(v)
+            if isinstance(v, bool):
+                celdas.append(f'<c r="{ref}{n}" t="b"{estilo}><v>{int(v)}</v></c>')
+            elif isinstance(v, (int, float)):
+                if math.isfinite(v):
+                    celdas.append(f'<c r="{ref}{n}"{estilo}><v>{v!r}</v></c>')
+            else:
+                texto = str(v).translate(_ESCAPE_XML)
+                celdas.append(f'<c r="{ref}{n}" t="inlineStr"{estilo}><is><t xml:space="preserve">{texto}</t></is></c>')
+        self._pendiente.append(f'<row r="{n}">{"".join(celdas)}</row>')
+        if len(self._pendiente) >= 512:
+            self._volcar()
+
+    def _volcar(self):
+        self.filas += len(self._pendiente)
+        self._hoja.write("".join(self._pendiente).encode("utf-8"))
+        self._pendiente = []
+
+    def escribir(self, fila):
+        self._fila(self._valores(fila))
+
+    def _terminar(self):
+        self._volcar()
+        self._hoja.write(b"</sheetData></worksheet>")
+        self._hoja.close()
+        self._zip.close()
+
+
+def _atributo(texto):
+    return '"' + texto.translate(_ESCAPE_XML) + '"'
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Exportar a Parquet requiere pyarrow (pip install pyarrow)") from None
+    return pyarrow, pyarrow.parquet
+
+
+def _entero(columna, valor):
+    # 3.0 -> 3; un valor con decimales no entra en una columna int64
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    if isinstance(valor, int):
+        return valor
+    raise ValueError(f"Columna {columna}: se esperaba un entero (recibido {valor!r})")
+
+
+class EscritorParquet(_Escritor):
+    # tipos: columna -> int, float, str o bool (lote.tipos_salida() para los
+    # lotes); las columnas sin tipo se infieren del primer grupo (números ->
+    # float64, columnas sin valores -> texto)
+    __slots__ = ("tipos", "filas_por_grupo", "_buffer", "_pq", "_esquema", "_parquet")
+    binario = True
+
+    def __init__(self, destino, columnas, tipos=None, filas_por_grupo=8192):
+        self._pq = _pyarrow()
+        super().__init__(destino, columnas)
+        self.tipos = dict(tipos or {})
+        self.filas_por_grupo = filas_por_grupo
+        self._buffer = [[] for _ in self.columnas]
+        self._esquema = None
+
+    def escribir(self, fila):
+        for lista, v in zip(self._buffer, self._valores(fila)):
+            lista.append(v if type(v) in _NATIVOS else _nativo(v))
+        if len(self._buffer[0]) >= self.filas_por_grupo:
+            self._volcar()
+
+    def _tipo(self, columna, valores):
+        tipo = self.tipos.get(columna)
+        if tipo is None:
+            presentes = [v for v in valores if v is not None]
+            if presentes and all(isinstance(v, bool) for v in presentes):
+                tipo = bool
+            elif presentes and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in presentes):
+                tipo = float
+            else:
+                tipo = str
+        return tipo
+
+    def _volcar(self):
+        if not self._buffer[0]:
+            return
+        pa, pq = self._pq
+        arrow = {int: pa.int64(), float: pa.float64(), str: pa.string(), bool: pa.bool_()}
+        if self._esquema is None:
+            self.tipos = {c: self._tipo(c, vals) for c, vals in zip(self.columnas, self._buffer)}
+            self._esquema = pa.schema([(c, arrow[t]) for c, t in self.tipos.items()])
+            self._parquet = pq.ParquetWriter(self._archivo, self._esquema)
+        columnas = []
+        for c, vals in zip(self.columnas, self._buffer):
+            tipo = self.tipos[c]
+            if tipo is str:
+                vals = [None if v is None else str(v) for v in vals]
+            elif tipo is float:
+                vals = [None if v is None else float(v) for v in vals]
+            elif tipo is int:
+                vals = [None if v is None else _entero(c, v) for v in vals]
+            columnas.append(pa.array(vals, type=arrow[tipo]))
+        self._parquet.write_table(pa.Table.from_arrays(columnas, schema=self._esquema))
+        self.filas += len(self._buffer[0])
+        self._buffer = [[] for _ in self.columnas]
+
+    def _terminar(self):
+        self._volcar()
+        if self._esquema is None:
+            # Sin filas: archivo válido con los tipos declarados (texto el resto)
+            pa, pq = self._pq
+            arrow = {int: pa.int64(), float: pa.float64(), str: pa.string(), bool: pa.bool_()}
+            self._esquema = pa.schema([(c, arrow[self.tipos.get(c, str)]) for c in self.columnas])
+            self._parquet = pq.ParquetWriter(self._archivo, self._esquema)
+        self._parquet.close()
+
+
+def abrir_escritor(destino, columnas, formato=None, **opciones):
+    formato = formato or formato_desde_ruta(destino)
+    if formato == "csv":
+        return EscritorCSV(destino, columnas, **opciones)
+    if formato == "csv-latam":
+        return EscritorCSV(destino, columnas, latam=True, **opciones)
+    if formato in ("json", "jsonl"):
+        return EscritorJSON(destino, columnas, lineas=formato == "jsonl", **opciones)
+    if formato == "xlsx":
+        return EscritorXLSX(destino, columnas, **opciones)
+    if formato == "parquet":
+        return EscritorParquet(destino, columnas, **opciones)
+    raise ValueError(f"Formato de exportación desconocido {formato!r} (use {', '.join(FORMATOS)})")
+
+
+def exportar_bytes(filas, columnas, formato, **opciones):
+    # Un archivo completo en memoria, para descargas de un solo proyecto
+    binario = formato in ("xlsx", "parquet")
+    buffer = io.BytesIO() if binario else io.StringIO()
+    with abrir_escritor(buffer, columnas, formato, **opciones) as escritor:
+        escritor.escribir_filas(filas)
+    if binario:
+        return buffer.getvalue()
+    prefijo = "\ufeff" if formato == "csv-latam" else ""
+    return (prefijo + buffer.getvalue()).encode("utf-8")
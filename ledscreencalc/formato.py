@@ -0,0 +1,15 @@
+# ==========================================
+# 0. FUNCIÓN DE LOCALIZACIÓN
+# ==========================================
+# Intercambia separadores de miles y decimales en una sola pasada
+_INTERCAMBIO = str.maketrans(",.", ".,")
+
+
+def formato_latam(valor, decimales=2):
+    if isinstance(valor, (int, float)):
+        if decimales == 0:
+            estandar = f"{int(valor):,}"
+            return estandar.replace(',', '.')
+        estandar = f"{valor:,.{decimales}f}"
+        return estandar.translate(_INTERCAMBIO)
+    return valor
@@ -0,0 +1,121 @@
+# ==========================================
+# GRAFO DE RECÁLCULO INCREMENTAL
+# ==========================================
+# Cada nodo declara qué campos de la especificación lee y de qué nodos depende.
+# Al actualizar, un nodo sólo se recalcula si cambió alguna de sus entradas o
+# la versión de alguna dependencia. Así, cambiar el shutter de cámara sólo
+# recalcula la sincronización (y el ensamblado final), no el layout, la
+# energía, el izaje ni los repuestos.
+from collections import Counter
+
+from .calculos import calcular_sincronizacion, valores_sincronizacion
+from .proyecto import (SPEC_DEFAULTS, calculadora_energia, calculadora_hardware, calculadora_izaje,
+                       calculadora_procesamiento, calculadora_repuestos, normalizar_spec)
+from .resultado import ResultadoProyecto
+
+ENTRADAS_HARDWARE = ("uso", "entorno", "contenido", "req_w", "req_h", "dist_vis_m", "pitch", "brillo",
+                     "mod_res_w", "mod_res_h", "mod_w", "mod_h", "cab_w", "cab_h")
+ENTRADAS_VIDEO = ("uso", "input_res", "puerto", "calidad", "fps_video", "distancia_cable_m", "num_entradas")
+ENTRADAS_CAMARA = ("refresh_rate_hz", "shutter_speed_str", "fps_video")
+
+
+def _base(dep):
+    return dep["hardware"]["Opcion 1 (Ideal)"]["raw"]
+
+
+def _hardware(s, dep):
+    return calculadora_hardware(s).generar_opciones()
+
+
+def _procesamiento(s, dep):
+    calc = calculadora_procesamiento(s, _base(dep))
+    v_hw = calc.valores_hardware_procesador()
+    return {"calc": calc, "valores": calc.valores_procesamiento(),
+            "procesador_raw": v_hw, "procesador": calc.calcular_hardware_procesador(v_hw)}
+
+
+def _sincronizacion(s, dep):
+    valores = valores_sincronizacion(s["refresh_rate_hz"], s["shutter_speed_str"], s["fps_video"])
+    return {"valores": valores, "texto": calcular_sincronizacion(valores)}
+
+
+def _seccion_procesamiento(s, dep):
+    proc = dep["procesamiento"]
+    valores = dict(proc["valores"], **dep["sincronizacion"]["valores"])
+    return {"raw": valores, "formatted": proc["calc"].calcular_procesamiento(valores)}
+
+
+def _seccion(constructor, valores, formatear):
+    def nodo(s, dep):
+        calc = constructor(s, _base(dep))
+        v = getattr(calc, valores)()
+        return {"raw": v, "formatted": getattr(calc, formatear)(v)}
+    return nodo
+
+
+def _resultado(s, dep):
+    raw = {
+        "procesamiento": dep["seccion_procesamiento"]["raw"],
+        "procesador": dep["procesamiento"]["procesador_raw"],
+        "energia": dep["energia"]["raw"],
+        "izaje": dep["izaje"]["raw"],
+        "repuestos": dep["repuestos"]["raw"],
+    }
+    formatted = {
+        "procesamiento": dep["seccion_procesamiento"]["formatted"],
+        "procesador": dep["procesamiento"]["procesador"],
+        "energia": dep["energia"]["formatted"],
+        "izaje": dep["izaje"]["formatted"],
+        "repuestos": dep["repuestos"]["formatted"],
+    }
+    return ResultadoProyecto.desde_secciones(s, dep["hardware"], raw, formatted)
+
+
+class Nodo:
+    __slots__ = ("nombre", "entradas", "dependencias", "funcion")
+
+    def __init__(self, nombre, entradas, dependencias, funcion):
+        self.nombre = nombre
+        self.entradas = tuple(entradas)
+        self.dependencias = tuple(dependencias)
+        self.funcion = funcion
+
+
+# En orden topológico
+NODOS = (
+    Nodo("hardware", ENTRADAS_HARDWARE, (), _hardware),
+    Nodo("procesamiento", ENTRADAS_VIDEO, ("hardware",), _procesamiento),
+    Nodo("sincronizacion", ENTRADAS_CAMARA, (), _sincronizacion),
+    Nodo("seccion_procesamiento", (), ("procesamiento", "sincronizacion"), _seccion_procesamiento),
+    Nodo("energia", ("voltaje", "entorno", "watts_max_m2", "factor_promedio"), ("hardware",), _seccion(calculadora_energia, "valores_energia_y_clima", "calcular_energia_y_clima")),
+    Nodo("izaje", ("cab_peso_kg",), ("hardware",), _seccion(calculadora_izaje, "valores_izaje", "calcular_izaje")),
+    Nodo("repuestos", ("porcentaje_repuestos", "modo_repuestos", "disponibilidad_repuestos", "dias_show", "horas_dia"), ("hardware",), _seccion(calculadora_repuestos, "valores_repuestos", "calcular_repuestos")),
+    # El resultado lee la especificación completa, pero sólo ensambla lo ya calculado
+    Nodo("resultado", tuple(SPEC_DEFAULTS), ("hardware", "seccion_procesamiento", "procesamiento", "energia", "izaje", "repuestos"), _resultado),
+)
+
+
+class GrafoCalculo:
+    def __init__(self, nodos=NODOS):
+        self.nodos = nodos
+        self.valores = {}
+        self.recalculos = Counter()
+        self._firmas = {}
+        self._versiones = Counter()
+
+    def actualizar(self, spec):
+        s = normalizar_spec(spec)
+        for nodo in self.nodos:
+            firma = (tuple((type(s[k]).__name__, s[k]) for k in nodo.entradas)
+                     + tuple(self._versiones[d] for d in nodo.dependencias))
+            if nodo.nombre in self.valores and self._firmas[nodo.nombre] == firma:
+                continue
+            self.valores[nodo.nombre] = nodo.funcion(s, {d: self.valores[d] for d in nodo.dependencias})
+            self._firmas[nodo.nombre] = firma
+            self._versiones[nodo.nombre] += 1
+            self.recalculos[nodo.nombre] += 1
+        return self.valores["resultado"]
+
+    @property
+    def resultado(self):
+        return self.valores.get("resultado")
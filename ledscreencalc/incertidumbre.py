@@ -0,0 +1,171 @@
+# ==========================================
+# ANÁLISIS DE INCERTIDUMBRE (MONTE CARLO SOBRE TODA LA CADENA)
+# ==========================================
+# Cada valor del cálculo es una estimación puntual: medidas y peso del
+# gabinete, W/m², cableado (10%), factor promedio, MTBF de los componentes.
+# Aquí esas entradas toman distribuciones y se propagan juntas por layout,
+# energía, izaje y repuestos como operaciones de arreglo sobre todas las
+# muestras a la vez (sin construir calculadoras por muestra):
+#   - layout: barrido vectorizado (barrido.py) con las medidas muestreadas,
+#   - energía: área x W/m² x factor promedio,
+#   - izaje: carga estática y reparto por motor como LedRiggingCalc y, si
+#     SciPy está disponible, la reacción máxima del truss como viga continua:
+#     las reacciones son lineales en la carga por bumper, así que se resuelve
+#     la viga una vez por geometría (coeficientes de influencia) y se
+#     escalan con la carga de cada muestra,
+#   - repuestos: fallas del show con MTBF muestreado y probabilidad de que el
+#     kit calculado alcance.
+# El peso del gabinete se muestrea por lote (todos los gabinetes de una
+# muestra pesan lo mismo): es el caso conservador.
+import numpy as np
+
+from .barrido import barrer_configuraciones
+from .calculos import FRACCION_CABLEADO, MOTORES_KG, PESO_BUMPER_KG
+from .proyecto import calculadora_hardware, calculate_project, validar_spec
+from .repuestos import COMPONENTES, fallas_esperadas
+
+# Distribuciones por defecto. Formas aceptadas (None = valor nominal del proyecto):
+#   número                         valor fijo
+#   ("tolerancia", rel)            normal centrada en el nominal con 3σ = rel x nominal
+#   ("normal", media, desvío)
+#   ("uniforme", mín, máx)
+#   ("triangular", mín, moda, máx)
+#   ("lognormal", mediana, σ_log)
+DISTRIBUCIONES_DEFECTO = {
+    "cab_w": ("tolerancia", 0.002),
+    "cab_h": ("tolerancia", 0.002),
+    "cab_peso_kg": ("tolerancia", 0.08),
+    "watts_max_m2": ("tolerancia", 0.15),
+    "fraccion_cableado": ("triangular", 0.06, None, 0.18),
+    "peso_bumper_kg": ("tolerancia", 0.10),
+    "factor_promedio": ("triangular", 0.15, None, 0.55),
+    "mtbf_modulos_h": ("lognormal", None, 0.35),
+    "mtbf_rcards_h": ("lognormal", None, 0.35),
+    "mtbf_psu_h": ("lognormal", None, 0.35),
+}
+PERCENTILES = (5, 50, 95, 99)
+
+
+def _muestrear(nombre, dist, nominal, n, azar):
+    if isinstance(dist, (int, float)):
+        return np.full(n, float(dist))
+    tipo, *p = dist
+    p = [nominal if v is None else v for v in p]
+    if tipo == "tolerancia":
+        return azar.normal(nominal, abs(nominal) * p[0] / 3, n)
+    if tipo == "normal":
+        return azar.normal(p[0], p[1], n)
+    if tipo == "uniforme":
+        return azar.uniform(p[0], p[1], n)
+    if tipo == "triangular":
+        return azar.triangular(p[0], min(max(p[1], p[0]), p[2]), p[2], n)
+    if tipo == "lognormal":
+        return p[0] * np.exp(azar.normal(0.0, p[1], n))
+    raise ValueError(f"{nombre}: distribución desconocida {tipo!r}")
+
+
+def resumen(valores, percentiles=PERCENTILES):
+    if valores.size == 0:
+        return dict({"media": None}, **{f"p{p:g}": None for p in percentiles})
+    q = np.percentile(valores, percentiles)
+    return dict({"media": float(valores.mean())}, **{f"p{p:g}": float(v) for p, v in zip(percentiles, q)})
+
+
+def _influencia(columnas, truss_m, puntos, cab_w):
+    # Reacciones por kg de carga en todos los bumpers a la vez y por el peso propio del truss
+    from .estructura import TRUSS_ESTANDAR, cargas_bumpers, resolver_rig
+
+    motores = np.linspace(0.5, truss_m - 0.5, puntos)
+    x, _ = cargas_bumpers(columnas, 1, cab_w, inicio_m=(truss_m - columnas * cab_w / 1000) / 2)
+    por_kg = resolver_rig([{"largo_m": truss_m, "motores_m": motores, "peso_kg_m": 0.0}],
+                          [(0, xi, 1.0) for xi in x.tolist()]).reaccion_kg
+    propio = resolver_rig([{"largo_m": truss_m, "motores_m": motores, "peso_kg_m": TRUSS_ESTANDAR["peso_kg_m"]}],
+                          []).reaccion_kg
+    return por_kg, propio
+
+
+def analizar_incertidumbre(spec, distribuciones=None, muestras=100000, semilla=0, viga=True, factor_seguridad=8):
+    # distribuciones: campos de DISTRIBUCIONES_DEFECTO a reemplazar.
+    # Devuelve "muestras" (arreglos por variable) y "resumen" (media y P5/P50/P95/P99).
+    s = validar_spec(spec)
+    base = calculate_project(s).raw
+    hw = calculadora_hardware(s)
+    dist = dict(DISTRIBUCIONES_DEFECTO, **(distribuciones or {}))
+    desconocidas = set(dist) - set(DISTRIBUCIONES_DEFECTO)
+    if desconocidas:
+        raise ValueError(f"Variables inciertas desconocidas: {', '.join(sorted(desconocidas))}")
+    if muestras < 1:
+        raise ValueError("muestras debe ser >= 1")
+
+    nominal = {
+        "cab_w": hw.cab_w, "cab_h": hw.cab_h, "cab_peso_kg": s["cab_peso_kg"],
+        "watts_max_m2": base["energia"]["watts_max_m2"], "fraccion_cableado": FRACCION_CABLEADO,
+        "peso_bumper_kg": PESO_BUMPER_KG, "factor_promedio": s["factor_promedio"],
+        **{f"mtbf_{c}_h": COMPONENTES[c]["mtbf_h"] for c in COMPONENTES},
+    }
+    azar = np.random.default_rng(semilla)
+    m = {k: _muestrear(k, dist[k], nominal[k], muestras, azar) for k in DISTRIBUCIONES_DEFECTO}
+    for k in ("cab_w", "cab_h", "cab_peso_kg", "watts_max_m2", "peso_bumper_kg"):
+        np.maximum(m[k], 1e-9, out=m[k])
+    np.clip(m["factor_promedio"], 0.0, 1.0, out=m["factor_promedio"])
+    np.maximum(m["fraccion_cableado"], 0.0, out=m["fraccion_cableado"])
+
+    # Layout (Opción 1): la grilla se elige con la medida real del gabinete
+    lay = barrer_configuraciones(s["req_w"], s["req_h"], m["cab_w"], m["cab_h"], hw.cab_res_w, hw.cab_res_h,
+                                 hw.total_modulos_por_cab)
+
+    # Energía
+    pot_max_w = lay["area_m2"] * m["watts_max_m2"]
+    pot_prom_w = pot_max_w * m["factor_promedio"]
+    amp_fase = pot_max_w / s["voltaje"] / 3
+
+    # Izaje (mismas reglas que LedRiggingCalc)
+    peso_pura = lay["total_gabinetes"] * m["cab_peso_kg"]
+    carga_estatica = peso_pura * (1 + m["fraccion_cableado"]) + lay["columnas"] * m["peso_bumper_kg"]
+    truss_m = np.ceil(lay["ancho_fisico"] / 1000 + 1.0)
+    puntos = np.maximum(2, np.ceil(truss_m / 3.0) + 1)
+    carga_por_punto = carga_estatica / puntos
+    salida = {
+        "columnas": lay["columnas"], "filas": lay["filas"],
+        "ancho_fisico_mm": lay["ancho_fisico"], "alto_fisico_mm": lay["alto_fisico"], "area_m2": lay["area_m2"],
+        "pot_max_kw": pot_max_w / 1000, "pot_prom_kw": pot_prom_w / 1000, "amp_fase": amp_fase,
+        "btu_max_hr": pot_max_w * 3.412, "carga_estatica_kg": carga_estatica, "carga_por_punto_kg": carga_por_punto,
+    }
+
+    if viga:
+        # Carga por bumper de cada muestra y reacción máxima por geometría
+        carga_bumper = lay["filas"] * m["cab_peso_kg"] * (1 + m["fraccion_cableado"]) + m["peso_bumper_kg"]
+        reaccion_max = np.empty(muestras)
+        ejes = (lay["columnas"], truss_m.astype(np.int64), puntos.astype(np.int64))
+        dims = tuple(int(e.max()) + 1 for e in ejes)
+        claves, grupo = np.unique(np.ravel_multi_index(ejes, dims), return_inverse=True)
+        for g, clave in enumerate(claves.tolist()):
+            columnas, largo, n_puntos = (int(v) for v in np.unravel_index(clave, dims))
+            sel = grupo == g
+            por_kg, propio = _influencia(columnas, largo, n_puntos, hw.cab_w)
+            reaccion_max[sel] = (carga_bumper[sel, None] * por_kg[None, :] + propio[None, :]).max(axis=1)
+        salida["reaccion_max_kg"] = reaccion_max
+    carga_motor = salida.get("reaccion_max_kg", carga_por_punto)
+    motores = np.asarray(MOTORES_KG, dtype=np.float64)
+    idx = np.searchsorted(motores, carga_motor * factor_seguridad)
+    salida["motor_kg"] = np.where(idx < motores.size, motores[np.minimum(idx, motores.size - 1)], np.nan)
+
+    # Repuestos: fallas del show con MTBF incierto frente al kit calculado
+    horas = s["dias_show"] * s["horas_dia"]
+    cantidades = {"modulos": lay["total_modulos"], "rcards": lay["total_gabinetes"], "psu": lay["total_gabinetes"]}
+    cubre = np.ones(muestras, dtype=bool)
+    for c, n in cantidades.items():
+        componente = dict(COMPONENTES[c], mtbf_h=m[f"mtbf_{c}_h"])
+        fallas = azar.poisson(fallas_esperadas(n, horas, componente))
+        salida[f"fallas_{c}"] = fallas
+        cubre &= fallas <= base["repuestos"][c]
+
+    res = {k: resumen(v[np.isfinite(v)] if v.dtype.kind == "f" else v) for k, v in salida.items()}
+    res["motor_kg"]["sin_motor_estandar"] = float(np.isnan(salida["motor_kg"]).mean())
+    return {
+        "muestras": salida,
+        "entradas": m,
+        "resumen": res,
+        "kit_cubre_show": float(cubre.mean()),
+        "n": muestras,
+    }
@@ -0,0 +1,206 @@
+# ==========================================
+# PROCESAMIENTO POR LOTES (CSV / JSONL)
+# ==========================================
+# Lee especificaciones de proyecto (los mismos campos que la barra lateral),
+# las reparte en bloques sobre un pool de procesos y escribe una fila de
+# resultado por proyecto a medida que terminan (CSV, JSONL, JSON, XLSX o
+# Parquet, ver exportar.py). La entrada se lee de forma perezosa y sólo hay
+# unos pocos bloques en vuelo a la vez, así que la memoria no crece con el
+# tamaño del archivo. Un error en una fila (p. ej. un
+# shutter_speed_str inválido) se reporta en esa fila y el lote sigue.
+import csv
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .exportar import abrir_escritor, formato_desde_ruta
+from .proyecto import SPEC_DEFAULTS, calculate_project, validar_spec
+
+# Campos cuyo valor por defecto es None: tipo al que se convierten desde CSV
+_TIPOS_OPCIONALES = {"brillo": float, "mod_res_w": int, "mod_res_h": int,
+                     "mod_w": float, "mod_h": float, "cab_w": float, "cab_h": float, "watts_max_m2": float}
+
+COLUMNAS_ID = ("fila", "id", "error")
+# Tipos fijos de las columnas de identificación en salidas con esquema (Parquet)
+TIPOS_ID = {"fila": int, "id": str, "error": str}
+
+
+def _convertir(campo, valor):
+    if not isinstance(valor, str):
+        return valor
+    valor = valor.strip()
+    if valor == "":
+        return None
+    tipo = _TIPOS_OPCIONALES.get(campo) or type(SPEC_DEFAULTS.get(campo))
+    try:
+        if tipo is int:
+            numero = float(valor.replace(",", "."))
+            if not numero.is_integer():
+                raise ValueError
+            return int(numero)
+        if tipo is float:
+            return float(valor.replace(",", "."))
+    except ValueError:
+        raise ValueError(f"{campo}: valor no numérico {valor!r}") from None
+    return valor
+
+
+def spec_desde_fila(fila):
+    # Convierte una fila leída de CSV/JSONL en especificación (sin validar).
+    # "id" es opcional y sólo se copia a la salida.
+    return {k: _convertir(k, v) for k, v in fila.items() if k != "id" and k is not None}
+
+
+# Proyectos de muestra para fijar el tipo de cada columna de salida: los dos
+# modos de repuestos (cada uno deja en None los campos del otro), datos de marca
+# y entradas con decimales para los campos que pasan tal cual desde la especificación
+_SPECS_TIPOS = (
+    {},
+    {"modo_repuestos": "confiabilidad"},
+    {"entorno": "Outdoor", "mod_res_w": 128, "mod_res_h": 128, "mod_w": 250.5, "mod_h": 250.5, "cab_w": 501.0,
+     "cab_h": 501.0, "req_w": 10000.5, "req_h": 5000.5, "watts_max_m2": 650.5, "refresh_rate_hz": 3840,
+     "factor_promedio": 1, "fps_video": 59.94, "cab_peso_kg": 11.5, "brillo": 1200.5, "porcentaje_repuestos": 7.5},
+)
+
+
+def columnas_salida():
+    return list(COLUMNAS_ID) + list(calculate_project({}).plano())
+
+
+def tipos_salida():
+    # Columna -> int, float, str o bool para salidas con esquema (Parquet), así
+    # el esquema no depende de qué filas caen en el primer grupo
+    vistos = {}
+    for spec in _SPECS_TIPOS:
+        for campo, valor in calculate_project(spec).plano().items():
+            if valor is not None:
+                vistos.setdefault(campo, set()).add(type(valor))
+    tipos = dict(TIPOS_ID)
+    for campo in columnas_salida()[len(COLUMNAS_ID):]:
+        clases = vistos.get(campo, {float})
+        if clases == {bool} or clases == {int} or clases == {str}:
+            tipos[campo] = clases.pop()
+        elif clases <= {int, float}:
+            tipos[campo] = float
+        else:
+            tipos[campo] = str
+    return tipos
+
+
+def procesar_fila(numero, fila):
+    if isinstance(fila, Exception):
+        return {"fila": numero, "id": None, "error": f"{type(fila).__name__}: {fila}"}
+    if not isinstance(fila, dict):
+        return {"fila": numero, "id": None, "error": "La fila debe ser un objeto JSON con los campos del proyecto"}
+    salida = {"fila": numero, "id": fila.get("id"), "error": None}
+    try:
+        salida.update(calculate_project(validar_spec(spec_desde_fila(fila))).plano())
+    except Exception as e:
+        salida["error"] = f"{type(e).__name__}: {e}"
+    return salida
+
+
+def _procesar_bloque(bloque):
+    return [procesar_fila(numero, fila) for numero, fila in bloque]
+
+
+def leer_filas(ruta, formato=None):
+    formato = formato or ("jsonl" if ruta.endswith((".jsonl", ".ndjson", ".json")) else "csv")
+    archivo = sys.stdin if ruta == "-" else open(ruta, newline="", encoding="utf-8-sig")
+    try:
+        if formato == "csv":
+            muestra = archivo.readline()
+            separador = ";" if muestra.count(";") > muestra.count(",") else ","
+            yield from csv.DictReader(_encadenar(muestra, archivo), delimiter=separador)
+        else:
+            for linea in archivo:
+                linea = linea.strip()
+                if linea:
+                    try:
+                        yield json.loads(linea)
+                    except json.JSONDecodeError as e:
+                        # Se reporta en su fila en vez de cortar el lote
+                        yield e
+    finally:
+        if archivo is not sys.stdin:
+            archivo.close()
+
+
+def _encadenar(primera, resto):
+    yield primera
+    yield from resto
+
+
+def _bloques(iterable, tamano):
+    bloque = []
+    for item in iterable:
+        bloque.append(item)
+        if len(bloque) == tamano:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+
+def procesar_lote(filas, trabajadores=None, tam_bloque=64):
+    # Generador de filas de resultado, en orden de finalización.
+    trabajadores = trabajadores or os.cpu_count() or 1
+    numeradas = enumerate(filas, 1)
+    if trabajadores == 1:
+        for numero, fila in numeradas:
+            yield procesar_fila(numero, fila)
+        return
+
+    max_en_vuelo = 2 * trabajadores
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        pendientes = set()
+        for bloque in _bloques(numeradas, tam_bloque):
+            if len(pendientes) >= max_en_vuelo:
+                listos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in listos:
+                    yield from futuro.result()
+            pendientes.add(pool.submit(_procesar_bloque, bloque))
+        while pendientes:
+            listos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in listos:
+                yield from futuro.result()
+
+
+def formato_salida_desde_ruta(ruta):
+    # ".json" sigue siendo JSONL en los lotes, como en las salidas anteriores
+    formato = formato_desde_ruta(ruta)
+    return "jsonl" if formato == "json" else formato
+
+
+class EscritorLote:
+    # Escribe cada fila de resultado apenas llega, en cualquiera de exportar.FORMATOS
+    def __init__(self, ruta, formato=None):
+        self.formato = formato or formato_salida_desde_ruta(ruta)
+        destino = ruta
+        if ruta == "-":
+            destino = sys.stdout.buffer if self.formato in ("xlsx", "parquet") else sys.stdout
+        opciones = {"tipos": tipos_salida()} if self.formato == "parquet" else {}
+        self._escritor = abrir_escritor(destino, columnas_salida(), self.formato, **opciones)
+
+    def escribir(self, fila):
+        self._escritor.escribir(fila)
+
+    def cerrar(self):
+        self._escritor.cerrar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def ejecutar_lote(entrada, salida, trabajadores=None, tam_bloque=64, formato_entrada=None, formato_salida=None):
+    total = errores = 0
+    with EscritorLote(salida, formato_salida) as escritor:
+        for fila in procesar_lote(leer_filas(entrada, formato_entrada), trabajadores, tam_bloque):
+            escritor.escribir(fila)
+            total += 1
+            errores += fila["error"] is not None
+    return total, errores
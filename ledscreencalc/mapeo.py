@@ -0,0 +1,154 @@
+# ==========================================
+# MAPEO DE GABINETES POR PUERTO (RUTEO SERPENTINA)
+# ==========================================
+# Asigna cada gabinete a un puerto RJ45 de salida y a una posición en su cadena
+# (daisy-chain) recorriendo la pantalla en serpentina. La capacidad por puerto
+# es la misma que usa LedScreenProc (10/12-bit y > 60 fps la reducen) y un
+# gabinete nunca se reparte entre dos puertos. Se prueban los recorridos
+# vertical/horizontal desde las cuatro esquinas y se elige el de menor cable
+# total (saltos entre gabinetes + tendidos desde el punto de entrada).
+#
+# Todo se resuelve con arreglos de NumPy del tamaño de la grilla, sin un objeto
+# por gabinete, así que paredes de 50k+ gabinetes se mapean en milisegundos.
+import csv
+import io
+
+import numpy as np
+
+from .calculos import capacidad_puerto_px
+
+RECORRIDOS = ("vertical", "horizontal")
+ESQUINAS = ("sup-izq", "sup-der", "inf-izq", "inf-der")
+
+
+def orden_serpentina(filas, columnas, recorrido, esquina):
+    # Posición 0-based de cada gabinete en la serpentina global (grilla filas x columnas,
+    # fila 0 arriba, columna 0 a la izquierda vista de frente)
+    r = np.arange(filas)[:, None]
+    c = np.arange(columnas)[None, :]
+    if recorrido == "vertical":
+        pos = c * filas + np.where(c % 2 == 0, r, filas - 1 - r)
+    else:
+        pos = r * columnas + np.where(r % 2 == 0, c, columnas - 1 - c)
+    if esquina.startswith("inf"):
+        pos = pos[::-1, :]
+    if esquina.endswith("der"):
+        pos = pos[:, ::-1]
+    return pos
+
+
+class MapaPuertos:
+    __slots__ = ("recorrido", "esquina", "puerto", "posicion", "gabinetes_por_puerto", "puertos",
+                 "capacidad_puerto_px", "px_gabinete", "cab_w", "cab_h", "cable_saltos_m", "cable_tendidos_m", "_orden")
+
+    def __init__(self, recorrido, esquina, pos, gabinetes_por_puerto, capacidad, px_gabinete, cab_w, cab_h,
+                 cable_saltos_m, cable_tendidos_m):
+        self.recorrido = recorrido
+        self.esquina = esquina
+        # Grillas filas x columnas, 1-based como se etiquetan en el procesador
+        self.puerto = (pos // gabinetes_por_puerto + 1).astype(np.int32)
+        self.posicion = (pos % gabinetes_por_puerto + 1).astype(np.int32)
+        self.gabinetes_por_puerto = gabinetes_por_puerto
+        self.puertos = int(self.puerto.max())
+        self.capacidad_puerto_px = capacidad
+        self.px_gabinete = px_gabinete
+        self.cab_w = cab_w
+        self.cab_h = cab_h
+        self.cable_saltos_m = cable_saltos_m
+        self.cable_tendidos_m = cable_tendidos_m
+        # Índice plano del gabinete en cada posición de la serpentina
+        self._orden = np.empty(pos.size, dtype=np.int64)
+        self._orden[pos.ravel()] = np.arange(pos.size)
+
+    @property
+    def cable_total_m(self):
+        return self.cable_saltos_m + self.cable_tendidos_m
+
+    def valores(self):
+        return {
+            "recorrido": self.recorrido,
+            "esquina": self.esquina,
+            "puertos": self.puertos,
+            "gabinetes_por_puerto": self.gabinetes_por_puerto,
+            "carga_max_puerto_px": self.gabinetes_por_puerto * self.px_gabinete,
+            "capacidad_puerto_px": self.capacidad_puerto_px,
+            "cable_saltos_m": self.cable_saltos_m,
+            "cable_tendidos_m": self.cable_tendidos_m,
+            "cable_total_m": self.cable_total_m,
+        }
+
+    def gabinetes(self):
+        # Columnas por gabinete en orden de puerto y posición en la cadena
+        filas, columnas = divmod(self._orden, self.puerto.shape[1])
+        return {
+            "puerto": self.puerto.ravel()[self._orden],
+            "posicion": self.posicion.ravel()[self._orden],
+            "columna": columnas + 1,
+            "fila": filas + 1,
+            "x_mm": (columnas + 0.5) * self.cab_w,
+            "y_mm": (filas + 0.5) * self.cab_h,
+        }
+
+    def escribir_csv(self, archivo, separador=";"):
+        g = self.gabinetes()
+        escritor = csv.writer(archivo, delimiter=separador)
+        escritor.writerow(["Puerto", "Posicion", "Columna", "Fila", "X (mm)", "Y (mm)"])
+        escritor.writerows(zip(g["puerto"].tolist(), g["posicion"].tolist(), g["columna"].tolist(),
+                               g["fila"].tolist(), g["x_mm"].tolist(), g["y_mm"].tolist()))
+
+    def reporte_csv(self):
+        salida = io.StringIO()
+        self.escribir_csv(salida)
+        return salida.getvalue()
+
+
+def _evaluar(filas, columnas, cab_w, cab_h, k, recorrido, esquina, entrada):
+    n = filas * columnas
+    pos = orden_serpentina(filas, columnas, recorrido, esquina)
+    largo_linea, paso_linea, paso_cambio = (filas, cab_h, cab_w) if recorrido == "vertical" else (columnas, cab_w, cab_h)
+
+    # Saltos dentro de cada cadena: todos entre vecinos; los que cierran una
+    # línea de la serpentina son transversales
+    puertos = -(-n // k)
+    saltos = n - puertos
+    cierres = np.arange(largo_linea - 1, n - 1, largo_linea)
+    transversales = int(np.count_nonzero((cierres + 1) % k))
+    cable_saltos = (saltos - transversales) * paso_linea + transversales * paso_cambio
+
+    # Tendido desde el punto de entrada hasta el primer gabinete de cada puerto (Manhattan)
+    orden = np.empty(n, dtype=np.int64)
+    orden[pos.ravel()] = np.arange(n)
+    f, c = np.divmod(orden[np.arange(puertos) * k], columnas)
+    cable_tendidos = float(np.sum(np.abs((c + 0.5) * cab_w - entrada[0]) + np.abs((f + 0.5) * cab_h - entrada[1])))
+    return pos, cable_saltos / 1000, cable_tendidos / 1000
+
+
+def mapear_puertos(columnas, filas, cab_w, cab_h, cab_res_w, cab_res_h, capacidad_puerto_px,
+                   entrada=None, recorridos=RECORRIDOS, esquinas=ESQUINAS):
+    # entrada: (x, y) en mm del punto donde llegan los cables del procesador,
+    # medido desde la esquina superior izquierda; por defecto, centro del borde inferior.
+    columnas, filas = int(columnas), int(filas)
+    px_gabinete = int(cab_res_w) * int(cab_res_h)
+    k = min(capacidad_puerto_px // px_gabinete, columnas * filas)
+    if k < 1:
+        raise ValueError(f"Un gabinete de {px_gabinete} px excede la capacidad de un puerto ({capacidad_puerto_px} px)")
+    if entrada is None:
+        entrada = (columnas * cab_w / 2, filas * cab_h)
+
+    mejor = None
+    for recorrido in recorridos:
+        for esquina in esquinas:
+            pos, saltos_m, tendidos_m = _evaluar(filas, columnas, cab_w, cab_h, k, recorrido, esquina, entrada)
+            if mejor is None or saltos_m + tendidos_m < mejor[2] + mejor[3]:
+                mejor = (recorrido, esquina, saltos_m, tendidos_m, pos)
+    recorrido, esquina, saltos_m, tendidos_m, pos = mejor
+    return MapaPuertos(recorrido, esquina, pos, k, capacidad_puerto_px, px_gabinete, cab_w, cab_h, saltos_m, tendidos_m)
+
+
+def mapa_desde_resultado(resultado, opcion="Opcion 1 (Ideal)", entrada=None):
+    # Mapa de puertos para una de las opciones de layout de un ResultadoProyecto
+    o = resultado.raw["opciones"][opcion]
+    columnas, filas = o["columnas"], o["filas"]
+    capacidad = capacidad_puerto_px(resultado.spec["calidad"], resultado.spec["fps_video"])
+    return mapear_puertos(columnas, filas, o["cab_w"], o["alto_fisico"] / filas,
+                          o["res_total_w"] // columnas, o["res_total_h"] // filas, capacidad, entrada=entrada)
@@ -0,0 +1,210 @@
+# ==========================================
+# SOLVER DE MOSAICO MIXTO DE GABINETES
+# ==========================================
+# Combina varios tamaños de gabinete (p. ej. 500x500 con 500x1000, o 960x960 con
+# 960x480) para acercarse a la medida solicitada. Cada eje se resuelve por
+# separado con una búsqueda podada: a lo sumo dos tamaños por eje (como se arma
+# en obra) y sólo las cantidades que caen dentro de la tolerancia. Luego se
+# cruzan ancho x alto, se descartan las combinaciones cuyos gabinetes no existen
+# en el catálogo y se devuelve el frente de Pareto de:
+#   error de tamaño (min) vs. cantidad de gabinetes (min) vs. píxeles (max).
+# error_rel es la mayor desviación relativa entre ancho y alto; con precision > 0
+# el error y los píxeles se comparan en cubetas de ese tamaño relativo.
+import numpy as np
+
+from .barrido import tabla_modelos
+
+
+def tipos_desde_modelos(modelos, pitch):
+    tabla = tabla_modelos(modelos)
+    tipos = []
+    for i, m in enumerate(modelos):
+        cab_w, cab_h = float(tabla["cab_w"][i]), float(tabla["cab_h"][i])
+        if tabla["manual"][i]:
+            res_w, res_h = int(tabla["cab_res_w"][i]), int(tabla["cab_res_h"][i])
+        else:
+            res_w, res_h = int(cab_w / pitch), int(cab_h / pitch)
+        tipos.append({"nombre": m.get("nombre", f"{cab_w:g}x{cab_h:g}"),
+                      "cab_w": cab_w, "cab_h": cab_h, "cab_res_w": res_w, "cab_res_h": res_h})
+    return tipos
+
+
+def familia_estandar(calc):
+    # Gabinete de una LEDSCREENCALC + sus variantes de doble y media altura.
+    tipos = [{"nombre": f"{calc.cab_w:g}x{calc.cab_h:g}", "cab_w": calc.cab_w, "cab_h": calc.cab_h,
+              "cab_res_w": calc.cab_res_w, "cab_res_h": calc.cab_res_h}]
+    tipos.append({"nombre": f"{calc.cab_w:g}x{calc.cab_h * 2:g}", "cab_w": calc.cab_w, "cab_h": calc.cab_h * 2,
+                  "cab_res_w": calc.cab_res_w, "cab_res_h": calc.cab_res_h * 2})
+    if calc.cab_res_h % 2 == 0:
+        tipos.append({"nombre": f"{calc.cab_w:g}x{calc.cab_h / 2:g}", "cab_w": calc.cab_w, "cab_h": calc.cab_h / 2,
+                      "cab_res_w": calc.cab_res_w, "cab_res_h": calc.cab_res_h // 2})
+    return tipos
+
+
+def _opciones_eje(req, largos, resoluciones, compat, tolerancia, precision):
+    # Devuelve arreglos por candidato: (i, n_i, j, n_j, largo, piezas, px).
+    # Un candidato de un solo tamaño se codifica con j == i y n_j == 0.
+    # compat[k] es la máscara de bits de los tamaños del otro eje que existen
+    # combinados con el tamaño k de este eje.
+    k = len(largos)
+    partes = []
+
+    # Un solo tamaño: floor/ceil siempre presentes (equivalen a las opciones clásicas)
+    exacto = req / largos
+    for n in (np.floor(exacto), np.ceil(exacto)):
+        n = np.maximum(1, n.astype(np.int64))
+        idx = np.arange(k)
+        partes.append((idx, n, idx, np.zeros(k, dtype=np.int64)))
+
+    # Dos tamaños: se enumeran las piezas del primero y se completa con el segundo
+    ii, jj = np.triu_indices(k, 1)
+    if len(ii):
+        n_max = int(np.ceil(req / largos[ii].min()))
+        n_i = np.arange(1, n_max + 1)
+        I = np.repeat(ii, n_max)
+        J = np.repeat(jj, n_max)
+        N_i = np.tile(n_i, len(ii))
+        resto = req - N_i * largos[I]
+        for n_j in (np.floor(resto / largos[J]), np.ceil(resto / largos[J])):
+            n_j = n_j.astype(np.int64)
+            ok = n_j >= 1
+            largo = N_i * largos[I] + n_j * largos[J]
+            ok &= np.abs(largo - req) <= tolerancia * req
+            partes.append((I[ok], N_i[ok], J[ok], n_j[ok]))
+
+    i = np.concatenate([p[0] for p in partes])
+    n_i = np.concatenate([p[1] for p in partes])
+    j = np.concatenate([p[2] for p in partes])
+    n_j = np.concatenate([p[3] for p in partes])
+    largo = n_i * largos[i] + n_j * largos[j]
+    piezas = n_i + n_j
+    px = n_i * resoluciones[i] + n_j * resoluciones[j]
+    err = np.abs(largo - req)
+
+    # Un candidato sólo puede descartarse frente a otro que sea al menos tan bueno
+    # y combinable con todo lo que él lo es (su firma de compatibilidad lo contiene).
+    firma = compat[i] & compat[j]
+    sel = _frente_pareto(_cubeta(err / req, precision), piezas, px, firma)
+    return i[sel], n_i[sel], j[sel], n_j[sel], largo[sel], piezas[sel], px[sel]
+
+
+def _cubeta(err_rel, precision):
+    # Dominancia epsilon: errores que difieren menos que la precisión empatan,
+    # si no el frente se llena de variantes que sólo agregan unos píxeles.
+    if not precision:
+        return err_rel
+    return np.floor(err_rel / precision + 1e-9).astype(np.int64)
+
+
+def _cubeta_px(px, precision):
+    # Idem para píxeles, en escala relativa (cubetas de +precision %).
+    if not precision:
+        return px
+    return np.floor(np.log(px) / np.log1p(precision) + 1e-9).astype(np.int64)
+
+
+def _frente_pareto(err, gab, px, firma=None, bloque=128):
+    # Minimiza err y gab, maximiza px. Un punto domina a otro sólo si su firma
+    # (máscara de bits) contiene la del otro; sin firma es el frente clásico.
+    # Barrido en orden (err, gab, -px): un punto sólo puede ser dominado por uno
+    # anterior, así que basta compararlo contra el frente ya aceptado y contra
+    # los anteriores de su propio bloque. Los duplicados exactos se descartan.
+    n = len(err)
+    if firma is None:
+        firma = np.zeros(n, dtype=np.uint64)
+    if n > 8 * bloque:
+        # Poda previa: el frente de una submuestra descarta de un golpe la mayoría
+        # de los puntos (dominancia estricta, para no perder los de la semilla).
+        semilla = np.arange(0, n, n // (4 * bloque))
+        semilla = semilla[_frente_pareto(err[semilla], gab[semilla], px[semilla], firma[semilla], bloque)]
+        se, sg, sp, sf = err[semilla], gab[semilla], px[semilla], firma[semilla]
+        vivos = np.ones(n, dtype=bool)
+        for a in range(0, n, 4 * bloque):
+            sl = slice(a, a + 4 * bloque)
+            ce, cg, cp, cf = err[sl, None], gab[sl, None], px[sl, None], firma[sl, None]
+            debil = (se <= ce) & (sg <= cg) & (sp >= cp) & ((sf & cf) == cf)
+            estricto = (se < ce) | (sg < cg) | (sp > cp)
+            vivos[sl] = ~np.any(debil & estricto, axis=1)
+        vivos = np.flatnonzero(vivos)
+        return vivos[_frente_pareto(err[vivos], gab[vivos], px[vivos], firma[vivos], bloque)]
+
+    orden = np.lexsort((-px, gab, err))
+    e, g, p, f = err[orden], gab[orden], px[orden], firma[orden]
+    aceptados = []
+    fe, fg, fp, ff = e[:0], g[:0], p[:0], f[:0]
+    for a in range(0, n, bloque):
+        sl = slice(a, a + bloque)
+        ce, cg, cp, cf = e[sl, None], g[sl, None], p[sl, None], f[sl, None]
+        dominado = np.any((fe <= ce) & (fg <= cg) & (fp >= cp) & ((ff & cf) == cf), axis=1)
+        interno = (e[None, sl] <= ce) & (g[None, sl] <= cg) & (p[None, sl] >= cp) & ((f[None, sl] & cf) == cf)
+        dominado |= np.any(np.tril(interno, -1), axis=1)
+        nuevos = np.flatnonzero(~dominado) + a
+        aceptados.append(nuevos)
+        fe, fg = np.concatenate([fe, e[nuevos]]), np.concatenate([fg, g[nuevos]])
+        fp, ff = np.concatenate([fp, p[nuevos]]), np.concatenate([ff, f[nuevos]])
+    return orden[np.concatenate(aceptados)] if aceptados else np.zeros(0, dtype=np.intp)
+
+
+def resolver_mosaico(req_w, req_h, tipos, tolerancia=0.05, precision=0.001, max_soluciones=None):
+    anchos = sorted({(float(t["cab_w"]), int(t["cab_res_w"])) for t in tipos})
+    altos = sorted({(float(t["cab_h"]), int(t["cab_res_h"])) for t in tipos})
+    idx_w = {a: k for k, a in enumerate(anchos)}
+    idx_h = {a: k for k, a in enumerate(altos)}
+    compat = np.zeros((len(anchos), len(altos)), dtype=bool)
+    nombres = {}
+    for t in tipos:
+        a, b = idx_w[(float(t["cab_w"]), int(t["cab_res_w"]))], idx_h[(float(t["cab_h"]), int(t["cab_res_h"]))]
+        compat[a, b] = True
+        nombres.setdefault((a, b), t.get("nombre", f"{t['cab_w']:g}x{t['cab_h']:g}"))
+
+    if max(len(anchos), len(altos)) > 64:
+        raise ValueError("El solver admite hasta 64 anchos y 64 altos de gabinete distintos")
+    bits_w = np.uint64(1) << np.arange(len(anchos), dtype=np.uint64)
+    bits_h = np.uint64(1) << np.arange(len(altos), dtype=np.uint64)
+    firma_w = np.bitwise_or.reduce(np.where(compat, bits_h[None, :], np.uint64(0)), axis=1)
+    firma_h = np.bitwise_or.reduce(np.where(compat, bits_w[:, None], np.uint64(0)), axis=0)
+
+    L_w = np.array([a[0] for a in anchos])
+    R_w = np.array([a[1] for a in anchos], dtype=np.int64)
+    L_h = np.array([a[0] for a in altos])
+    R_h = np.array([a[1] for a in altos], dtype=np.int64)
+    wi, wni, wj, wnj, w_largo, w_piezas, w_px = _opciones_eje(req_w, L_w, R_w, firma_w, tolerancia, precision)
+    hi, hni, hj, hnj, h_largo, h_piezas, h_px = _opciones_eje(req_h, L_h, R_h, firma_h, tolerancia, precision)
+
+    # Cruce ancho x alto: todos los gabinetes (tamaño de columna, tamaño de fila) deben existir
+    A, B = np.meshgrid(np.arange(len(wi)), np.arange(len(hi)), indexing="ij")
+    A, B = A.ravel(), B.ravel()
+    ok = (compat[wi[A], hi[B]] & compat[wi[A], hj[B]] & compat[wj[A], hi[B]] & compat[wj[A], hj[B]])
+    A, B = A[ok], B[ok]
+
+    err_w = w_largo[A] - req_w
+    err_h = h_largo[B] - req_h
+    err_rel = np.maximum(np.abs(err_w) / req_w, np.abs(err_h) / req_h)
+    gabinetes = w_piezas[A] * h_piezas[B]
+    total_px = w_px[A] * h_px[B]
+
+    frente = _frente_pareto(_cubeta(err_rel, precision), gabinetes, _cubeta_px(total_px, precision))
+    frente = frente[np.lexsort((-total_px[frente], gabinetes[frente], err_rel[frente]))]
+    if max_soluciones is not None:
+        frente = frente[:max_soluciones]
+
+    soluciones = []
+    for f in frente.tolist():
+        a, b = int(A[f]), int(B[f])
+        cols = [(int(wi[a]), int(wni[a]))] + ([(int(wj[a]), int(wnj[a]))] if wnj[a] else [])
+        filas = [(int(hi[b]), int(hni[b]))] + ([(int(hj[b]), int(hnj[b]))] if hnj[b] else [])
+        soluciones.append({
+            "columnas": {float(L_w[k]): n for k, n in cols},
+            "filas": {float(L_h[k]): n for k, n in filas},
+            "gabinetes_por_tipo": {nombres[(kw, kh)]: nw * nh for kw, nw in cols for kh, nh in filas},
+            "ancho_fisico": float(w_largo[a]),
+            "alto_fisico": float(h_largo[b]),
+            "error_w_mm": float(err_w[f]),
+            "error_h_mm": float(err_h[f]),
+            "error_rel": float(err_rel[f]),
+            "total_gabinetes": int(gabinetes[f]),
+            "res_total_w": int(w_px[a]),
+            "res_total_h": int(h_px[b]),
+            "total_px": int(total_px[f]),
+        })
+    return soluciones
@@ -0,0 +1,318 @@
+# ==========================================
+# PERFILADO POR ETAPAS (TIEMPO, LLAMADAS Y ASIGNACIONES)
+# ==========================================
+# Para saber si una corrida lenta se va en el layout, en los calcular_*, en
+# armar los reportes, en formato_latam o en render_dict. Las etapas se miden
+# reemplazando las funciones y métodos por envoltorios sólo mientras el
+# perfilado está activo; al desactivarlo se restauran los originales, así que
+# apagado no cuesta nada.
+#
+#   from ledscreencalc.perfil import PERFIL
+#   with PERFIL.sesion(asignaciones=True):
+#       calculate_project(spec)
+#   PERFIL.tabla()            # por etapa: llamadas, tiempo total/medio/máx, KB
+#   PERFIL.exportar_json()    # resumen + eventos
+#   PERFIL.traza_chrome()     # chrome://tracing o https://ui.perfetto.dev
+#
+# Las asignaciones (tracemalloc) son opcionales porque multiplican el costo de
+# cada asignación de memoria; se registran el neto retenido y el pico de cada
+# llamada.
+#
+# Los reemplazos son globales al proceso, pero cada Perfilador registra sólo
+# lo que corre en el contexto (contextvars) donde se activó: con varias
+# sesiones de Streamlit, cada una usa su propio Perfilador y no ve ni borra
+# los datos de las otras. Los originales se restauran cuando se desactiva el
+# último Perfilador encendido, así que apagar el perfil en una sesión no corta
+# la medición de otra. Lo que corre en hilos creados por la medición no se
+# registra (los hilos nuevos no heredan el contexto). tracemalloc es uno solo
+# por proceso: con asignaciones en dos sesiones a la vez, los picos se mezclan.
+# Una sesión que se cierra con el perfil encendido deja los reemplazos puestos
+# (sin registrar nada) hasta que otra lo apague o termine el proceso.
+import contextvars
+import functools
+import importlib
+import json
+import re
+import sys
+import threading
+import time
+import tracemalloc
+
+# (módulo, clase o None, patrón de nombres) de lo que se mide
+ETAPAS = (
+    ("calculos", "LEDSCREENCALC", r"generar_opciones|_calcular_configuracion"),
+    ("calculos", "LedScreenProc", r"calcular_\w+"),
+    ("calculos", "LedPowerCalc", r"calcular_\w+"),
+    ("calculos", "LedRiggingCalc", r"calcular_\w+"),
+    ("calculos", "LedSparesCalc", r"calcular_\w+"),
+    ("calculos", None, r"calcular_\w+"),
+    ("proyecto", None, r"calculate_project|construir_calculadoras"),
+    ("grafo", "GrafoCalculo", r"actualizar"),
+    ("resultado", "ResultadoProyecto", r"reporte_\w+"),
+    ("reportes", None, r"[a-z]\w+"),
+    ("formato", None, r"formato_latam"),
+)
+MAX_EVENTOS = 200000
+
+# Perfilador que registra las llamadas del contexto actual
+_ACTUAL = contextvars.ContextVar("perfil_actual", default=None)
+
+
+def _modulos():
+    # Módulos donde puede haber una referencia importada con "from ... import"
+    return [m for n, m in list(sys.modules.items())
+            if m is not None and (n == "ledscreencalc" or n.startswith("ledscreencalc.") or n == "__main__")]
+
+
+def _envoltorio_etapa(nombre, funcion, categoria):
+    # Reemplazo instalado en módulos y clases: mide en el Perfilador del contexto, si hay uno
+    @functools.wraps(funcion)
+    def medido(*args, **kwargs):
+        perfil = _ACTUAL.get()
+        if perfil is None or not perfil.activo:
+            return funcion(*args, **kwargs)
+        return perfil._medir(nombre, categoria, funcion, args, kwargs)
+
+    medido.__perfil_original__ = funcion
+    return medido
+
+
+class _Instrumentacion:
+    # Reemplazos compartidos por todos los Perfiladores encendidos (conteo de referencias)
+    __slots__ = ("activos", "originales", "envoltorios", "tracemalloc_propio", "candado")
+
+    def __init__(self):
+        self.activos = set()
+        self.originales = []
+        self.envoltorios = {}
+        self.tracemalloc_propio = False
+        self.candado = threading.RLock()
+
+    def sumar(self, perfil):
+        with self.candado:
+            if not self.activos:
+                self._instalar()
+            self.activos.add(perfil)
+            self.ajustar_tracemalloc()
+
+    def quitar(self, perfil):
+        with self.candado:
+            self.activos.discard(perfil)
+            if not self.activos:
+                self._restaurar()
+            self.ajustar_tracemalloc()
+
+    def ajustar_tracemalloc(self):
+        # Encendido mientras algún Perfilador lo pida; sólo se apaga si lo encendimos acá
+        with self.candado:
+            pedido = any(p.asignaciones for p in self.activos)
+            if pedido and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.tracemalloc_propio = True
+            elif not pedido and self.tracemalloc_propio:
+                tracemalloc.stop()
+                self.tracemalloc_propio = False
+
+    def _instalar(self):
+        reemplazos = {}
+        for modulo, clase, patron in ETAPAS:
+            mod = importlib.import_module(f"ledscreencalc.{modulo}")
+            duenio = getattr(mod, clase) if clase else mod
+            prefijo = clase or modulo
+            for nombre, valor in list(vars(duenio).items()):
+                if not re.fullmatch(patron, nombre) or not callable(getattr(valor, "__func__", valor)):
+                    continue
+                if clase is None and getattr(valor, "__module__", None) != mod.__name__:
+                    continue
+                envoltorio = _envoltorio_etapa(f"{prefijo}.{nombre}", getattr(valor, "__func__", valor), modulo)
+                if isinstance(valor, (classmethod, staticmethod)):
+                    envoltorio = type(valor)(envoltorio)
+                self.originales.append((duenio, nombre, valor))
+                setattr(duenio, nombre, envoltorio)
+                if clase is None:
+                    reemplazos[id(valor)] = (valor, envoltorio)
+        # Referencias importadas en otros módulos (p. ej. formato_latam en calculos)
+        for mod in _modulos():
+            for nombre, valor in list(vars(mod).items()):
+                par = reemplazos.get(id(valor))
+                if par is not None and par[0] is valor:
+                    self.originales.append((mod, nombre, valor))
+                    setattr(mod, nombre, par[1])
+        self.envoltorios = {id(e): o for o, e in reemplazos.values()}
+
+    def _restaurar(self):
+        for duenio, nombre, valor in reversed(self.originales):
+            setattr(duenio, nombre, valor)
+        # Módulos importados mientras estaba activo (p. ej. una nueva corrida de app_led.py)
+        for mod in _modulos():
+            for nombre, valor in list(vars(mod).items()):
+                original = self.envoltorios.get(id(valor))
+                if original is not None:
+                    setattr(mod, nombre, original)
+        self.originales, self.envoltorios = [], {}
+
+
+_INSTRUMENTACION = _Instrumentacion()
+
+
+class Perfilador:
+    __slots__ = ("activo", "asignaciones", "_etapas", "_eventos", "_t0", "_pila", "_candado")
+
+    def __init__(self):
+        self.activo = False
+        self.asignaciones = False
+        self._pila = threading.local()
+        self._candado = threading.Lock()
+        self.reiniciar()
+
+    def reiniciar(self):
+        # etapa -> [llamadas, total_ns, max_ns, neto_bytes (suma), pico_bytes (máximo de una llamada)]
+        self._etapas = {}
+        self._eventos = []
+        self._t0 = time.perf_counter_ns()
+
+    def envolver(self, nombre, funcion, categoria="app"):
+        # Envoltorio medido de funcion; si el perfilado está apagado devuelve
+        # funcion tal cual (para funciones propias de la app, como render_dict)
+        if not self.activo:
+            return funcion
+        perfil = self
+
+        @functools.wraps(funcion)
+        def medido(*args, **kwargs):
+            if not perfil.activo:
+                return funcion(*args, **kwargs)
+            return perfil._medir(nombre, categoria, funcion, args, kwargs)
+
+        medido.__perfil_original__ = funcion
+        return medido
+
+    def _medir(self, nombre, categoria, funcion, args, kwargs):
+        pila = getattr(self._pila, "marcos", None)
+        if pila is None:
+            pila = self._pila.marcos = []
+        asignaciones = self.asignaciones and tracemalloc.is_tracing()
+        if asignaciones:
+            actual, pico = tracemalloc.get_traced_memory()
+            if pila:
+                pila[-1][1] = max(pila[-1][1], pico)
+            tracemalloc.reset_peak()
+            marco = [actual, 0]
+        else:
+            marco = [0, 0]
+        pila.append(marco)
+        t0 = time.perf_counter_ns()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            dt = time.perf_counter_ns() - t0
+            pila.pop()
+            neto = pico = 0
+            if asignaciones and tracemalloc.is_tracing():
+                actual, pico_total = tracemalloc.get_traced_memory()
+                pico_total = max(marco[1], pico_total)
+                neto, pico = actual - marco[0], pico_total - marco[0]
+                if pila:
+                    pila[-1][1] = max(pila[-1][1], pico_total)
+            self._registrar(nombre, categoria, t0, dt, neto, pico, len(pila))
+
+    def _registrar(self, nombre, categoria, t0, dt, neto, pico, nivel):
+        with self._candado:
+            e = self._etapas.get(nombre)
+            if e is None:
+                e = self._etapas[nombre] = [0, 0, 0, 0, 0]
+            e[0] += 1
+            e[1] += dt
+            e[2] = max(e[2], dt)
+            e[3] += neto
+            e[4] = max(e[4], pico)
+            if len(self._eventos) < MAX_EVENTOS:
+                self._eventos.append((nombre, categoria, t0, dt, threading.get_ident(), neto, pico, nivel))
+
+    def activar(self, asignaciones=False):
+        # Registra lo que corra en el contexto actual; también sirve para volver
+        # a asociar el contexto en una corrida nueva (p. ej. un rerun de fragmento)
+        self.asignaciones = asignaciones
+        _ACTUAL.set(self)
+        if self.activo:
+            _INSTRUMENTACION.ajustar_tracemalloc()
+        else:
+            self.activo = True
+            _INSTRUMENTACION.sumar(self)
+        self.asignaciones = asignaciones and tracemalloc.is_tracing()
+        return self
+
+    def desactivar(self):
+        # Sólo quita los reemplazos si no queda otro Perfilador encendido
+        if _ACTUAL.get() is self:
+            _ACTUAL.set(None)
+        if not self.activo:
+            return self
+        self.activo = self.asignaciones = False
+        _INSTRUMENTACION.quitar(self)
+        return self
+
+    def sesion(self, asignaciones=False):
+        self.reiniciar()
+        return _Sesion(self, asignaciones)
+
+    def tabla(self):
+        # Filas por etapa ordenadas por tiempo total
+        filas = [{
+            "etapa": nombre,
+            "llamadas": n,
+            "total_ms": total / 1e6,
+            "media_ms": total / n / 1e6,
+            "max_ms": maximo / 1e6,
+            "neto_kb": neto / 1024,
+            "pico_max_kb": pico / 1024,
+        } for nombre, (n, total, maximo, neto, pico) in list(self._etapas.items())]
+        return sorted(filas, key=lambda f: f["total_ms"], reverse=True)
+
+    def exportar_json(self, destino=None):
+        datos = {
+            "asignaciones": self.asignaciones,
+            "etapas": self.tabla(),
+            "eventos": [{"etapa": e[0], "categoria": e[1], "inicio_ms": (e[2] - self._t0) / 1e6, "duracion_ms": e[3] / 1e6,
+                         "hilo": e[4], "neto_bytes": e[5], "pico_bytes": e[6], "nivel": e[7]} for e in list(self._eventos)],
+        }
+        return _volcar(datos, destino)
+
+    def traza_chrome(self, destino=None):
+        # Formato "Trace Event" (eventos completos "X", tiempos en µs)
+        datos = {"displayTimeUnit": "ms", "traceEvents": [{
+            "name": e[0], "cat": e[1], "ph": "X", "ts": (e[2] - self._t0) / 1e3, "dur": e[3] / 1e3, "pid": 1, "tid": e[4],
+            **({"args": {"neto_bytes": e[5], "pico_bytes": e[6]}} if self.asignaciones else {}),
+        } for e in list(self._eventos)]}
+        return _volcar(datos, destino)
+
+
+class _Sesion:
+    __slots__ = ("perfil", "asignaciones")
+
+    def __init__(self, perfil, asignaciones):
+        self.perfil = perfil
+        self.asignaciones = asignaciones
+
+    def __enter__(self):
+        return self.perfil.activar(self.asignaciones)
+
+    def __exit__(self, *exc):
+        self.perfil.desactivar()
+        return False
+
+
+def _volcar(datos, destino):
+    # Sin destino devuelve el texto JSON; con ruta o archivo abierto lo escribe
+    texto = json.dumps(datos, ensure_ascii=False)
+    if destino is None:
+        return texto
+    if hasattr(destino, "write"):
+        destino.write(texto)
+    else:
+        with open(destino, "w", encoding="utf-8") as f:
+            f.write(texto)
+    return None
+
+
+PERFIL = Perfilador()
@@ -0,0 +1,173 @@
+# ==========================================
+# PUNTO DE ENTRADA HEADLESS (sin Streamlit)
+# ==========================================
+import functools
+import math
+
+from .calculos import LEDSCREENCALC, LedScreenProc, LedPowerCalc, LedRiggingCalc, LedSparesCalc, parsear_shutter_estricto
+from .resultado import ResultadoProyecto
+
+CAMPOS_MARCA = ("mod_res_w", "mod_res_h", "mod_w", "mod_h", "cab_w", "cab_h")
+ENTORNOS = ("Indoor", "Outdoor")
+MODOS_REPUESTOS = ("porcentaje", "confiabilidad")
+# Opciones de los campos de texto (las mismas listas que la barra lateral)
+USOS = ("Cine", "TV", "Publicidad")
+CONTENIDOS = ("Video",)
+RESOLUCIONES_ENTRADA = ("HD (1080p)", "4K", "8K", "16K")
+PUERTOS_VIDEO = ("HDMI 1.4", "HDMI 2.0", "HDMI 2.1", "DP 1.2", "DP 1.4", "12G-SDI")
+CALIDADES = ("SDR 8-bit", "HDR 10-bit", "HDR 12-bit")
+
+# Cantidad de juegos de entradas distintos que se conservan calculados
+TAMANO_CACHE = 256
+
+# Mismos campos y valores por defecto que recoge la barra lateral de app_led.py.
+# brillo=None toma el valor por defecto del entorno (1000 Indoor / 5000 Outdoor).
+SPEC_DEFAULTS = {
+    "uso": "Cine",
+    "entorno": "Indoor",
+    "contenido": "Video",
+    "req_w": 10000.0,
+    "req_h": 5000.0,
+    "dist_vis_m": 10,
+    "pitch": 2.6,
+    "brillo": None,
+    "mod_res_w": None,
+    "mod_res_h": None,
+    "mod_w": None,
+    "mod_h": None,
+    "cab_w": None,
+    "cab_h": None,
+    "num_entradas": 1,
+    "input_res": "4K",
+    "puerto": "HDMI 2.0",
+    "calidad": "HDR 10-bit",
+    "fps_video": 60,
+    "distancia_cable_m": 50.0,
+    "refresh_rate_hz": 3840.0,
+    "shutter_speed_str": "1/60",
+    "voltaje": 220,
+    "porcentaje_repuestos": 10.0,
+    # Repuestos por confiabilidad (modo_repuestos="confiabilidad", ver repuestos.py)
+    "modo_repuestos": "porcentaje",
+    "disponibilidad_repuestos": 0.95,
+    "dias_show": 3,
+    "horas_dia": 12.0,
+    # Datos de producto (catálogo): peso por gabinete y consumo máximo por m².
+    # watts_max_m2=None toma el valor por defecto del entorno (500 Indoor / 800 Outdoor).
+    "cab_peso_kg": 11.0,
+    "watts_max_m2": None,
+    # Potencia promedio / máxima del contenido (ver contenido.py)
+    "factor_promedio": 0.34,
+}
+
+
+def normalizar_spec(spec):
+    desconocidos = set(spec) - set(SPEC_DEFAULTS)
+    if desconocidos:
+        raise ValueError(f"Campos desconocidos en la especificación: {', '.join(sorted(desconocidos))}")
+    datos = dict(SPEC_DEFAULTS)
+    datos.update({k: v for k, v in spec.items() if v is not None})
+    if datos["brillo"] is None:
+        datos["brillo"] = 1000 if datos["entorno"] == "Indoor" else 5000
+    return datos
+
+
+def _numero(valor):
+    # Número finito: 1e999 y NaN llegan por JSON y rompen los math.ceil de los calculadores
+    return isinstance(valor, (int, float)) and math.isfinite(valor)
+
+
+def validar_spec(spec):
+    # La UI acota los valores con sus widgets; los lotes y el servicio no, así
+    # que ahí se valida antes de calcular. Devuelve la especificación normalizada.
+    s = normalizar_spec(spec)
+    # Los calculadores comparan estos campos por subcadena ("8K" in input_res):
+    # un valor fuera de la lista calcularía en silencio con los números por defecto
+    for campo, opciones in (("uso", USOS), ("entorno", ENTORNOS), ("contenido", CONTENIDOS),
+                            ("input_res", RESOLUCIONES_ENTRADA), ("puerto", PUERTOS_VIDEO), ("calidad", CALIDADES),
+                            ("modo_repuestos", MODOS_REPUESTOS)):
+        if not isinstance(s[campo], str) or s[campo] not in opciones:
+            raise ValueError(f"{campo} debe ser uno de {', '.join(opciones)} (recibido {s[campo]!r})")
+    for campo in ("req_w", "req_h", "dist_vis_m", "pitch", "voltaje", "fps_video", "refresh_rate_hz", "brillo", "cab_peso_kg"):
+        if not _numero(s[campo]) or not s[campo] > 0:
+            raise ValueError(f"{campo} debe ser un número positivo (recibido {s[campo]!r})")
+    if not isinstance(s["num_entradas"], int) or s["num_entradas"] < 1:
+        raise ValueError(f"num_entradas debe ser un entero >= 1 (recibido {s['num_entradas']!r})")
+    if not _numero(s["porcentaje_repuestos"]) or not 0 <= s["porcentaje_repuestos"] <= 100:
+        raise ValueError(f"porcentaje_repuestos debe estar entre 0 y 100 (recibido {s['porcentaje_repuestos']!r})")
+    if not _numero(s["disponibilidad_repuestos"]) or not 0 < s["disponibilidad_repuestos"] < 1:
+        raise ValueError(f"disponibilidad_repuestos debe estar entre 0 y 1 (recibido {s['disponibilidad_repuestos']!r})")
+    if not isinstance(s["dias_show"], int) or s["dias_show"] < 1:
+        raise ValueError(f"dias_show debe ser un entero >= 1 (recibido {s['dias_show']!r})")
+    if not _numero(s["horas_dia"]) or not 0 < s["horas_dia"] <= 24:
+        raise ValueError(f"horas_dia debe estar entre 0 y 24 (recibido {s['horas_dia']!r})")
+    if not _numero(s["factor_promedio"]) or not 0 < s["factor_promedio"] <= 1:
+        raise ValueError(f"factor_promedio debe estar entre 0 y 1 (recibido {s['factor_promedio']!r})")
+    if s["watts_max_m2"] is not None and (not _numero(s["watts_max_m2"]) or not s["watts_max_m2"] > 0):
+        raise ValueError(f"watts_max_m2 debe ser un número positivo (recibido {s['watts_max_m2']!r})")
+    if not _numero(s["distancia_cable_m"]) or s["distancia_cable_m"] < 0:
+        raise ValueError(f"distancia_cable_m debe ser >= 0 (recibido {s['distancia_cable_m']!r})")
+    marca = [s[k] for k in CAMPOS_MARCA]
+    if any(v is not None for v in marca):
+        faltan = [k for k in CAMPOS_MARCA if s[k] is None]
+        if faltan:
+            raise ValueError(f"Datos de marca incompletos, faltan: {', '.join(faltan)}")
+        if not all(_numero(v) and v > 0 for v in marca):
+            raise ValueError("Los datos de marca deben ser números positivos")
+        if s["cab_w"] < s["mod_w"] or s["cab_h"] < s["mod_h"]:
+            raise ValueError("El módulo no puede ser más grande que el gabinete")
+    parsear_shutter_estricto(s["shutter_speed_str"], s["fps_video"])
+    return s
+
+
+def calculadora_hardware(spec):
+    s = normalizar_spec(spec)
+    return LEDSCREENCALC(s["uso"], s["entorno"], s["contenido"], s["req_w"], s["req_h"], s["dist_vis_m"], s["pitch"],
+                         s["mod_res_w"], s["mod_res_h"], s["mod_w"], s["mod_h"], s["cab_w"], s["cab_h"], brillo=s["brillo"])
+
+
+def calculadora_procesamiento(s, base_raw):
+    return LedScreenProc(s["uso"], base_raw["total_px"], base_raw["total_gabinetes"], s["input_res"], s["puerto"], s["calidad"],
+                         fps_video=s["fps_video"], distancia_cable_m=s["distancia_cable_m"],
+                         refresh_rate_hz=s["refresh_rate_hz"], shutter_speed_str=s["shutter_speed_str"],
+                         res_w=base_raw["res_total_w"], res_h=base_raw["res_total_h"],
+                         fis_w_mm=base_raw["ancho_fisico"], fis_h_mm=base_raw["alto_fisico"], num_entradas=s["num_entradas"])
+
+
+def calculadora_energia(s, base_raw):
+    return LedPowerCalc(base_raw["area_m2"], voltaje=s["voltaje"], entorno=s["entorno"], watts_max_m2=s["watts_max_m2"],
+                        factor_promedio=s["factor_promedio"])
+
+
+def calculadora_izaje(s, base_raw):
+    return LedRiggingCalc(base_raw["columnas"], base_raw["filas"], base_raw["cab_w"], cab_peso_kg=s["cab_peso_kg"])
+
+
+def calculadora_repuestos(s, base_raw):
+    return LedSparesCalc(base_raw["total_modulos"], base_raw["total_gabinetes"], s["porcentaje_repuestos"],
+                         modo=s["modo_repuestos"], disponibilidad=s["disponibilidad_repuestos"],
+                         dias_show=s["dias_show"], horas_dia=s["horas_dia"])
+
+
+def construir_calculadoras(spec):
+    s = normalizar_spec(spec)
+    res_hw = calculadora_hardware(s).generar_opciones()
+    base_raw = res_hw["Opcion 1 (Ideal)"]["raw"]
+    return (s, res_hw, calculadora_procesamiento(s, base_raw), calculadora_energia(s, base_raw),
+            calculadora_izaje(s, base_raw), calculadora_repuestos(s, base_raw))
+
+
+def clave_spec(spec):
+    # Clave hashable de una especificación ya normalizada. Incluye el tipo para
+    # que 60 y 60.0 no compartan entrada (el reporte imprime "@ 60fps" tal cual).
+    return tuple((k, type(v).__name__, v) for k, v in sorted(spec.items()))
+
+
+@functools.lru_cache(maxsize=TAMANO_CACHE)
+def _calcular_cacheado(clave):
+    s, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares = construir_calculadoras({k: v for k, _, v in clave})
+    return ResultadoProyecto.desde_calculadoras(s, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares)
+
+
+def calculate_project(spec):
+    return _calcular_cacheado(clave_spec(normalizar_spec(spec)))
@@ -0,0 +1,257 @@
+# ==========================================
+# PLANIFICADOR DE RECINTO (VARIAS PANTALLAS, PROCESADORES COMPARTIDOS)
+# ==========================================
+# calcular_hardware_procesador dimensiona cada pantalla por separado. En un
+# recinto (pantalla principal, IMAGs, ribbons, piso...) las superficies
+# comparten procesadores, así que aquí se empaquetan todas juntas sobre núcleos
+# de procesamiento respetando, por núcleo:
+#   - capacidad de píxeles (8.800.000 px, igual que la vista por pantalla),
+#   - puertos RJ45 de las tarjetas de salida de 16 puertos,
+#   - enlaces OPT 10G para pantallas a más de 100 m (uno cada 10 puertos),
+#   - ranuras para tarjetas de entrada (Quad-HD, Dual-4K, HDMI 2.1).
+# Una pantalla más grande que un núcleo se reparte en partes iguales y cada
+# parte recibe todas sus señales de entrada.
+#
+# Primero se arma un empaquetado Best-Fit Decreasing (milisegundos para 60
+# pantallas) y, si se pide, una búsqueda exacta por ramificación y poda con
+# tiempo límite que minimiza núcleos y luego tarjetas.
+import math
+import time
+from collections import Counter
+
+from .proyecto import calculate_project, validar_spec
+
+PROCESADOR_ESTANDAR = {
+    "capacidad_px": 8800000,
+    "puertos_por_tarjeta": 16,
+    "tarjetas_salida_max": 4,
+    "puertos_opt_max": 8,
+    "ranuras_entrada": 4,
+}
+PUERTOS_POR_OPT = 10
+
+# Señales por tarjeta de entrada, y tarjeta/unidades que ocupa cada señal
+TARJETAS_ENTRADA = {"Quad-HD": 4, "Dual-4K": 2, "HDMI 2.1": 1}
+SENALES = {"HD": ("Quad-HD", 1), "4K": ("Dual-4K", 1), "8K": ("HDMI 2.1", 1), "16K": ("HDMI 2.1", 4)}
+
+
+def tipo_senal(input_res):
+    for tipo in ("16K", "8K", "4K"):
+        if tipo in input_res:
+            return tipo
+    return "HD"
+
+
+def demanda_pantalla(nombre, spec):
+    s = validar_spec(spec)
+    raw = calculate_project(s).raw
+    v = raw["procesamiento"]
+    tarjeta, unidades = SENALES[tipo_senal(s["input_res"])]
+    return {"nombre": nombre, "total_px": v["total_px"], "puertos": v["puertos_rj45"], "fibra": v["requiere_fibra"],
+            "tarjeta_entrada": tarjeta, "unidades_entrada": unidades * s["num_entradas"],
+            "nucleos_sin_compartir": raw["procesador"]["nucleos"],
+            "tarjetas_salida_sin_compartir": raw["procesador"]["tarjetas_salida"]}
+
+
+def _tarjetas(unidades):
+    return sum(-(-u // TARJETAS_ENTRADA[t]) for t, u in unidades.items())
+
+
+def _piezas(demandas, proc):
+    # Pieza: (índice de pantalla, px, puertos, enlaces OPT, tarjeta de entrada, unidades)
+    puertos_max = proc["tarjetas_salida_max"] * proc["puertos_por_tarjeta"]
+    piezas = []
+    for i, d in enumerate(demandas):
+        tarjeta, unidades = d["tarjeta_entrada"], d["unidades_entrada"]
+        if -(-unidades // TARJETAS_ENTRADA[tarjeta]) > proc["ranuras_entrada"]:
+            raise ValueError(f"{d['nombre']}: sus señales de entrada no entran en un solo núcleo")
+        partes = max(1, math.ceil(d["total_px"] / proc["capacidad_px"]), math.ceil(d["puertos"] / puertos_max))
+        while True:
+            puertos = [d["puertos"] // partes + (j < d["puertos"] % partes) for j in range(partes)]
+            opt = [math.ceil(p / PUERTOS_POR_OPT) if d["fibra"] else 0 for p in puertos]
+            if max(opt) <= proc["puertos_opt_max"]:
+                break
+            partes += 1
+        for j in range(partes):
+            px = d["total_px"] // partes + (j < d["total_px"] % partes)
+            piezas.append((i, px, puertos[j], opt[j], tarjeta, unidades))
+    return piezas
+
+
+class Nucleo:
+    __slots__ = ("px", "puertos", "opt", "unidades", "piezas")
+
+    def __init__(self):
+        self.px = self.puertos = self.opt = 0
+        self.unidades = Counter()
+        self.piezas = []
+
+    def admite(self, pieza, proc):
+        _, px, puertos, opt, tarjeta, unidades = pieza
+        if (self.px + px > proc["capacidad_px"] or self.opt + opt > proc["puertos_opt_max"]
+                or self.puertos + puertos > proc["tarjetas_salida_max"] * proc["puertos_por_tarjeta"]):
+            return False
+        self.unidades[tarjeta] += unidades
+        entra = _tarjetas(self.unidades) <= proc["ranuras_entrada"]
+        self.unidades[tarjeta] -= unidades
+        return entra
+
+    def agregar(self, pieza):
+        self.px += pieza[1]
+        self.puertos += pieza[2]
+        self.opt += pieza[3]
+        self.unidades[pieza[4]] += pieza[5]
+        self.piezas.append(pieza)
+
+    def quitar(self):
+        pieza = self.piezas.pop()
+        self.px -= pieza[1]
+        self.puertos -= pieza[2]
+        self.opt -= pieza[3]
+        self.unidades[pieza[4]] -= pieza[5]
+        return pieza
+
+    def tarjetas_salida(self, proc):
+        return -(-self.puertos // proc["puertos_por_tarjeta"])
+
+    def tarjetas(self, proc):
+        return self.tarjetas_salida(proc) + _tarjetas(self.unidades)
+
+
+def _peso(pieza, proc):
+    _, px, puertos, opt, tarjeta, unidades = pieza
+    return (max(px / proc["capacidad_px"], puertos / (proc["tarjetas_salida_max"] * proc["puertos_por_tarjeta"]),
+                opt / proc["puertos_opt_max"], -(-unidades // TARJETAS_ENTRADA[tarjeta]) / proc["ranuras_entrada"]), px)
+
+
+def _costo(nucleos, proc):
+    return len(nucleos), sum(n.tarjetas(proc) for n in nucleos)
+
+
+def _cotas(piezas, proc):
+    # Cotas inferiores de (núcleos, tarjetas) para todo el recinto
+    px = sum(p[1] for p in piezas)
+    puertos = sum(p[2] for p in piezas)
+    opt = sum(p[3] for p in piezas)
+    unidades = Counter()
+    for p in piezas:
+        unidades[p[4]] += p[5]
+    entrada = _tarjetas(unidades)
+    nucleos = max(1 if piezas else 0, math.ceil(px / proc["capacidad_px"]),
+                  math.ceil(puertos / (proc["tarjetas_salida_max"] * proc["puertos_por_tarjeta"])),
+                  math.ceil(opt / proc["puertos_opt_max"]), math.ceil(entrada / proc["ranuras_entrada"]))
+    return nucleos, -(-puertos // proc["puertos_por_tarjeta"]) + entrada
+
+
+def _best_fit(piezas, proc):
+    nucleos = []
+    for pieza in piezas:
+        candidatos = [n for n in nucleos if n.admite(pieza, proc)]
+        if candidatos:
+            # El más lleno que la admite (menor capacidad de píxeles sobrante)
+            destino = max(candidatos, key=lambda n: n.px)
+        else:
+            destino = Nucleo()
+            nucleos.append(destino)
+        destino.agregar(pieza)
+    return nucleos
+
+
+def _refinar(piezas, proc, inicial, cota, limite_s):
+    # Ramificación y poda sobre el orden decreciente: cada pieza va a un núcleo
+    # abierto o a uno nuevo. Núcleos y tarjetas sólo crecen al agregar piezas,
+    # así que una rama se poda en cuanto iguala el mejor costo conocido.
+    mejor = [_costo(inicial, proc), [list(n.piezas) for n in inicial]]
+    fin = time.perf_counter() + limite_s
+    nucleos = []
+    completo = [True]
+
+    def buscar(k):
+        if mejor[0] == cota:
+            return
+        if time.perf_counter() > fin:
+            completo[0] = False
+            return
+        costo = _costo(nucleos, proc)
+        if costo >= mejor[0] or max(len(nucleos), cota[0]) > mejor[0][0]:
+            return
+        if k == len(piezas):
+            mejor[0] = costo
+            mejor[1] = [list(n.piezas) for n in nucleos]
+            return
+        pieza = piezas[k]
+        vistos = set()
+        for n in nucleos:
+            estado = (n.px, n.puertos, n.opt, tuple(sorted((t, u) for t, u in n.unidades.items() if u)))
+            if estado in vistos or not n.admite(pieza, proc):
+                continue
+            vistos.add(estado)
+            n.agregar(pieza)
+            buscar(k + 1)
+            n.quitar()
+        if len(nucleos) + 1 <= mejor[0][0]:
+            nuevo = Nucleo()
+            nuevo.agregar(pieza)
+            nucleos.append(nuevo)
+            buscar(k + 1)
+            nucleos.pop()
+
+    buscar(0)
+    resultado = []
+    for asignadas in mejor[1]:
+        n = Nucleo()
+        for pieza in asignadas:
+            n.agregar(pieza)
+        resultado.append(n)
+    return resultado, completo[0]
+
+
+def planificar_recinto(pantallas, procesador=None, exacto=False, limite_s=0.25):
+    # pantallas: iterable de especificaciones (como en calculate_project) con
+    # una clave opcional "nombre". Devuelve la factura mínima encontrada y la
+    # asignación de cada parte de pantalla a un núcleo.
+    proc = dict(PROCESADOR_ESTANDAR, **(procesador or {}))
+    demandas = []
+    for i, p in enumerate(pantallas, 1):
+        spec = dict(p)
+        demandas.append(demanda_pantalla(spec.pop("nombre", None) or f"Pantalla {i}", spec))
+
+    piezas = sorted(_piezas(demandas, proc), key=lambda p: _peso(p, proc), reverse=True)
+    cota = _cotas(piezas, proc)
+    nucleos = _best_fit(piezas, proc)
+    optimo = _costo(nucleos, proc) == cota
+    if exacto and not optimo:
+        nucleos, optimo = _refinar(piezas, proc, nucleos, cota, limite_s)
+    nucleos.sort(key=lambda n: (-n.px, n.piezas[0][0]))
+
+    entradas = Counter()
+    for n in nucleos:
+        entradas.update({t: -(-u // TARJETAS_ENTRADA[t]) for t, u in n.unidades.items() if u})
+    factura = {
+        "nucleos": len(nucleos),
+        "tarjetas_salida": sum(n.tarjetas_salida(proc) for n in nucleos),
+        "puertos_rj45": sum(n.puertos for n in nucleos),
+        "puertos_opt": sum(n.opt for n in nucleos),
+        "tarjetas_entrada": dict(sorted(entradas.items())),
+        "capacidad_total_px": len(nucleos) * proc["capacidad_px"],
+    }
+    asignacion = [{
+        "nucleo": k,
+        "px": n.px,
+        "puertos_rj45": n.puertos,
+        "puertos_opt": n.opt,
+        "tarjetas_salida": n.tarjetas_salida(proc),
+        "tarjetas_entrada": {t: -(-u // TARJETAS_ENTRADA[t]) for t, u in sorted(n.unidades.items()) if u},
+        "pantallas": [{"nombre": demandas[i]["nombre"], "px": px, "puertos_rj45": puertos, "puertos_opt": opt}
+                      for i, px, puertos, opt, _, _ in n.piezas],
+    } for k, n in enumerate(nucleos, 1)]
+    return {
+        "factura": factura,
+        "asignacion": asignacion,
+        "pantallas": demandas,
+        "cota_nucleos": cota[0],
+        "cota_tarjetas": cota[1],
+        "optimo": optimo,
+        "sin_compartir": {"nucleos": sum(d["nucleos_sin_compartir"] for d in demandas),
+                          "tarjetas_salida": sum(d["tarjetas_salida_sin_compartir"] for d in demandas)},
+    }
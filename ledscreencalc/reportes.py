@@ -0,0 +1,113 @@
+# ==========================================
+# REPORTES DE EXPORTACIÓN (TXT / CSV)
+# ==========================================
+# Los reportes se arman a partir de las "secciones" ya formateadas de un
+# proyecto (ver resultado.ResultadoProyecto), así cada calcular_* corre una
+# sola vez aunque se generen varios formatos. Las funciones generar_* con
+# calculadoras se mantienen para los scripts existentes.
+import io
+
+from .exportar import EscritorCSV
+from .formato import formato_latam
+
+COLUMNAS_REPORTE = ("Parámetro", "Especificación Técnica")
+
+
+def secciones_desde_calculadoras(res_hw, calc_proc, calc_pwr, calc_rig, calc_spares):
+    opciones = {k: (v["formatted"] if k != "Visualizacion" else v) for k, v in res_hw.items()}
+    return {
+        "opciones": opciones,
+        "procesamiento": calc_proc.calcular_procesamiento(),
+        "procesador": calc_proc.calcular_hardware_procesador(),
+        "energia": calc_pwr.calcular_energia_y_clima(),
+        "izaje": calc_rig.calcular_izaje(),
+        "repuestos": calc_spares.calcular_repuestos(),
+    }
+
+
+def texto_desde_secciones(req_w, req_h, secciones):
+    res_hw = secciones["opciones"]
+    texto = "=" * 70 + "\n"
+    texto += "          REPORTE DE INGENIERIA - SISTEMA LEDSCREENCALC\n"
+    texto += "=" * 70 + "\n\n"
+    texto += f"[A] DISENO DE HARDWARE (MEDIDA SOLICITADA: {formato_latam(req_w/1000, 2)}m x {formato_latam(req_h/1000, 2)}m)\n\n"
+    texto += "  --- OPCION 1: AJUSTE IDEAL ---\n"
+    for k, v in res_hw["Opcion 1 (Ideal)"].items(): texto += f"    > {k}: {v}\n"
+    texto += "\n  --- OPCION 2: AJUSTE INFERIOR ---\n"
+    for k, v in res_hw["Opcion 2 (Inferior)"].items(): texto += f"    > {k}: {v}\n"
+    texto += "\n  --- OPCION 3: AJUSTE SUPERIOR ---\n"
+    for k, v in res_hw["Opcion 3 (Superior)"].items(): texto += f"    > {k}: {v}\n"
+    texto += "\n" + "-" * 50 + "\n[B] CRITERIOS DE VISUALIZACION\n"
+    for k, v in res_hw["Visualizacion"].items(): texto += f"  > {k}: {v}\n"
+    texto += "\n" + "-" * 50 + "\n[C] INGENIERIA DE PROCESAMIENTO Y DATA\n"
+    for k, v in secciones["procesamiento"].items(): texto += f"  > {k}: {v}\n"
+    texto += "\n" + "-" * 50 + "\n[D] HARDWARE DEL PROCESADOR (TOPOLOGIA)\n"
+    for k, v in secciones["procesador"].items(): texto += f"  > {k}: {v}\n"
+    texto += "\n" + "-" * 50 + "\n[E] INGENIERIA ELECTRICA Y CLIMATIZACION (Opcion 1)\n"
+    for k, v in secciones["energia"].items(): texto += f"  > {k}: {v}\n"
+    texto += "\n" + "-" * 50 + "\n[F] INGENIERIA ESTRUCTURAL E IZAJE (Opcion 1)\n"
+    for k, v in secciones["izaje"].items(): texto += f"  > {k}: {v}\n"
+    texto += "\n" + "-" * 50 + "\n[G] REPUESTOS SUGERIDOS (SPARE PARTS)\n"
+    for k, v in secciones["repuestos"].items(): texto += f"  > {k}: {v}\n"
+    texto += "\n" + "=" * 70 + "\nFIN DEL REPORTE TECNICO.\n" + "=" * 70 + "\n"
+    return texto
+
+def datos_tabulares_desde_secciones(req_w, req_h, secciones):
+    res_hw = secciones["opciones"]
+    data = []
+    data.append(["MEDIDA SOLICITADA", f"{formato_latam(req_w/1000, 2)}m (Ancho) x {formato_latam(req_h/1000, 2)}m (Alto)"])
+    data.append(["", ""])
+    
+    opciones = [("OPCIÓN 1: AJUSTE IDEAL", "Opcion 1 (Ideal)"), 
+                ("OPCIÓN 2: AJUSTE INFERIOR", "Opcion 2 (Inferior)"), 
+                ("OPCIÓN 3: AJUSTE SUPERIOR", "Opcion 3 (Superior)")]
+                
+    for titulo, clave in opciones:
+        data.append([f"--- {titulo} ---", ""])
+        for k, v in res_hw[clave].items(): 
+            data.append([k, v])
+        data.append(["", ""])
+
+    data.append(["--- CRITERIOS DE VISUALIZACIÓN ---", ""])
+    for k, v in res_hw["Visualizacion"].items(): data.append([k, v])
+    data.append(["", ""])
+
+    data.append(["--- INGENIERÍA DE PROCESAMIENTO Y DATA ---", ""])
+    for k, v in secciones["procesamiento"].items(): data.append([k, v])
+    data.append(["", ""])
+
+    data.append(["--- HARDWARE DEL PROCESADOR ---", ""])
+    for k, v in secciones["procesador"].items(): data.append([k, v])
+    data.append(["", ""])
+
+    data.append(["--- INGENIERÍA ELÉCTRICA Y CLIMATIZACIÓN ---", ""])
+    for k, v in secciones["energia"].items(): data.append([k, v])
+    data.append(["", ""])
+
+    data.append(["--- INGENIERÍA ESTRUCTURAL E IZAJE ---", ""])
+    for k, v in secciones["izaje"].items(): data.append([k, v])
+    data.append(["", ""])
+
+    data.append(["--- REPUESTOS SUGERIDOS ---", ""])
+    for k, v in secciones["repuestos"].items(): data.append([k, v])
+    
+    return data
+
+def csv_desde_datos(data):
+    # Mismo texto que producía pandas (DataFrame.to_csv con sep=";"), sin armar un DataFrame
+    salida = io.StringIO()
+    with EscritorCSV(salida, COLUMNAS_REPORTE, separador=";") as escritor:
+        escritor.escribir_filas(data)
+    return salida.getvalue()
+
+
+def generar_texto_reporte(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares):
+    secciones = secciones_desde_calculadoras(res_hw, calc_proc, calc_pwr, calc_rig, calc_spares)
+    return texto_desde_secciones(req_w, req_h, secciones)
+
+def recopilar_datos_tabulares(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares):
+    secciones = secciones_desde_calculadoras(res_hw, calc_proc, calc_pwr, calc_rig, calc_spares)
+    return datos_tabulares_desde_secciones(req_w, req_h, secciones)
+
+def generar_csv_reporte(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares):
+    return csv_desde_datos(recopilar_datos_tabulares(req_w, req_h, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares))
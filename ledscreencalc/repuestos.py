@@ -0,0 +1,185 @@
+# ==========================================
+# REPUESTOS POR CONFIABILIDAD (SHOW Y TEMPORADA DE FLOTA)
+# ==========================================
+# LedSparesCalc aplica un porcentaje fijo a módulos, receptoras y fuentes. Aquí
+# los repuestos salen de la tasa de falla de cada componente:
+#   - Un show: las fallas de n piezas durante H horas de operación son
+#     Poisson(n * H / MTBF + n * daño por montaje). Se busca el kit de menor
+#     costo cuya probabilidad de terminar el show sin quedarse sin repuestos
+#     (todos los componentes a la vez) alcanza la disponibilidad objetivo.
+#   - Una temporada: los shows que se superponen en el tiempo comparten un
+#     pool de repuestos; cada pieza fallada vuelve al pool tras reparacion_dias.
+#     Se simulan temporadas completas con Monte Carlo vectorizado (una matriz
+#     simulaciones x días por componente) y se elige el pool de menor costo
+#     con el que la fracción de shows sin faltantes alcanza el objetivo.
+# En ambos casos el kit se arma por análisis marginal: se agrega de a un
+# repuesto al componente que más disponibilidad suma por dólar.
+import datetime
+
+import numpy as np
+
+# MTBF (h), probabilidad de daño por pieza en cada montaje y costo unitario (USD)
+COMPONENTES = {
+    "modulos": {"nombre": "Módulos LED", "mtbf_h": 100000.0, "danio_montaje": 0.0005, "costo_usd": 120.0},
+    "rcards": {"nombre": "Tarjetas Receptoras (R-Cards)", "mtbf_h": 200000.0, "danio_montaje": 0.0002, "costo_usd": 80.0},
+    "psu": {"nombre": "Fuentes de Poder (PSU)", "mtbf_h": 150000.0, "danio_montaje": 0.0002, "costo_usd": 45.0},
+}
+
+
+def _componentes(componentes):
+    return {c: dict(COMPONENTES.get(c, {}), **v) for c, v in (componentes or COMPONENTES).items()}
+
+
+def fallas_esperadas(cantidad, horas, componente, montajes=1):
+    return cantidad * (horas / componente["mtbf_h"] + montajes * componente["danio_montaje"])
+
+
+def poisson_cdf(lam, k_max):
+    # P(X <= k) para k = 0..k_max
+    k = np.arange(k_max + 1)
+    if lam <= 0:
+        return np.ones(k_max + 1)
+    log_fact = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, k_max + 1)))))
+    return np.minimum(np.cumsum(np.exp(k * np.log(lam) - lam - log_fact)), 1.0)
+
+
+def _marginal(prob, costos, objetivo, maximos):
+    # prob(s): probabilidad conjunta con el kit s (dict componente -> cantidad).
+    # Agrega un repuesto por vez al componente con mayor ganancia por dólar.
+    s = dict.fromkeys(costos, 0)
+    actual = prob(s)
+    while actual < objetivo:
+        mejor = None
+        for c in costos:
+            if s[c] >= maximos[c]:
+                continue
+            s[c] += 1
+            p = prob(s)
+            s[c] -= 1
+            ganancia = (p - actual) / costos[c]
+            if mejor is None or ganancia > mejor[0]:
+                mejor = (ganancia, c, p)
+        if mejor is None:
+            break
+        s[mejor[1]] += 1
+        actual = mejor[2]
+    return s, actual
+
+
+def kit_show(cantidades, dias, horas_dia=12.0, disponibilidad=0.95, componentes=None):
+    # cantidades: piezas instaladas por componente, p. ej. {"modulos": 1200, "rcards": 300, "psu": 300}
+    comp = _componentes(componentes)
+    cantidades = {c: n for c, n in cantidades.items() if c in comp}
+    lam = {c: fallas_esperadas(n, dias * horas_dia, comp[c]) for c, n in cantidades.items()}
+    maximos = {c: int(l + 12 * l ** 0.5 + 20) for c, l in lam.items()}
+    cdf = {c: poisson_cdf(lam[c], maximos[c]) for c in lam}
+    s, p = _marginal(lambda s: float(np.prod([cdf[c][s[c]] for c in s])),
+                     {c: comp[c]["costo_usd"] for c in lam}, disponibilidad, maximos)
+    return {
+        "repuestos": s,
+        "fallas_esperadas": lam,
+        "disponibilidad": p,
+        "capital_usd": sum(s[c] * comp[c]["costo_usd"] for c in s),
+    }
+
+
+def _dia(valor):
+    if isinstance(valor, str):
+        valor = datetime.date.fromisoformat(valor)
+    if isinstance(valor, datetime.date):
+        return valor.toordinal()
+    return int(valor)
+
+
+def _fallas_por_dia(shows, inicio, largo, horas_dia, componente, clave):
+    # Tasa de fallas de la flota por día: operación de los shows activos más
+    # el daño de montaje en el primer día de cada show
+    lam = np.zeros(largo)
+    for sh in shows:
+        n = sh.get(clave) or 0
+        a = sh["_ini"] - inicio
+        lam[a:a + sh["dias"]] += n * horas_dia / componente["mtbf_h"]
+        lam[a] += n * componente["danio_montaje"]
+    return lam
+
+
+def temporada_repuestos(shows, disponibilidad=0.95, simulaciones=10000, reparacion_dias=14, horas_dia=12.0,
+                        componentes=None, semilla=0, bloque=2048):
+    # shows: iterable de dicts con "inicio" (fecha ISO, date o número de día),
+    # "dias", cantidades por componente ("modulos", "rcards", "psu") y
+    # "nombre" opcional. disponibilidad: fracción de shows que deben terminar
+    # sin faltantes. Devuelve el pool compartido y, para comparar, el stock
+    # que hace falta si cada show viaja con su propio kit (kit_show).
+    comp = _componentes(componentes)
+    if reparacion_dias < 1:
+        raise ValueError("reparacion_dias debe ser >= 1")
+    shows = [dict(sh, _ini=_dia(sh["inicio"]), dias=int(sh["dias"])) for sh in shows]
+    if not shows:
+        raise ValueError("La temporada no tiene shows")
+    if min(sh["dias"] for sh in shows) < 1:
+        raise ValueError("Cada show debe durar al menos 1 día")
+    inicio = min(sh["_ini"] for sh in shows)
+    largo = max(sh["_ini"] + sh["dias"] for sh in shows) - inicio
+    ini = np.array([sh["_ini"] - inicio for sh in shows])
+    fin = ini + np.array([sh["dias"] for sh in shows])
+    azar = np.random.default_rng(semilla)
+
+    # Para cada componente y simulación, máximo de piezas fuera de servicio
+    # (falladas y aún en reparación) durante cada show
+    maximo = {}
+    for c, datos in comp.items():
+        lam = _fallas_por_dia(shows, inicio, largo, horas_dia, datos, c)
+        m = np.empty((simulaciones, len(shows)), dtype=np.int32)
+        for a in range(0, simulaciones, bloque):
+            b = min(a + bloque, simulaciones)
+            acum = np.cumsum(azar.poisson(lam, size=(b - a, largo)), axis=1, dtype=np.int32)
+            fuera = acum.copy()
+            if reparacion_dias < largo:
+                fuera[:, reparacion_dias:] -= acum[:, :-reparacion_dias]
+            for j in range(len(shows)):
+                m[a:b, j] = fuera[:, ini[j]:fin[j]].max(axis=1)
+        maximo[c] = m
+
+    def prob(s):
+        ok = np.ones((simulaciones, len(shows)), dtype=bool)
+        for c in s:
+            ok &= maximo[c] <= s[c]
+        return float(ok.mean())
+
+    s, p = _marginal(prob, {c: comp[c]["costo_usd"] for c in comp}, disponibilidad,
+                     {c: int(maximo[c].max()) for c in comp})
+
+    # Sin compartir: cada show lleva su kit, que se reutiliza apenas el show
+    # termina (supuesto favorable al kit propio: ignora la reparación)
+    kits = [kit_show({c: sh.get(c) or 0 for c in comp}, sh["dias"], horas_dia, disponibilidad, componentes)
+            for sh in shows]
+    en_uso = {c: np.zeros(largo) for c in comp}
+    for j, k in enumerate(kits):
+        for c in comp:
+            en_uso[c][ini[j]:fin[j]] += k["repuestos"][c]
+    sin_compartir = {c: int(en_uso[c].max()) for c in comp}
+    capital = sum(s[c] * comp[c]["costo_usd"] for c in comp)
+    capital_sin = sum(sin_compartir[c] * comp[c]["costo_usd"] for c in comp)
+
+    activos = np.zeros(largo, dtype=np.int64)
+    for a, b in zip(ini, fin):
+        activos[a:b] += 1
+    return {
+        "repuestos": s,
+        "disponibilidad": p,
+        "capital_usd": capital,
+        "sin_compartir": sin_compartir,
+        "capital_sin_compartir_usd": capital_sin,
+        "ahorro_usd": capital_sin - capital,
+        "shows": len(shows),
+        "concurrencia_max": int(activos.max()),
+        "simulaciones": simulaciones,
+        "show_dias_simulados": simulaciones * int(activos.sum()),
+        "por_show": [{
+            "nombre": sh.get("nombre") or f"Show {j + 1}",
+            "inicio": sh["inicio"],
+            "dias": sh["dias"],
+            "kit_propio": kits[j]["repuestos"],
+            "disponibilidad": float(np.all([maximo[c][:, j] <= s[c] for c in comp], axis=0).mean()),
+        } for j, sh in enumerate(shows)],
+    }
@@ -0,0 +1,98 @@
+# ==========================================
+# RESULTADO INMUTABLE DE UN PROYECTO
+# ==========================================
+# Cada calcular_* corre una sola vez por juego de entradas. Los números crudos
+# (raw) quedan separados de los textos con formato_latam (formatted) y los
+# reportes TXT/CSV/XLSX/JSON se arman recién cuando alguien los pide.
+import json
+from types import MappingProxyType
+
+from .exportar import exportar_bytes
+from .reportes import COLUMNAS_REPORTE, csv_desde_datos, datos_tabulares_desde_secciones, texto_desde_secciones
+
+
+# Prefijos de columna para las tres opciones de layout en la vista plana
+PREFIJOS_OPCIONES = {"Opcion 1 (Ideal)": "ideal", "Opcion 2 (Inferior)": "inferior", "Opcion 3 (Superior)": "superior"}
+
+
+def _congelar(valor):
+    if isinstance(valor, dict):
+        return MappingProxyType({k: _congelar(v) for k, v in valor.items()})
+    return valor
+
+
+class ResultadoProyecto:
+    __slots__ = ("spec", "raw", "formatted", "_txt", "_csv")
+
+    def __init__(self, spec, raw, formatted):
+        object.__setattr__(self, "spec", _congelar(dict(spec)))
+        object.__setattr__(self, "raw", _congelar(raw))
+        object.__setattr__(self, "formatted", _congelar(formatted))
+        object.__setattr__(self, "_txt", None)
+        object.__setattr__(self, "_csv", None)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError(f"{type(self).__name__} es inmutable")
+
+    def __delattr__(self, nombre):
+        raise AttributeError(f"{type(self).__name__} es inmutable")
+
+    def __repr__(self):
+        return f"{type(self).__name__}(req_w={self.spec['req_w']!r}, req_h={self.spec['req_h']!r}, pitch={self.spec['pitch']!r})"
+
+    @classmethod
+    def desde_secciones(cls, spec, res_hw, raw, formatted):
+        # raw / formatted: secciones procesamiento, procesador, energia, izaje y repuestos
+        raw = dict(raw, opciones={k: v["raw"] for k, v in res_hw.items() if k != "Visualizacion"})
+        formatted = dict(formatted, opciones={k: (v["formatted"] if k != "Visualizacion" else v) for k, v in res_hw.items()})
+        return cls(spec, raw, formatted)
+
+    @classmethod
+    def desde_calculadoras(cls, spec, res_hw, calc_proc, calc_pwr, calc_rig, calc_spares):
+        raw = {
+            "procesamiento": calc_proc.valores_procesamiento(),
+            "procesador": calc_proc.valores_hardware_procesador(),
+            "energia": calc_pwr.valores_energia_y_clima(),
+            "izaje": calc_rig.valores_izaje(),
+            "repuestos": calc_spares.valores_repuestos(),
+        }
+        formatted = {
+            "procesamiento": calc_proc.calcular_procesamiento(raw["procesamiento"]),
+            "procesador": calc_proc.calcular_hardware_procesador(raw["procesador"]),
+            "energia": calc_pwr.calcular_energia_y_clima(raw["energia"]),
+            "izaje": calc_rig.calcular_izaje(raw["izaje"]),
+            "repuestos": calc_spares.calcular_repuestos(raw["repuestos"]),
+        }
+        return cls.desde_secciones(spec, res_hw, raw, formatted)
+
+    def plano(self):
+        # Números crudos en una sola fila: "seccion.campo" -> valor
+        fila = {}
+        for opcion, prefijo in PREFIJOS_OPCIONES.items():
+            for k, v in self.raw["opciones"][opcion].items():
+                fila[f"{prefijo}.{k}"] = v
+        for seccion in ("procesamiento", "procesador", "energia", "izaje", "repuestos"):
+            for k, v in self.raw[seccion].items():
+                fila[f"{seccion}.{k}"] = v
+        return fila
+
+    def datos_tabulares(self):
+        return datos_tabulares_desde_secciones(self.spec["req_w"], self.spec["req_h"], self.formatted)
+
+    def reporte_txt(self):
+        if self._txt is None:
+            object.__setattr__(self, "_txt", texto_desde_secciones(self.spec["req_w"], self.spec["req_h"], self.formatted))
+        return self._txt
+
+    def reporte_csv(self):
+        if self._csv is None:
+            object.__setattr__(self, "_csv", csv_desde_datos(self.datos_tabulares()))
+        return self._csv
+
+    def reporte_xlsx(self):
+        # Mismas filas que el CSV en una hoja de Excel; se arma cada vez que se pide (descarga)
+        return exportar_bytes(self.datos_tabulares(), COLUMNAS_REPORTE, "xlsx", hoja="Reporte")
+
+    def reporte_json(self):
+        # Especificación y números crudos por sección
+        return json.dumps({"spec": self.spec, "raw": self.raw}, ensure_ascii=False, indent=2, default=dict)
@@ -0,0 +1,195 @@
+# ==========================================
+# SERVICIO JSON LOCAL (HTTP + asyncio)
+# ==========================================
+# Expone los cálculos a herramientas que sólo hablan HTTP (ERP, cotizador)
+# sin pasar por Streamlit. Sólo biblioteca estándar: asyncio.start_server y un
+# parser HTTP/1.1 mínimo con keep-alive.
+#
+#   GET  /salud                        estado y estadísticas de la caché
+#   GET  /v1/campos                    campos de la especificación y sus valores por defecto
+#   POST /v1/<seccion>                 una especificación (objeto JSON)
+#   POST /v1/lote/<seccion>            arreglo de especificaciones; el error de
+#                                      una no corta el resto
+# secciones: proyecto, layout, procesamiento, energia, izaje, repuestos.
+#
+# Cada respuesta por especificación se guarda ya serializada en una caché LRU
+# acotada, con clave (sección, especificación normalizada): dos pedidos que
+# sólo difieren en el orden de los campos o en valores por defecto explícitos
+# comparten la entrada. Los cálculos son de milisegundos, así que corren en el
+# mismo bucle de eventos; la concurrencia viene de atender muchas conexiones
+# a la vez.
+import asyncio
+import json
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+from .proyecto import SPEC_DEFAULTS, calculate_project, clave_spec, validar_spec
+
+ESTADOS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def _seccion(nombre):
+    return lambda r: {"valores": r.raw[nombre], "formato": r.formatted[nombre]}
+
+
+SECCIONES = {
+    "proyecto": lambda r: {"spec": r.spec, "valores": r.raw, "formato": r.formatted},
+    "layout": lambda r: {"valores": r.raw["opciones"], "formato": r.formatted["opciones"]},
+    "procesamiento": lambda r: {"valores": dict(r.raw["procesamiento"], procesador=r.raw["procesador"]),
+                                "formato": dict(r.formatted["procesamiento"], **r.formatted["procesador"])},
+    "energia": _seccion("energia"),
+    "izaje": _seccion("izaje"),
+    "repuestos": _seccion("repuestos"),
+}
+
+
+def _json(datos):
+    # MappingProxyType (ResultadoProyecto) se serializa como dict. NaN/Infinity
+    # no son JSON válido para los clientes: allow_nan=False levanta ValueError
+    return json.dumps(datos, ensure_ascii=False, separators=(",", ":"), default=dict, allow_nan=False).encode("utf-8")
+
+
+def _constante(nombre):
+    # json.loads acepta NaN, Infinity y -Infinity por defecto
+    raise ValueError(f"{nombre} no es un número JSON válido")
+
+
+class ServicioCalculo:
+    __slots__ = ("tamano_cache", "max_cuerpo", "max_lote", "_cache", "aciertos", "fallos", "pedidos")
+
+    def __init__(self, tamano_cache=4096, max_cuerpo=1 << 20, max_lote=1000):
+        self.tamano_cache = tamano_cache
+        self.max_cuerpo = max_cuerpo
+        self.max_lote = max_lote
+        self._cache = OrderedDict()
+        self.aciertos = self.fallos = self.pedidos = 0
+
+    def calcular(self, seccion, spec):
+        # JSON (bytes) de una sección para una especificación; ValueError o
+        # TypeError (p. ej. un valor no comparable) si es inválida
+        if not isinstance(spec, dict):
+            raise ValueError("La especificación debe ser un objeto JSON")
+        s = validar_spec(spec)
+        clave = (seccion, clave_spec(s))
+        cuerpo = self._cache.get(clave)
+        if cuerpo is not None:
+            self._cache.move_to_end(clave)
+            self.aciertos += 1
+            return cuerpo
+        self.fallos += 1
+        try:
+            resultado = calculate_project(s)
+        except ArithmeticError as e:
+            # Valores finitos pero extremos (fps_video=1e30, req_w=1e300) que desbordan el cálculo
+            raise ValueError(f"Valores fuera de rango para el cálculo ({type(e).__name__}: {e})") from None
+        cuerpo = _json(SECCIONES[seccion](resultado))
+        self._cache[clave] = cuerpo
+        if len(self._cache) > self.tamano_cache:
+            self._cache.popitem(last=False)
+        return cuerpo
+
+    def estadisticas(self):
+        return {"pedidos": self.pedidos, "cache_entradas": len(self._cache), "cache_max": self.tamano_cache,
+                "cache_aciertos": self.aciertos, "cache_fallos": self.fallos}
+
+    def responder(self, metodo, ruta, cuerpo):
+        # (estado, JSON en bytes) para un pedido ya leído
+        self.pedidos += 1
+        partes = [p for p in urlsplit(ruta).path.split("/") if p]
+        if partes == ["salud"]:
+            return 200, _json(dict(self.estadisticas(), estado="ok"))
+        if partes == ["v1", "campos"]:
+            return 200, _json(SPEC_DEFAULTS)
+        lote = len(partes) == 3 and partes[:2] == ["v1", "lote"]
+        if not (lote or (len(partes) == 2 and partes[0] == "v1")) or partes[-1] not in SECCIONES:
+            return 404, _json({"error": f"Ruta desconocida: {ruta}", "secciones": list(SECCIONES)})
+        if metodo != "POST":
+            return 405, _json({"error": "Use POST con un cuerpo JSON"})
+        try:
+            datos = json.loads(cuerpo or b"{}", parse_constant=_constante)
+        except (ValueError, UnicodeDecodeError) as e:
+            return 400, _json({"error": f"JSON inválido: {e}"})
+        seccion = partes[-1]
+        if not lote:
+            try:
+                return 200, self.calcular(seccion, datos)
+            except (ValueError, TypeError) as e:
+                return 400, _json({"error": str(e)})
+        if not isinstance(datos, list):
+            return 400, _json({"error": "El lote debe ser un arreglo JSON de especificaciones"})
+        if len(datos) > self.max_lote:
+            return 413, _json({"error": f"El lote supera {self.max_lote} especificaciones"})
+        items = []
+        for spec in datos:
+            try:
+                items.append(self.calcular(seccion, spec))
+            except (ValueError, TypeError) as e:
+                items.append(_json({"error": str(e)}))
+        return 200, b"[" + b",".join(items) + b"]"
+
+    async def atender(self, lector, escritor):
+        try:
+            while True:
+                try:
+                    cabecera = await lector.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                lineas = cabecera.decode("latin-1").split("\r\n")
+                try:
+                    metodo, ruta, version = lineas[0].split(" ")
+                except ValueError:
+                    return
+                campos = {}
+                for linea in lineas[1:]:
+                    nombre, _, valor = linea.partition(":")
+                    campos[nombre.strip().lower()] = valor.strip()
+                conexion = campos.get("connection", "").lower()
+                seguir = conexion != "close" if version == "HTTP/1.1" else conexion == "keep-alive"
+                try:
+                    largo = int(campos.get("content-length") or 0)
+                except ValueError:
+                    largo = -1
+                if largo < 0:
+                    # Sin un largo válido no se sabe dónde termina el cuerpo: se responde y se cierra
+                    estado, cuerpo = 400, _json({"error": "Content-Length inválido"})
+                    seguir = False
+                elif largo > self.max_cuerpo:
+                    estado, cuerpo = 413, _json({"error": f"Cuerpo mayor a {self.max_cuerpo} bytes"})
+                    seguir = False
+                else:
+                    datos = await lector.readexactly(largo) if largo else b""
+                    try:
+                        estado, cuerpo = self.responder(metodo, ruta, datos)
+                    except Exception as e:
+                        estado, cuerpo = 500, _json({"error": f"{type(e).__name__}: {e}"})
+                escritor.write(b"HTTP/1.1 %d %s\r\nContent-Type: application/json; charset=utf-8\r\n"
+                               b"Content-Length: %d\r\nConnection: %s\r\n\r\n"
+                               % (estado, ESTADOS[estado].encode(), len(cuerpo), b"keep-alive" if seguir else b"close"))
+                escritor.write(cuerpo)
+                await escritor.drain()
+                if not seguir:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            escritor.close()
+
+    async def iniciar(self, host="127.0.0.1", puerto=8765):
+        return await asyncio.start_server(self.atender, host, puerto, limit=64 * 1024)
+
+
+def servir(host="127.0.0.1", puerto=8765, **kw):
+    servicio = ServicioCalculo(**kw)
+
+    async def principal():
+        servidor = await servicio.iniciar(host, puerto)
+        direcciones = ", ".join(f"http://{s.getsockname()[0]}:{s.getsockname()[1]}" for s in servidor.sockets)
+        print(f"Servicio de cálculo escuchando en {direcciones}", flush=True)
+        async with servidor:
+            await servidor.serve_forever()
+
+    try:
+        asyncio.run(principal())
+    except KeyboardInterrupt:
+        pass